@@ -3,7 +3,99 @@
 import gorilla
 from maya import OpenMaya
 
+import bana._array
 import bana._iterator
+import bana._key
+import bana._pattern
+import bana.index
+
+
+def _getDagPath(path):
+    selection = OpenMaya.MSelectionList()
+    try:
+        selection.add(path)
+    except RuntimeError:
+        return None
+
+    dagPath = OpenMaya.MDagPath()
+    selection.getDagPath(0, dagPath)
+    return dagPath
+
+
+def _makeBatches(dagPaths, batchSize):
+    for i in range(0, len(dagPaths), batchSize):
+        batch = OpenMaya.MDagPathArray()
+        for dagPath in dagPaths[i:i + batchSize]:
+            batch.append(dagPath)
+
+        yield batch
+
+
+def _makeMatchFunction(pattern, traverseUnderWorld, length=0):
+    if traverseUnderWorld:
+        matchPath = OpenMaya.MGlobal.bnMakeMatchFullPathFunction(
+            pattern, matchRelative=length > 0)
+    else:
+        matchPath = OpenMaya.MGlobal.bnMakeMatchPathFunction(pattern)
+
+    leaf = bana._pattern.extractLeaf(pattern)
+    if not leaf:
+        def match(path):
+            return matchPath(path[length:])
+
+        return match
+
+    # Check the name of the node before matching the whole path.
+    matchName = bana._pattern.makeMatchFunction(
+        leaf, bana._pattern.CONTEXT_FULL_NAME)
+
+    def match(path):
+        return (matchName(path[path.rfind('|') + 1:])
+                and matchPath(path[length:]))
+
+    return match
+
+
+def _getTraversal(pattern, recursive, traverseUnderWorld, maxDepth):
+    if pattern is None:
+        return {'skipRoot': True, 'maxDepth': maxDepth}, None
+
+    match = _makeMatchFunction(pattern, traverseUnderWorld)
+
+    # Start the traversal from the deepest node that is literally defined by
+    # the pattern rather than from the world.
+    root = None
+    rootDepth = 0
+    rootPath = bana._pattern.extractRoot(pattern) if recursive else ''
+    if rootPath:
+        root = _getDagPath(rootPath)
+        if root is None:
+            return None
+
+        rootDepth = rootPath.count('|')
+        if maxDepth is not None:
+            if maxDepth < rootDepth:
+                return None
+
+            maxDepth -= rootDepth
+
+    # Skip the branches that cannot contain any path matching the pattern
+    # instead of filtering out each of their nodes.
+    pruneDepth, prefixMatch = bana._pattern.makePrefixMatchFunction(pattern)
+    if prefixMatch is None:
+        prune = None
+    else:
+        def prune(path):
+            return not prefixMatch(path)
+
+    kwargs = {
+        'root': root,
+        'skipRoot': root is None,
+        'prune': prune,
+        'pruneDepth': max(0, pruneDepth - rootDepth),
+        'maxDepth': maxDepth,
+    }
+    return kwargs, match
 
 
 @gorilla.patches(OpenMaya.MDagPath)
@@ -12,7 +104,8 @@ class MDagPath(object):
 
     @classmethod
     def bnFind(cls, pattern=None, fnType=OpenMaya.MFn.kInvalid, recursive=True,
-               traverseUnderWorld=True, copy=True):
+               traverseUnderWorld=True, copy=True, maxDepth=None,
+               order=OpenMaya.MItDag.kDepthFirst):
         """DAG path iterator.
 
         Categories: :term:`foundation`.
@@ -32,6 +125,13 @@ class MDagPath(object):
             ``True`` to copy each DAG path. It is useful when data persistence
             is required, such as when the DAG paths are to be stored into a
             list, otherwise it is faster to set it to ``False``.
+        maxDepth : int
+            Maximum depth of the DAG paths to match, relative to the world.
+            The traversal does not descend any further. ``None`` for no limit.
+        order : maya.OpenMaya.MItDag.TraversalType
+            Order of the traversal, either
+            ``maya.OpenMaya.MItDag.kDepthFirst`` or
+            ``maya.OpenMaya.MItDag.kBreadthFirst``.
 
         Yields
         ------
@@ -48,23 +148,109 @@ class MDagPath(object):
         --------
         :ref:`pattern_matching`, :ref:`retrieving_nodes`.
         """
-        iterator = bana._iterator.dag(fnType=fnType, skipRoot=True,
-                                      recursive=recursive,
-                                      traverseUnderWorld=traverseUnderWorld)
-        if pattern is not None:
-            if traverseUnderWorld:
-                match = OpenMaya.MGlobal.bnMakeMatchFullPathFunction(pattern)
-            else:
-                match = OpenMaya.MGlobal.bnMakeMatchPathFunction(pattern)
-
-            iterator = (dagPath for dagPath in iterator
-                        if match(dagPath.fullPathName()))
+        if bana.index.isEnabled():
+            return iter(bana.index.findDagPaths(
+                pattern=pattern, fnType=fnType, recursive=recursive,
+                traverseUnderWorld=traverseUnderWorld, maxDepth=maxDepth,
+                order=order))
+
+        traversal = _getTraversal(pattern, recursive, traverseUnderWorld,
+                                  maxDepth)
+        if traversal is None:
+            return iter(())
+
+        kwargs, match = traversal
+        if match is None:
+            iterator = bana._iterator.dag(
+                fnType=fnType, recursive=recursive,
+                traverseUnderWorld=traverseUnderWorld, order=order, **kwargs)
+        else:
+            iterator = bana._iterator.dag(
+                fnType=fnType, recursive=recursive,
+                traverseUnderWorld=traverseUnderWorld, order=order,
+                fullPathNames=True, **kwargs)
+            iterator = (dagPath for dagPath, path in iterator if match(path))
 
         if copy:
             iterator = (OpenMaya.MDagPath(dagPath) for dagPath in iterator)
 
         return iterator
 
+    @classmethod
+    def bnFindBatched(cls, pattern=None, fnType=OpenMaya.MFn.kInvalid,
+                      recursive=True, traverseUnderWorld=True, batchSize=1000,
+                      maxDepth=None, order=OpenMaya.MItDag.kDepthFirst):
+        """DAG path iterator yielding the paths found in batches.
+
+        It traverses the scene like :meth:`MDagPath.bnFind` but fills arrays
+        of DAG paths within a single loop instead of resuming a generator for
+        each path, which is faster when the paths are to be processed in bulk.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        pattern : str
+            Path or full path pattern of the DAG paths to match. Wildcards are
+            allowed.
+        fnType : maya.OpenMaya.MFn.Type
+            Function set type to match.
+        recursive : bool
+            ``True`` to search recursively.
+        traverseUnderWorld : bool
+            ``True`` to search within the underworld.
+        batchSize : int
+            Maximum number of DAG paths in each batch.
+        maxDepth : int
+            Maximum depth of the DAG paths to match, relative to the world.
+            The traversal does not descend any further. ``None`` for no limit.
+        order : maya.OpenMaya.MItDag.TraversalType
+            Order of the traversal, either
+            ``maya.OpenMaya.MItDag.kDepthFirst`` or
+            ``maya.OpenMaya.MItDag.kBreadthFirst``.
+
+        Yields
+        ------
+        maya.OpenMaya.MDagPathArray
+            The paths found, holding at most ``batchSize`` elements each.
+
+        Raises
+        ------
+        ValueError
+            The batch size is not a positive number.
+
+        Note
+        ----
+        The pattern matching's global context is set to *full path* if the
+        parameter ``traverseUnderWorld`` is ``True``, and to *path* otherwise.
+        See :ref:`pm_matching_rules`.
+
+        See Also
+        --------
+        :ref:`pattern_matching`, :ref:`retrieving_nodes`.
+        """
+        if batchSize < 1:
+            raise ValueError("The batch size needs to be a positive number.")
+
+        if bana.index.isEnabled():
+            return _makeBatches(
+                bana.index.findDagPaths(
+                    pattern=pattern, fnType=fnType, recursive=recursive,
+                    traverseUnderWorld=traverseUnderWorld, maxDepth=maxDepth,
+                    order=order),
+                batchSize)
+
+        traversal = _getTraversal(pattern, recursive, traverseUnderWorld,
+                                  maxDepth)
+        if traversal is None:
+            return iter(())
+
+        kwargs, match = traversal
+        return bana._iterator.dagBatches(
+            batchSize, fnType=fnType, recursive=recursive,
+            traverseUnderWorld=traverseUnderWorld, order=order, match=match,
+            **kwargs)
+
     @classmethod
     def bnGet(cls, pattern=None, fnType=OpenMaya.MFn.kInvalid, recursive=True,
               traverseUnderWorld=True):
@@ -106,6 +292,49 @@ class MDagPath(object):
         dagPath = next(iterator, None)
         return dagPath if next(iterator, None) is None else None
 
+    @classmethod
+    def bnGetWorldMatrices(cls, dagPaths, out=None):
+        """Retrieve the world matrices of many DAG paths as a NumPy array.
+
+        The values of each world matrix are copied at once into the array,
+        which can be preallocated and reused across calls, for example to
+        export the transforms at each frame.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        dagPaths : sequence of maya.OpenMaya.MDagPath
+            DAG paths to retrieve the world matrix of.
+        out : numpy.ndarray
+            Array of shape N x 4 x 4 and of type ``float64`` to fill, where N
+            is the number of DAG paths. ``None`` to create a new array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The three-dimensional N x 4 x 4 array of world matrices, in the
+            same order as the DAG paths.
+
+        Raises
+        ------
+        ValueError
+            The output array is not valid.
+        """
+        count = len(dagPaths)
+        if out is None:
+            out = bana._array.empty((count, 4, 4))
+        elif (out.shape != (count, 4, 4) or out.dtype.char != 'd'
+              or not out.flags.c_contiguous):
+            raise ValueError("The output array is not valid.")
+
+        read = bana._array.read
+        for i, dagPath in enumerate(dagPaths):
+            matrix = dagPath.inclusiveMatrix()
+            read(int(matrix[0]), (4, 4), out=out[i])
+
+        return out
+
     @gorilla.filter(True)
     @gorilla.settings(allow_hit=True)
     def __hash__(self):
@@ -116,6 +345,9 @@ class MDagPath(object):
         ``MDagPath`` object not usable with hash-based containers such as
         dictionaries and sets.
 
+        The instance number is combined with the hash code of the DAG node so
+        that the different instances of a same DAG node don't collide.
+
         Categories: :term:`fix`.
 
         Returns
@@ -123,7 +355,8 @@ class MDagPath(object):
         int
             The hash value representing this object.
         """
-        return OpenMaya.MObjectHandle(self.node()).hashCode()
+        return hash((OpenMaya.MObjectHandle(self.node()).hashCode(),
+                     self.instanceNumber()))
 
     @gorilla.filter(True)
     @gorilla.settings(allow_hit=True)
@@ -144,7 +377,8 @@ class MDagPath(object):
         return self.fullPathName()
 
     def bnFindChildren(self, pattern=None, fnType=OpenMaya.MFn.kInvalid,
-                       recursive=True, traverseUnderWorld=True, copy=True):
+                       recursive=True, traverseUnderWorld=True, copy=True,
+                       maxDepth=None, order=OpenMaya.MItDag.kDepthFirst):
         """DAG path iterator over the children.
 
         Categories: :term:`foundation`.
@@ -164,6 +398,14 @@ class MDagPath(object):
             ``True`` to copy each DAG path. It is useful when data persistence
             is required, such as when the DAG paths are to be stored into a
             list, otherwise it is faster to set it to ``False``.
+        maxDepth : int
+            Maximum depth of the DAG paths to match, relative to the current
+            DAG path. The traversal does not descend any further. ``None`` for
+            no limit.
+        order : maya.OpenMaya.MItDag.TraversalType
+            Order of the traversal, either
+            ``maya.OpenMaya.MItDag.kDepthFirst`` or
+            ``maya.OpenMaya.MItDag.kBreadthFirst``.
 
         Yields
         ------
@@ -180,19 +422,32 @@ class MDagPath(object):
         --------
         :ref:`pattern_matching`, :ref:`retrieving_nodes`.
         """
-        iterator = bana._iterator.dag(fnType=fnType, root=self, skipRoot=True,
-                                      recursive=recursive,
-                                      traverseUnderWorld=traverseUnderWorld)
-        if pattern is not None:
+        if pattern is None:
+            iterator = bana._iterator.dag(
+                fnType=fnType, root=self, skipRoot=True, recursive=recursive,
+                traverseUnderWorld=traverseUnderWorld, maxDepth=maxDepth,
+                order=order)
+        else:
             length = len(self.fullPathName())
-            if traverseUnderWorld:
-                match = OpenMaya.MGlobal.bnMakeMatchFullPathFunction(
-                    pattern, matchRelative=True)
+            match = _makeMatchFunction(pattern, traverseUnderWorld,
+                                       length=length)
+
+            # Skip the branches that cannot contain any path matching the
+            # pattern instead of filtering out each of their nodes.
+            pruneDepth, prefixMatch = bana._pattern.makePrefixMatchFunction(
+                pattern)
+            if prefixMatch is None:
+                prune = None
             else:
-                match = OpenMaya.MGlobal.bnMakeMatchPathFunction(pattern)
+                def prune(path):
+                    return not prefixMatch(path[length:])
 
-            iterator = (dagPath for dagPath in iterator
-                        if match(dagPath.fullPathName()[length:]))
+            iterator = bana._iterator.dag(
+                fnType=fnType, root=self, skipRoot=True, recursive=recursive,
+                traverseUnderWorld=traverseUnderWorld, prune=prune,
+                pruneDepth=pruneDepth, maxDepth=maxDepth, order=order,
+                fullPathNames=True)
+            iterator = (dagPath for dagPath, path in iterator if match(path))
 
         if copy:
             iterator = (OpenMaya.MDagPath(dagPath) for dagPath in iterator)
@@ -255,3 +510,21 @@ class MDagPath(object):
         dagPath = OpenMaya.MDagPath(self)
         dagPath.pop(1)
         return dagPath
+
+    def bnKey(self):
+        """Retrieve a hashable key identifying the DAG path.
+
+        Unlike this object, the key cannot be modified to point to another DAG
+        path, so its hash value is computed only once. This makes it faster to
+        use with hash-based containers such as dictionaries and sets when the
+        same keys are looked up many times.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        bana._key.DagPathKey
+            The key. It only remains equal to the keys of the same DAG path as
+            long as this DAG path is valid.
+        """
+        return bana._key.DagPathKey(self)
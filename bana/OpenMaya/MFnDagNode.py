@@ -4,12 +4,19 @@ import gorilla
 from maya import OpenMaya
 
 
+def _retarget(node, dagPaths):
+    for dagPath in dagPaths:
+        node.setObject(dagPath)
+        yield node
+
+
 @gorilla.patches(OpenMaya.MFnDagNode)
 class MFnDagNode(object):
     """Container for the extensions."""
 
     @classmethod
-    def bnFind(cls, pattern=None, recursive=True, traverseUnderWorld=True):
+    def bnFind(cls, pattern=None, recursive=True, traverseUnderWorld=True,
+               reuse=False):
         """DAG node iterator.
 
         The calling class defines the function set type for which the nodes
@@ -27,6 +34,11 @@ class MFnDagNode(object):
             ``True`` to search recursively.
         traverseUnderWorld : bool
             ``True`` to search within the underworld.
+        reuse : bool
+            ``True`` to retarget a same function set onto each node found
+            instead of creating a new one each time. It is faster but the
+            nodes yielded cannot be kept across iterations, such as when they
+            are to be stored into a list.
 
         Yields
         ------
@@ -43,9 +55,13 @@ class MFnDagNode(object):
         --------
         :ref:`pattern_matching`, :ref:`retrieving_nodes`.
         """
+        # The function sets hold their own copy of the DAG paths.
         iterator = OpenMaya.MDagPath.bnFind(
             pattern=pattern, fnType=cls().type(), recursive=recursive,
-            traverseUnderWorld=traverseUnderWorld)
+            traverseUnderWorld=traverseUnderWorld, copy=False)
+        if reuse:
+            return _retarget(cls(), iterator)
+
         return (cls(dagPath) for dagPath in iterator)
 
     @classmethod
@@ -108,7 +124,7 @@ class MFnDagNode(object):
         return self.fullPathName()
 
     def bnFindChildren(self, pattern=None, fnType=OpenMaya.MFn.kInvalid,
-                       recursive=True, traverseUnderWorld=True):
+                       recursive=True, traverseUnderWorld=True, reuse=False):
         """DAG node iterator over the children.
 
         Categories: :term:`foundation`.
@@ -124,6 +140,11 @@ class MFnDagNode(object):
             ``True`` to search recursively.
         traverseUnderWorld : bool
             ``True`` to search within the underworld.
+        reuse : bool
+            ``True`` to retarget a same function set onto each node found
+            instead of creating a new one each time. It is faster but the
+            nodes yielded cannot be kept across iterations, such as when they
+            are to be stored into a list.
 
         Yields
         ------
@@ -142,9 +163,13 @@ class MFnDagNode(object):
         """
         dagPath = OpenMaya.MDagPath()
         self.getPath(dagPath)
+        # The function sets hold their own copy of the DAG paths.
         iterator = dagPath.bnFindChildren(
             pattern=pattern, fnType=fnType, recursive=recursive,
-            traverseUnderWorld=traverseUnderWorld)
+            traverseUnderWorld=traverseUnderWorld, copy=False)
+        if reuse:
+            return _retarget(OpenMaya.MFnDagNode(), iterator)
+
         return (OpenMaya.MFnDagNode(dagPath) for dagPath in iterator)
 
     def bnGetChild(self, pattern=None, fnType=OpenMaya.MFn.kInvalid,
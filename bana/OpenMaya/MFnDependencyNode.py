@@ -3,6 +3,9 @@
 import gorilla
 from maya import OpenMaya
 
+import bana._key
+import bana.index
+
 
 @gorilla.patches(OpenMaya.MFnDependencyNode)
 class MFnDependencyNode(object):
@@ -32,6 +35,13 @@ class MFnDependencyNode(object):
         --------
         :ref:`pattern_matching`, :ref:`retrieving_nodes`.
         """
+        if bana.index.isEnabled():
+            for obj in bana.index.findObjects(pattern=pattern,
+                                              fnType=cls().type()):
+                yield cls(obj)
+
+            return
+
         iterator = OpenMaya.MItDependencyNodes(cls().type())
         if pattern is None:
             while not iterator.isDone():
@@ -111,3 +121,21 @@ class MFnDependencyNode(object):
             The name.
         """
         return self.name()
+
+    def bnKey(self):
+        """Retrieve a hashable key identifying the DG node.
+
+        Unlike this object, the key cannot be modified to point to another DG
+        node, so its hash value is computed only once. This makes it faster to
+        use with hash-based containers such as dictionaries and sets when the
+        same keys are looked up many times.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        bana._key.NodeKey
+            The key. It only remains equal to the keys of the same DG node as
+            long as this node exists.
+        """
+        return bana._key.NodeKey(self.object())
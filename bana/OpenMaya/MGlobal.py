@@ -155,7 +155,7 @@ class MGlobal(object):
             return bool(bana._pattern.FULL_PATH_OBJ.match(path))
 
     @classmethod
-    def bnMakeMatchNameFunction(cls, pattern):
+    def bnMakeMatchNameFunction(cls, pattern, deterministic=None):
         """Create a function to match *names* to a pattern.
 
         Categories: :term:`explicit`.
@@ -164,6 +164,12 @@ class MGlobal(object):
         ----------
         pattern : str
             *Name* pattern to build. Wildcards are allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -205,10 +211,12 @@ class MGlobal(object):
                              % (pattern,))
 
         return bana._pattern.makeMatchFunction(pattern,
-                                               bana._pattern.CONTEXT_NAME)
+                                               bana._pattern.CONTEXT_NAME,
+                                               deterministic=deterministic)
 
     @classmethod
-    def bnMakeMatchFullNameFunction(cls, pattern, matchRelative=False):
+    def bnMakeMatchFullNameFunction(cls, pattern, matchRelative=False,
+                                    deterministic=None):
         """Create a function to match *full names* to a pattern.
 
         Categories: :term:`explicit`.
@@ -221,6 +229,12 @@ class MGlobal(object):
             ``True`` to allow matching relatively to a parent namespace. That
             is, *full names* starting with the namespace delimiter ``:`` are
             allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -250,10 +264,11 @@ class MGlobal(object):
 
         return bana._pattern.makeMatchFunction(pattern,
                                                bana._pattern.CONTEXT_FULL_NAME,
-                                               matchRelative=matchRelative)
+                                               matchRelative=matchRelative,
+                                               deterministic=deterministic)
 
     @classmethod
-    def bnMakeMatchPathFunction(cls, pattern):
+    def bnMakeMatchPathFunction(cls, pattern, deterministic=None):
         """Create a function to match *paths* to a pattern.
 
         Categories: :term:`explicit`.
@@ -262,6 +277,12 @@ class MGlobal(object):
         ----------
         pattern : str
             *Path* pattern to build. Wildcards are allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -304,10 +325,12 @@ class MGlobal(object):
                              % (pattern,))
 
         return bana._pattern.makeMatchFunction(pattern,
-                                               bana._pattern.CONTEXT_PATH)
+                                               bana._pattern.CONTEXT_PATH,
+                                               deterministic=deterministic)
 
     @classmethod
-    def bnMakeMatchFullPathFunction(cls, pattern, matchRelative=False):
+    def bnMakeMatchFullPathFunction(cls, pattern, matchRelative=False,
+                                    deterministic=None):
         """Create a function to match *full paths* to a pattern.
 
         Categories: :term:`explicit`.
@@ -320,6 +343,12 @@ class MGlobal(object):
             ``True`` to allow matching relatively to a parent path. That is,
             *full paths* starting with the underworld delimiter ``->`` are
             allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -349,10 +378,11 @@ class MGlobal(object):
 
         return bana._pattern.makeMatchFunction(pattern,
                                                bana._pattern.CONTEXT_FULL_PATH,
-                                               matchRelative=matchRelative)
+                                               matchRelative=matchRelative,
+                                               deterministic=deterministic)
 
     @classmethod
-    def bnMatchName(cls, pattern, name):
+    def bnMatchName(cls, pattern, name, deterministic=None):
         """Check if a *name* matches a given pattern.
 
         Both pattern and *name* must be strictly well-formed.
@@ -368,6 +398,12 @@ class MGlobal(object):
             Pattern to match to. Wildcards are allowed.
         path : str
             *Name* to check.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -381,10 +417,12 @@ class MGlobal(object):
         if not cls.bnIsValidName(name):
             raise ValueError("The name pattern '%s' is not valid." % (name,))
 
-        return bool(cls.bnMakeMatchNameFunction(pattern)(name))
+        return bool(cls.bnMakeMatchNameFunction(
+            pattern, deterministic=deterministic)(name))
 
     @classmethod
-    def bnMatchFullName(cls, pattern, name, matchRelative=False):
+    def bnMatchFullName(cls, pattern, name, matchRelative=False,
+                        deterministic=None):
         """Check if a *full name* matches a given pattern.
 
         Both pattern and *full name* must be strictly well-formed.
@@ -404,6 +442,12 @@ class MGlobal(object):
             ``True`` to allow matching relatively to a parent namespace. That
             is, *full names* starting with the namespace delimiter ``:`` are
             allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -419,10 +463,11 @@ class MGlobal(object):
                              % (name,))
 
         return bool(cls.bnMakeMatchFullNameFunction(
-            pattern, matchRelative=matchRelative)(name))
+            pattern, matchRelative=matchRelative,
+            deterministic=deterministic)(name))
 
     @classmethod
-    def bnMatchPath(cls, pattern, path):
+    def bnMatchPath(cls, pattern, path, deterministic=None):
         """Check if a *path* matches a given pattern.
 
         Both pattern and *path* must be strictly well-formed.
@@ -438,6 +483,12 @@ class MGlobal(object):
             Pattern to match to. Wildcards are allowed.
         path : str
             *Path* to check.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -451,10 +502,12 @@ class MGlobal(object):
         if not cls.bnIsValidPath(path):
             raise ValueError("The path pattern '%s' is not valid." % (path,))
 
-        return bool(cls.bnMakeMatchPathFunction(pattern)(path))
+        return bool(cls.bnMakeMatchPathFunction(
+            pattern, deterministic=deterministic)(path))
 
     @classmethod
-    def bnMatchFullPath(cls, pattern, path, matchRelative=False):
+    def bnMatchFullPath(cls, pattern, path, matchRelative=False,
+                        deterministic=None):
         """Check if a *full path* matches a given pattern.
 
         Both pattern and *full path* must be strictly well-formed.
@@ -474,6 +527,12 @@ class MGlobal(object):
             ``True`` to allow matching relatively to a parent path. That is,
             *full paths* starting with the underworld delimiter ``->`` are
             allowed.
+        deterministic : bool
+            ``True`` to match with a deterministic finite automaton, which
+            runs in a time linear to the length of the strings, rather than
+            with a regular expression, which might backtrack. ``None`` to only
+            use the automaton for the patterns that could take a long time to
+            match otherwise.
 
         Returns
         -------
@@ -489,4 +548,241 @@ class MGlobal(object):
                              % (path,))
 
         return bool(cls.bnMakeMatchFullPathFunction(
-            pattern, matchRelative=matchRelative)(path))
+            pattern, matchRelative=matchRelative,
+            deterministic=deterministic)(path))
+
+    @classmethod
+    def bnFilterNames(cls, pattern, names, indices=False, workers=None):
+        """Filter a sequence of *names* with a given pattern.
+
+        The pattern is built once and matched against all the *names* in a
+        single pass, which is faster than calling the function returned by
+        :meth:`MGlobal.bnMakeMatchNameFunction` for each *name*.
+
+        Categories: :term:`explicit`.
+
+        Parameters
+        ----------
+        pattern : str
+            *Name* pattern to match to. Wildcards are allowed.
+        names : sequence of str
+            *Names* to filter. They must be strictly well-formed. No check is
+            done to ensure the validity of the input but this can be done
+            manually using :meth:`MGlobal.bnIsValidName`.
+        indices : bool
+            ``True`` to return the indices of the *names* matching the pattern
+            rather than the *names* themselves.
+        workers : int
+            Number of processes filtering the *names* in parallel. ``None``
+            to filter them within the current process.
+            The processes are kept alive across calls. Within Maya, they are
+            forked from Maya's process, or run Maya's executable on Windows
+            unless :func:`bana._pattern.setWorkerExecutable` is called.
+
+        Returns
+        -------
+        list of str or list of int
+            The *names* matching the pattern, or their indices, in the order
+            in which they were found.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed or the number of workers is lower
+            than 1.
+
+        See Also
+        --------
+        :ref:`pattern_matching`, :meth:`MGlobal.bnIsValidName`.
+        """
+        hasWildcards = bana._pattern.hasWildcards(pattern)
+        if not cls.bnIsValidName(pattern, allowWildcards=hasWildcards):
+            raise ValueError("The name pattern '%s' is not valid."
+                             % (pattern,))
+
+        function = bana._pattern.makeFilterFunction(
+            pattern, bana._pattern.CONTEXT_NAME)
+        return function(names, indices=indices, workers=workers)
+
+    @classmethod
+    def bnFilterFullNames(cls, pattern, names, matchRelative=False,
+                          indices=False, workers=None):
+        """Filter a sequence of *full names* with a given pattern.
+
+        The pattern is built once and matched against all the *full names* in
+        a single pass, which is faster than calling the function returned by
+        :meth:`MGlobal.bnMakeMatchFullNameFunction` for each *full name*.
+
+        Categories: :term:`explicit`.
+
+        Parameters
+        ----------
+        pattern : str
+            *Full name* pattern to match to. Wildcards are allowed.
+        names : sequence of str
+            *Full names* to filter. They must be strictly well-formed. No check
+            is done to ensure the validity of the input but this can be done
+            manually using :meth:`MGlobal.bnIsValidFullName`.
+        matchRelative : bool
+            ``True`` to allow matching relatively to a parent namespace. That
+            is, *full names* starting with the namespace delimiter ``:`` are
+            allowed.
+        indices : bool
+            ``True`` to return the indices of the *full names* matching the
+            pattern rather than the *full names* themselves.
+        workers : int
+            Number of processes filtering the *full names* in parallel.
+            ``None`` to filter them within the current process.
+            The processes are kept alive across calls. Within Maya, they are
+            forked from Maya's process, or run Maya's executable on Windows
+            unless :func:`bana._pattern.setWorkerExecutable` is called.
+
+        Returns
+        -------
+        list of str or list of int
+            The *full names* matching the pattern, or their indices, in the
+            order in which they were found.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed or the number of workers is lower
+            than 1.
+
+        See Also
+        --------
+        :ref:`pattern_matching`, :meth:`MGlobal.bnIsValidFullName`.
+        """
+        hasWildcards = bana._pattern.hasWildcards(pattern)
+        if not cls.bnIsValidFullName(pattern, allowWildcards=hasWildcards,
+                                     matchRelative=matchRelative):
+            raise ValueError("The full name pattern '%s' is not valid."
+                             % (pattern,))
+
+        function = bana._pattern.makeFilterFunction(
+            pattern, bana._pattern.CONTEXT_FULL_NAME,
+            matchRelative=matchRelative)
+        return function(names, indices=indices, workers=workers)
+
+    @classmethod
+    def bnFilterPaths(cls, pattern, paths, indices=False, workers=None):
+        """Filter a sequence of *paths* with a given pattern.
+
+        The pattern is built once and matched against all the *paths* in a
+        single pass, which is faster than calling the function returned by
+        :meth:`MGlobal.bnMakeMatchPathFunction` for each *path*.
+
+        Categories: :term:`explicit`.
+
+        Parameters
+        ----------
+        pattern : str
+            *Path* pattern to match to. Wildcards are allowed.
+        paths : sequence of str
+            *Paths* to filter. They must be strictly well-formed. No check is
+            done to ensure the validity of the input but this can be done
+            manually using :meth:`MGlobal.bnIsValidPath`.
+        indices : bool
+            ``True`` to return the indices of the *paths* matching the pattern
+            rather than the *paths* themselves.
+        workers : int
+            Number of processes filtering the *paths* in parallel. ``None``
+            to filter them within the current process.
+            The processes are kept alive across calls. Within Maya, they are
+            forked from Maya's process, or run Maya's executable on Windows
+            unless :func:`bana._pattern.setWorkerExecutable` is called.
+
+        Returns
+        -------
+        list of str or list of int
+            The *paths* matching the pattern, or their indices, in the order
+            in which they were found.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed or the number of workers is lower
+            than 1.
+
+        See Also
+        --------
+        :ref:`pattern_matching`, :meth:`MGlobal.bnIsValidPath`.
+        """
+        hasWildcards = bana._pattern.hasWildcards(pattern)
+        if not cls.bnIsValidPath(pattern, allowWildcards=hasWildcards):
+            raise ValueError("The path pattern '%s' is not valid."
+                             % (pattern,))
+
+        function = bana._pattern.makeFilterFunction(
+            pattern, bana._pattern.CONTEXT_PATH)
+        return function(paths, indices=indices, workers=workers)
+
+    @classmethod
+    def bnFilterFullPaths(cls, pattern, paths, matchRelative=False,
+                          indices=False, workers=None):
+        """Filter a sequence of *full paths* with a given pattern.
+
+        The pattern is built once and matched against all the *full paths* in
+        a single pass, which is faster than calling the function returned by
+        :meth:`MGlobal.bnMakeMatchFullPathFunction` for each *full path*.
+
+        Categories: :term:`explicit`.
+
+        Parameters
+        ----------
+        pattern : str
+            *Full path* pattern to match to. Wildcards are allowed.
+        paths : sequence of str
+            *Full paths* to filter. They must be strictly well-formed. No check
+            is done to ensure the validity of the input but this can be done
+            manually using :meth:`MGlobal.bnIsValidFullPath`.
+        matchRelative : bool
+            ``True`` to allow matching relatively to a parent path. That is,
+            *full paths* starting with the underworld delimiter ``->`` are
+            allowed.
+        indices : bool
+            ``True`` to return the indices of the *full paths* matching the
+            pattern rather than the *full paths* themselves.
+        workers : int
+            Number of processes filtering the *full paths* in parallel.
+            ``None`` to filter them within the current process.
+            The processes are kept alive across calls. Within Maya, they are
+            forked from Maya's process, or run Maya's executable on Windows
+            unless :func:`bana._pattern.setWorkerExecutable` is called.
+
+        Returns
+        -------
+        list of str or list of int
+            The *full paths* matching the pattern, or their indices, in the
+            order in which they were found.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed or the number of workers is lower
+            than 1.
+
+        Examples
+        --------
+        >>> import bana
+        >>> bana.initialize()
+        >>> from maya import OpenMaya
+        >>> paths = [dagPath.fullPathName()
+        ...          for dagPath in OpenMaya.MDagPath.bnFind(copy=False)]
+        >>> for path in OpenMaya.MGlobal.bnFilterFullPaths('*|*Shape', paths):
+        ...     print(path)
+
+        See Also
+        --------
+        :ref:`pattern_matching`, :meth:`MGlobal.bnIsValidFullPath`.
+        """
+        hasWildcards = bana._pattern.hasWildcards(pattern)
+        if not cls.bnIsValidFullPath(pattern, allowWildcards=hasWildcards,
+                                     matchRelative=matchRelative):
+            raise ValueError("The full path pattern '%s' is not valid."
+                             % (pattern,))
+
+        function = bana._pattern.makeFilterFunction(
+            pattern, bana._pattern.CONTEXT_FULL_PATH,
+            matchRelative=matchRelative)
+        return function(paths, indices=indices, workers=workers)
@@ -5,6 +5,8 @@ import sys
 import gorilla
 from maya import OpenMaya
 
+import bana._array
+
 
 if sys.version_info[0] == 2:
     _range = xrange
@@ -19,6 +21,34 @@ _MScriptUtil = OpenMaya.MScriptUtil
 class MMatrix(object):
     """Container for the extensions."""
 
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a matrix from a NumPy array.
+
+        The values are copied at once into the matrix.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Two-dimensional 4 x 4 array of values.
+
+        Returns
+        -------
+        maya.OpenMaya.MMatrix
+            The new matrix.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (4, 4), 'matrix')
+        matrix = OpenMaya.MMatrix()
+        bana._array.write(int(matrix[0]), array)
+        return matrix
+
     @gorilla.filter(True)
     @gorilla.settings(allow_hit=True)
     def __str__(self):
@@ -33,6 +63,22 @@ class MMatrix(object):
         """
         return '[%s]' % ('\n '.join(str(r) for r in self.bnGet()))
 
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values are copied at once from the matrix, which is faster than
+        retrieving them through :meth:`bnGet`.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The two-dimensional 4 x 4 array of values.
+        """
+        # The rows of the matrix are stored contiguously.
+        return bana._array.read(int(self[0]), (4, 4))
+
     def bnGet(self):
         """Retrieve the values as a two-dimensional 4 x 4 list.
 
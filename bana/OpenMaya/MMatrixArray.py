@@ -0,0 +1,113 @@
+"""Extensions for the ``maya.OpenMaya.MMatrixArray`` class."""
+
+import ctypes
+import sys
+
+import gorilla
+from maya import OpenMaya
+
+import bana._array
+
+
+if sys.version_info[0] == 2:
+    _range = xrange
+else:
+    _range = range
+
+
+# Size in bytes of the values of a matrix.
+_MATRIX_SIZE = 16 * ctypes.sizeof(ctypes.c_double)
+
+
+def _getAddress(matrices, length):
+    # Return the address of the values of the matrices if they can be accessed
+    # at once, or None otherwise. No method allows to copy all the values
+    # into a buffer, so they are directly accessed in the storage of the
+    # array, provided that its elements are returned as references, rather
+    # than as copies, and that they are stored contiguously.
+    first = matrices[0]
+    last = matrices[length - 1]
+    if first.thisown or last.thisown:
+        return None
+
+    address = int(first[0])
+    if int(last[0]) - address != (length - 1) * _MATRIX_SIZE:
+        return None
+
+    return address
+
+
+@gorilla.patches(OpenMaya.MMatrixArray)
+class MMatrixArray(object):
+    """Container for the extensions."""
+
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a matrix array from a NumPy array.
+
+        The values of all the matrices are copied at once if the matrix array
+        stores them contiguously, or else matrix by matrix.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Three-dimensional N x 4 x 4 array of values.
+
+        Returns
+        -------
+        maya.OpenMaya.MMatrixArray
+            The new matrix array.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (None, 4, 4), 'matrix array')
+        matrices = OpenMaya.MMatrixArray()
+        matrices.setLength(len(array))
+        if not len(array):
+            return matrices
+
+        address = _getAddress(matrices, len(array))
+        if address is not None:
+            bana._array.write(address, array)
+            return matrices
+
+        matrix = OpenMaya.MMatrix()
+        address = int(matrix[0])
+        for i in _range(len(array)):
+            bana._array.write(address, array[i])
+            matrices.set(matrix, i)
+
+        return matrices
+
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values of all the matrices are copied at once if the matrix array
+        stores them contiguously, or else matrix by matrix.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The three-dimensional N x 4 x 4 array of values.
+        """
+        length = self.length()
+        out = bana._array.empty((length, 4, 4))
+        if not length:
+            return out
+
+        address = _getAddress(self, length)
+        if address is not None:
+            return bana._array.read(address, (length, 4, 4), out=out)
+
+        for i in _range(length):
+            matrix = self[i]
+            bana._array.read(int(matrix[0]), (4, 4), out=out[i])
+
+        return out
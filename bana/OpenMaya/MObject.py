@@ -3,6 +3,9 @@
 import gorilla
 from maya import OpenMaya
 
+import bana._key
+import bana.index
+
 
 @gorilla.patches(OpenMaya.MObject)
 class MObject(object):
@@ -31,6 +34,12 @@ class MObject(object):
         --------
         :ref:`pattern_matching`, :ref:`retrieving_nodes`.
         """
+        if bana.index.isEnabled():
+            for obj in bana.index.findObjects(pattern=pattern, fnType=fnType):
+                yield obj
+
+            return
+
         iterator = OpenMaya.MItDependencyNodes(fnType)
         if pattern is None:
             while not iterator.isDone():
@@ -90,3 +99,21 @@ class MObject(object):
             The hash value representing this object.
         """
         return OpenMaya.MObjectHandle(self).hashCode()
+
+    def bnKey(self):
+        """Retrieve a hashable key identifying the DG node.
+
+        Unlike this object, the key cannot be modified to point to another DG
+        node, so its hash value is computed only once. This makes it faster to
+        use with hash-based containers such as dictionaries and sets when the
+        same keys are looked up many times.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        bana._key.NodeKey
+            The key. It only remains equal to the keys of the same DG node as
+            long as this node exists.
+        """
+        return bana._key.NodeKey(self)
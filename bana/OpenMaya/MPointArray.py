@@ -0,0 +1,68 @@
+"""Extensions for the ``maya.OpenMaya.MPointArray`` class."""
+
+import gorilla
+from maya import OpenMaya
+
+import bana._array
+
+
+@gorilla.patches(OpenMaya.MPointArray)
+class MPointArray(object):
+    """Container for the extensions."""
+
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a point array from a NumPy array.
+
+        The values are copied at once into a buffer from which the point array
+        is built.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Two-dimensional N x 4 array of values, each row containing the
+            values [x, y, z, w] of a point.
+
+        Returns
+        -------
+        maya.OpenMaya.MPointArray
+            The new point array.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (None, 4), 'point array')
+        if not len(array):
+            return OpenMaya.MPointArray()
+
+        util = bana._array.allocate(array.size)
+        ptr = util.asDouble4Ptr()
+        bana._array.write(int(ptr), array)
+        return OpenMaya.MPointArray(ptr, len(array))
+
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values are copied at once into a buffer from which the array is
+        built.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The two-dimensional N x 4 array of values, each row containing the
+            values [x, y, z, w] of a point.
+        """
+        length = self.length()
+        if not length:
+            return bana._array.empty((0, 4))
+
+        util = bana._array.allocate(length * 4)
+        ptr = util.asDouble4Ptr()
+        self.get(ptr)
+        return bana._array.read(int(ptr), (length, 4))
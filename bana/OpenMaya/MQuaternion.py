@@ -3,11 +3,43 @@
 import gorilla
 from maya import OpenMaya
 
+import bana._array
+
 
 @gorilla.patches(OpenMaya.MQuaternion)
 class MQuaternion(object):
     """Container for the extensions."""
 
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a quaternion from a NumPy array.
+
+        The values are copied at once into a buffer from which the quaternion
+        is built.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Array of values [x, y, z, w].
+
+        Returns
+        -------
+        maya.OpenMaya.MQuaternion
+            The new quaternion.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (4,), 'quaternion')
+        util = bana._array.allocate(4)
+        ptr = util.asDoublePtr()
+        bana._array.write(int(ptr), array)
+        return OpenMaya.MQuaternion(ptr)
+
     @gorilla.filter(True)
     @gorilla.settings(allow_hit=True)
     def __str__(self):
@@ -22,6 +54,24 @@ class MQuaternion(object):
         """
         return str(self.bnGet())
 
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values are copied at once into a buffer from which the array is
+        built.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of values [x, y, z, w].
+        """
+        util = bana._array.allocate(4)
+        ptr = util.asDoublePtr()
+        self.get(ptr)
+        return bana._array.read(int(ptr), (4,))
+
     def bnGet(self):
         """Retrieve the values as a list.
 
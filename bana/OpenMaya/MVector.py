@@ -3,6 +3,8 @@
 import gorilla
 from maya import OpenMaya
 
+import bana._array
+
 
 _MScriptUtil = OpenMaya.MScriptUtil
 
@@ -11,6 +13,36 @@ _MScriptUtil = OpenMaya.MScriptUtil
 class MVector(object):
     """Container for the extensions."""
 
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a vector from a NumPy array.
+
+        The values are copied at once into a buffer from which the vector is
+        built.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Array of values [x, y, z].
+
+        Returns
+        -------
+        maya.OpenMaya.MVector
+            The new vector.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (3,), 'vector')
+        util = bana._array.allocate(3)
+        ptr = util.asDoublePtr()
+        bana._array.write(int(ptr), array)
+        return OpenMaya.MVector(ptr)
+
     @gorilla.filter(True)
     @gorilla.settings(allow_hit=True)
     def __str__(self):
@@ -25,6 +57,24 @@ class MVector(object):
         """
         return str(self.bnGet())
 
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values are copied at once into a buffer from which the array is
+        built.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of values [x, y, z].
+        """
+        util = bana._array.allocate(3)
+        ptr = util.asDoublePtr()
+        self.get(ptr)
+        return bana._array.read(int(ptr), (3,))
+
     def bnGet(self):
         """Retrieve the values as a list.
 
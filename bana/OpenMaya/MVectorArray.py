@@ -0,0 +1,68 @@
+"""Extensions for the ``maya.OpenMaya.MVectorArray`` class."""
+
+import gorilla
+from maya import OpenMaya
+
+import bana._array
+
+
+@gorilla.patches(OpenMaya.MVectorArray)
+class MVectorArray(object):
+    """Container for the extensions."""
+
+    @classmethod
+    def bnFromArray(cls, array):
+        """Create a vector array from a NumPy array.
+
+        The values are copied at once into a buffer from which the vector array
+        is built.
+
+        Categories: :term:`foundation`.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            Two-dimensional N x 3 array of values, each row containing the
+            values [x, y, z] of a vector.
+
+        Returns
+        -------
+        maya.OpenMaya.MVectorArray
+            The new vector array.
+
+        Raises
+        ------
+        ValueError
+            The shape of the array is not valid.
+        """
+        array = bana._array.check(array, (None, 3), 'vector array')
+        if not len(array):
+            return OpenMaya.MVectorArray()
+
+        util = bana._array.allocate(array.size)
+        ptr = util.asDouble3Ptr()
+        bana._array.write(int(ptr), array)
+        return OpenMaya.MVectorArray(ptr, len(array))
+
+    def bnAsArray(self):
+        """Retrieve the values as a NumPy array.
+
+        The values are copied at once into a buffer from which the array is
+        built.
+
+        Categories: :term:`foundation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The two-dimensional N x 3 array of values, each row containing the
+            values [x, y, z] of a vector.
+        """
+        length = self.length()
+        if not length:
+            return bana._array.empty((0, 3))
+
+        util = bana._array.allocate(length * 3)
+        ptr = util.asDouble3Ptr()
+        self.get(ptr)
+        return bana._array.read(int(ptr), (length, 3))
@@ -0,0 +1,64 @@
+"""Bulk copies between the memory of Maya's objects and NumPy arrays.
+
+The memory of the Maya objects is accessed through the address held by SWIG
+pointers, retrieved by converting these to integers, which allows copying
+all their values at once rather than one by one.
+
+NumPy is only imported when one of these functions is called since it is
+not a requirement of this package.
+"""
+
+import ctypes
+
+from maya import OpenMaya
+
+
+def allocate(count):
+    """Allocate a buffer of doubles initialized to zero."""
+    util = OpenMaya.MScriptUtil()
+    util.createFromList([0.0] * count, count)
+    return util
+
+
+def empty(shape):
+    """Create an array of doubles without initializing its values."""
+    import numpy
+
+    return numpy.empty(shape, dtype=numpy.float64)
+
+
+def read(address, shape, out=None):
+    """Copy the doubles stored at an address into an array.
+
+    A new array is created if none is given.
+    """
+    if out is None:
+        out = empty(shape)
+
+    ctypes.memmove(out.ctypes.data, address, out.nbytes)
+    return out
+
+
+def write(address, array):
+    """Copy an array of doubles to an address."""
+    import numpy
+
+    array = numpy.ascontiguousarray(array, dtype=numpy.float64)
+    ctypes.memmove(address, array.ctypes.data, array.nbytes)
+
+
+def check(array, shape, description):
+    """Convert a sequence into an array of doubles of a given shape.
+
+    The size of the dimensions set to ``None`` is left unchecked.
+    """
+    import numpy
+
+    array = numpy.asarray(array, dtype=numpy.float64)
+    if (len(array.shape) != len(shape)
+            or any(expected is not None and size != expected
+                   for size, expected in zip(array.shape, shape))):
+        raise ValueError("The shape '%s' of the %s is not valid."
+                         % (array.shape, description))
+
+    return array
@@ -0,0 +1,335 @@
+"""Deterministic finite automata built from regular expressions.
+
+Only the subset of the regular expression syntax generated by
+:func:`bana._pattern.makeExpression` is supported, that is literals, escaped
+characters, character classes, non-capturing groups, alternations, greedy
+quantifiers, and the anchors ``^`` and ``$`` surrounding the whole
+expression.
+
+The expression is first compiled into a nondeterministic automaton. Its
+deterministic counterpart is then built lazily while matching strings, each
+state and each transition being computed at most once, so that matching a
+string always takes a time linear to its length.
+"""
+
+import threading
+import time
+
+
+# Label of the transitions accepting any character except a newline.
+_ANY = object()
+
+
+class _Parser(object):
+
+    def __init__(self, expression):
+        self._expression = expression
+        self._pos = 0
+
+    def parse(self):
+        node = self._parseAlternation()
+        if self._pos != len(self._expression):
+            self._fail()
+
+        return node
+
+    def _peek(self):
+        if self._pos < len(self._expression):
+            return self._expression[self._pos]
+
+        return None
+
+    def _fail(self):
+        raise ValueError("The expression '%s' is not supported at the "
+                         "position %d." % (self._expression, self._pos))
+
+    def _parseAlternation(self):
+        branches = [self._parseConcatenation()]
+        while self._peek() == '|':
+            self._pos += 1
+            branches.append(self._parseConcatenation())
+
+        if len(branches) == 1:
+            return branches[0]
+
+        return ('alt', branches)
+
+    def _parseConcatenation(self):
+        items = []
+        while self._peek() not in (None, '|', ')'):
+            items.append(self._parseRepetition())
+
+        return ('cat', items)
+
+    def _parseRepetition(self):
+        node = self._parseAtom()
+        while True:
+            char = self._peek()
+            if char == '?':
+                bounds = (0, 1)
+            elif char == '*':
+                bounds = (0, None)
+            elif char == '+':
+                bounds = (1, None)
+            elif char == '{':
+                end = self._expression.find('}', self._pos)
+                if end < 0:
+                    self._fail()
+
+                bounds = self._expression[self._pos + 1:end].split(',')
+                try:
+                    if len(bounds) == 1:
+                        bounds = (int(bounds[0]),) * 2
+                    elif len(bounds) == 2:
+                        bounds = (int(bounds[0] or 0),
+                                  int(bounds[1]) if bounds[1] else None)
+                    else:
+                        self._fail()
+                except ValueError:
+                    self._fail()
+
+                self._pos = end
+            else:
+                return node
+
+            self._pos += 1
+            if self._peek() in ('?', '+'):
+                # Lazy and possessive quantifiers.
+                self._fail()
+
+            node = ('rep', node, bounds[0], bounds[1])
+
+    def _parseAtom(self):
+        char = self._peek()
+        if char == '(':
+            if not self._expression.startswith('(?:', self._pos):
+                self._fail()
+
+            self._pos += 3
+            node = self._parseAlternation()
+            if self._peek() != ')':
+                self._fail()
+
+            self._pos += 1
+            return node
+        elif char == '[':
+            return self._parseClass()
+        elif char == '\\':
+            self._pos += 1
+            char = self._peek()
+            if char is None or char.isalnum():
+                # Character class shorthands and backreferences.
+                self._fail()
+
+            self._pos += 1
+            return ('set', frozenset(char))
+        elif char == '.':
+            self._pos += 1
+            return ('set', _ANY)
+        elif char in ('^', '$', '*', '+', '?', '{', None):
+            self._fail()
+
+        self._pos += 1
+        return ('set', frozenset(char))
+
+    def _parseClass(self):
+        end = self._expression.find(']', self._pos + 1)
+        if end < 0:
+            self._fail()
+
+        content = self._expression[self._pos + 1:end]
+        if not content or content.startswith('^') or '\\' in content:
+            self._fail()
+
+        chars = set()
+        i = 0
+        while i < len(content):
+            if i + 2 < len(content) and content[i + 1] == '-':
+                chars.update(chr(code) for code in range(ord(content[i]),
+                                                         ord(content[i + 2])
+                                                         + 1))
+                i += 3
+            else:
+                chars.add(content[i])
+                i += 1
+
+        self._pos = end + 1
+        return ('set', frozenset(chars))
+
+
+class Automaton(object):
+    """Automaton matching strings against a regular expression.
+
+    Parameters
+    ----------
+    expression : str
+        Regular expression to match against.
+
+    Raises
+    ------
+    ValueError
+        The expression uses a syntax that is not supported.
+    """
+
+    def __init__(self, expression):
+        """Compile the expression into a nondeterministic automaton."""
+        self._anchorEnd = expression.endswith('$')
+        if expression.startswith('^'):
+            expression = expression[1:]
+
+        if self._anchorEnd:
+            expression = expression[:-1]
+
+        self._labels = []
+        self._epsilons = []
+        start, self._final = self._build(_Parser(expression).parse())
+
+        self._lock = threading.Lock()
+        self._ids = {}
+        self._sets = []
+        self._transitions = []
+        self._accepting = []
+        self._start = self._addState(self._close((start,)))
+        self._dead = self._addState(frozenset())
+
+    def match(self, string, budget=None):
+        """Check if a string matches the expression.
+
+        Parameters
+        ----------
+        string : str
+            String to check.
+        budget : float
+            Maximum time, in seconds, that the match is allowed to take.
+            ``None`` for no limit. It is only checked when the automaton needs
+            to build a new state, the other steps taking a constant time.
+
+        Returns
+        -------
+        bool
+            True if the string matches the expression.
+
+        Raises
+        ------
+        RuntimeError
+            The match took longer than the budget allowed.
+        """
+        transitions = self._transitions
+        accepting = self._accepting
+        dead = self._dead
+        anchorEnd = self._anchorEnd
+        deadline = None if budget is None else time.time() + budget
+        state = self._start
+        for char in string:
+            if not anchorEnd and accepting[state]:
+                return True
+
+            nextState = transitions[state].get(char)
+            if nextState is None:
+                if deadline is not None and time.time() >= deadline:
+                    raise RuntimeError("The match exceeded its budget of %s "
+                                       "seconds." % (budget,))
+
+                nextState = self._step(state, char)
+
+            if nextState == dead:
+                return False
+
+            state = nextState
+
+        return accepting[state]
+
+    def _newState(self):
+        self._labels.append([])
+        self._epsilons.append([])
+        return len(self._labels) - 1
+
+    def _build(self, node):
+        # Return the start and end states of the automaton fragment
+        # recognizing the node.
+        kind = node[0]
+        if kind == 'set':
+            start = self._newState()
+            end = self._newState()
+            self._labels[start].append((node[1], end))
+            return (start, end)
+
+        if kind == 'cat':
+            start = end = self._newState()
+            for item in node[1]:
+                itemStart, itemEnd = self._build(item)
+                self._epsilons[end].append(itemStart)
+                end = itemEnd
+
+            return (start, end)
+
+        if kind == 'alt':
+            start = self._newState()
+            end = self._newState()
+            for branch in node[1]:
+                branchStart, branchEnd = self._build(branch)
+                self._epsilons[start].append(branchStart)
+                self._epsilons[branchEnd].append(end)
+
+            return (start, end)
+
+        # Repetitions are unrolled into as many copies of the fragment as
+        # their bounds require.
+        item, minimum, maximum = node[1:]
+        start = current = self._newState()
+        for _ in range(minimum):
+            itemStart, itemEnd = self._build(item)
+            self._epsilons[current].append(itemStart)
+            current = itemEnd
+
+        end = self._newState()
+        if maximum is None:
+            itemStart, itemEnd = self._build(item)
+            self._epsilons[current].append(itemStart)
+            self._epsilons[itemEnd].append(current)
+        else:
+            for _ in range(maximum - minimum):
+                itemStart, itemEnd = self._build(item)
+                self._epsilons[current].append(itemStart)
+                self._epsilons[current].append(end)
+                current = itemEnd
+
+        self._epsilons[current].append(end)
+        return (start, end)
+
+    def _close(self, states):
+        epsilons = self._epsilons
+        out = set(states)
+        stack = list(states)
+        while stack:
+            for state in epsilons[stack.pop()]:
+                if state not in out:
+                    out.add(state)
+                    stack.append(state)
+
+        return frozenset(out)
+
+    def _addState(self, states):
+        index = self._ids.get(states)
+        if index is None:
+            index = self._ids[states] = len(self._sets)
+            self._sets.append(states)
+            self._transitions.append({})
+            self._accepting.append(self._final in states)
+
+        return index
+
+    def _step(self, index, char):
+        with self._lock:
+            targets = set()
+            for state in self._sets[index]:
+                for label, target in self._labels[state]:
+                    if label is _ANY:
+                        if char != '\n':
+                            targets.add(target)
+                    elif char in label:
+                        targets.add(target)
+
+            state = self._addState(self._close(targets))
+            self._transitions[index][char] = state
+            return state
@@ -3,8 +3,62 @@
 from maya import OpenMaya
 
 
+def _makeDagIterator(fnType, root, skipRoot, traverseUnderWorld, order):
+    iterator = OpenMaya.MItDag(order, fnType)
+    if root is not None:
+        iterator.reset(root, order, fnType)
+
+    iterator.traverseUnderWorld(traverseUnderWorld)
+    if skipRoot and iterator.depth() == 0:
+        iterator.next()
+
+    return iterator
+
+
+def _makeFullPathNameFunction(root, fnType, order):
+    if (fnType != OpenMaya.MFn.kInvalid
+            or order != OpenMaya.MItDag.kDepthFirst):
+        # The ancestors of the items are only known to be the last items
+        # visited at each lower depth when all of them are visited depth first.
+        def getFullPathName(dagPath, depth):
+            return dagPath.fullPathName()
+
+        return getFullPathName
+
+    node = OpenMaya.MFnDagNode()
+    if root is None:
+        names = []
+        counts = []
+    else:
+        names = [root.fullPathName()]
+        counts = [root.pathCount()]
+
+    def getFullPathName(dagPath, depth):
+        del names[depth:]
+        del counts[depth:]
+        count = dagPath.pathCount()
+        if depth and len(names) == depth and counts[-1] == count:
+            node.setObject(dagPath)
+            name = names[-1] + '|' + node.name()
+        else:
+            # Either the parent was not visited or the item is the first one
+            # of an underworld.
+            name = dagPath.fullPathName()
+            if len(names) < depth:
+                names.extend((None,) * (depth - len(names)))
+                counts.extend((0,) * (depth - len(counts)))
+
+        names.append(name)
+        counts.append(count)
+        return name
+
+    return getFullPathName
+
+
 def dag(fnType=OpenMaya.MFn.kInvalid, root=None, skipRoot=False,
-        recursive=True, traverseUnderWorld=False):
+        recursive=True, traverseUnderWorld=False, prune=None, pruneDepth=0,
+        maxDepth=None, order=OpenMaya.MItDag.kDepthFirst,
+        fullPathNames=False):
     """DAG path iterator.
 
     Parameters
@@ -19,11 +73,32 @@ def dag(fnType=OpenMaya.MFn.kInvalid, root=None, skipRoot=False,
         True to search recursively.
     traverseUnderWorld : bool
         True to search within the underworld.
+    prune : function
+        Function called when searching recursively with the DAG path of each
+        item having a depth lower or equal to ``pruneDepth``, relative to the
+        root. If it returns True, the item is skipped and so are its
+        descendants.
+    pruneDepth : int
+        Maximum depth of the items to pass to the ``prune`` function.
+    maxDepth : int
+        Maximum depth of the items to traverse, relative to the root. The
+        descendants of the items at that depth are not visited. None for no
+        limit. It is capped to 1 if ``recursive`` is False.
+    order : maya.OpenMaya.MItDag.TraversalType
+        Either ``maya.OpenMaya.MItDag.kDepthFirst`` or
+        ``maya.OpenMaya.MItDag.kBreadthFirst``.
+    fullPathNames : bool
+        True to also yield the full path name of each item, in which case the
+        ``prune`` function is called with the full path names instead of the
+        DAG paths. When all the node types are traversed depth first, the
+        full path names are built incrementally from the ones of the parents
+        rather than retrieved from Maya.
 
     Yields
     ------
-    maya.OpenMaya.MDagPath
-        The DAG path for each item traversed.
+    maya.OpenMaya.MDagPath or tuple (maya.OpenMaya.MDagPath, str)
+        The DAG path for each item traversed, along with its full path name
+        if ``fullPathNames`` is True.
 
     Warning
     -------
@@ -31,33 +106,165 @@ def dag(fnType=OpenMaya.MFn.kInvalid, root=None, skipRoot=False,
         iteration. If data persistence is required, such as when the DAG paths
         are to be stored into a list, a copy needs to be made for each element.
     """
-    iterator = OpenMaya.MItDag(OpenMaya.MItDag.kDepthFirst, fnType)
-    if root is not None:
-        iterator.reset(root, OpenMaya.MItDag.kDepthFirst, fnType)
+    iterator = _makeDagIterator(fnType, root, skipRoot, traverseUnderWorld,
+                                order)
+    if not recursive and (maxDepth is None or maxDepth > 1):
+        maxDepth = 1
 
-    iterator.traverseUnderWorld(traverseUnderWorld)
-    if skipRoot and iterator.depth() == 0:
-        iterator.next()
+    if prune is None:
+        pruneDepth = -1
+
+    if fullPathNames:
+        getFullPathName = _makeFullPathNameFunction(root, fnType, order)
 
-    if recursive:
         def wrapper(iterator):
             dagPath = OpenMaya.MDagPath()
             while not iterator.isDone():
+                depth = iterator.depth()
+                if maxDepth is not None and depth >= maxDepth:
+                    iterator.prune()
+                    if depth > maxDepth:
+                        iterator.next()
+                        continue
+
                 iterator.getPath(dagPath)
-                yield dagPath
+                fullPathName = getFullPathName(dagPath, depth)
+                if depth <= pruneDepth and prune(fullPathName):
+                    iterator.prune()
+                else:
+                    yield (dagPath, fullPathName)
+
                 iterator.next()
-    else:
+    elif maxDepth is not None:
         def wrapper(iterator):
             dagPath = OpenMaya.MDagPath()
             while not iterator.isDone():
-                if iterator.depth() > 0:
+                depth = iterator.depth()
+                if depth >= maxDepth:
                     iterator.prune()
-                    if iterator.depth() > 1:
+                    if depth > maxDepth:
+                        # Nodes filtered out by type are not pruned, their
+                        # descendants have then to be skipped one by one.
                         iterator.next()
                         continue
 
+                iterator.getPath(dagPath)
+                if depth <= pruneDepth and prune(dagPath):
+                    iterator.prune()
+                else:
+                    yield dagPath
+
+                iterator.next()
+    elif pruneDepth >= 0:
+        def wrapper(iterator):
+            dagPath = OpenMaya.MDagPath()
+            while not iterator.isDone():
+                iterator.getPath(dagPath)
+                if iterator.depth() <= pruneDepth and prune(dagPath):
+                    iterator.prune()
+                else:
+                    yield dagPath
+
+                iterator.next()
+    else:
+        def wrapper(iterator):
+            dagPath = OpenMaya.MDagPath()
+            while not iterator.isDone():
                 iterator.getPath(dagPath)
                 yield dagPath
                 iterator.next()
 
     return wrapper(iterator)
+
+
+def dagBatches(batchSize, fnType=OpenMaya.MFn.kInvalid, root=None,
+               skipRoot=False, recursive=True, traverseUnderWorld=False,
+               prune=None, pruneDepth=0, maxDepth=None,
+               order=OpenMaya.MItDag.kDepthFirst, match=None):
+    """DAG path iterator yielding the items in batches.
+
+    Parameters
+    ----------
+    batchSize : int
+        Maximum number of DAG paths in each batch.
+    fnType : maya.OpenMaya.MFn.Type
+        Node type to match.
+    root : maya.OpenMaya.MDagPath
+        Root DAG path to begin the traversal from.
+    skipRoot : bool
+        True to not return the root node.
+    recursive : bool
+        True to search recursively.
+    traverseUnderWorld : bool
+        True to search within the underworld.
+    prune : function
+        Function called when searching recursively with the full path name of
+        each item having a depth lower or equal to ``pruneDepth``, relative to
+        the root. If it returns True, the item is skipped and so are its
+        descendants.
+    pruneDepth : int
+        Maximum depth of the items to pass to the ``prune`` function.
+    maxDepth : int
+        Maximum depth of the items to traverse, relative to the root. The
+        descendants of the items at that depth are not visited. None for no
+        limit. It is capped to 1 if ``recursive`` is False.
+    order : maya.OpenMaya.MItDag.TraversalType
+        Either ``maya.OpenMaya.MItDag.kDepthFirst`` or
+        ``maya.OpenMaya.MItDag.kBreadthFirst``.
+    match : function
+        Function called with the full path name of each item traversed. If it
+        returns False, the item is not added to the batch but its descendants
+        are still traversed.
+
+    Yields
+    ------
+    maya.OpenMaya.MDagPathArray
+        The DAG paths of at most ``batchSize`` items. The last batch is only
+        yielded if it is not empty.
+    """
+    iterator = _makeDagIterator(fnType, root, skipRoot, traverseUnderWorld,
+                                order)
+    if not recursive and (maxDepth is None or maxDepth > 1):
+        maxDepth = 1
+
+    if prune is None:
+        pruneDepth = -1
+
+    getFullPathName = None
+    if prune is not None or match is not None:
+        getFullPathName = _makeFullPathNameFunction(root, fnType, order)
+
+    dagPath = OpenMaya.MDagPath()
+    dagPaths = OpenMaya.MDagPathArray()
+    count = 0
+    while not iterator.isDone():
+        depth = iterator.depth()
+        if maxDepth is not None and depth >= maxDepth:
+            iterator.prune()
+            if depth > maxDepth:
+                iterator.next()
+                continue
+
+        iterator.getPath(dagPath)
+        if getFullPathName is not None:
+            fullPathName = getFullPathName(dagPath, depth)
+            if depth <= pruneDepth and prune(fullPathName):
+                iterator.prune()
+                iterator.next()
+                continue
+
+            if match is not None and not match(fullPathName):
+                iterator.next()
+                continue
+
+        dagPaths.append(dagPath)
+        count += 1
+        if count == batchSize:
+            yield dagPaths
+            dagPaths = OpenMaya.MDagPathArray()
+            count = 0
+
+        iterator.next()
+
+    if count:
+        yield dagPaths
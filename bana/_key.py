@@ -0,0 +1,138 @@
+"""Hashable keys identifying the scene nodes.
+
+The ``__hash__`` methods of the ``MObject``, ``MDagPath``, and
+``MFnDependencyNode`` classes need to create a new handle each time that they
+are called since these objects can be modified in place to point to other
+nodes. The keys defined here are instead bound to a single node for their
+whole life, which allows them to compute their hash value only once.
+
+A key remains usable after its node got deleted, but it is then only equal to
+itself, even if the memory of the deleted node gets reused by a new node with
+the same hash code. The same goes for the keys of DAG paths that are not valid
+anymore, such as after one of their DAG nodes got reparented.
+"""
+
+from maya import OpenMaya
+
+
+class NodeKey(object):
+    """Key identifying a DG node.
+
+    Parameters
+    ----------
+    obj : maya.OpenMaya.MObject
+        DG node to identify.
+    """
+
+    __slots__ = ('_handle', '_hash',)
+
+    def __init__(self, obj):
+        """Bind the key to a DG node."""
+        self._handle = OpenMaya.MObjectHandle(obj)
+        self._hash = self._handle.hashCode()
+
+    def __hash__(self):
+        """Retrieve the hash value computed when creating the key."""
+        return self._hash
+
+    def __eq__(self, other):
+        """Check if another key identifies the same node."""
+        if other is self:
+            return True
+
+        return (type(other) is NodeKey
+                and self._hash == other._hash
+                and self._handle.isValid()
+                and other._handle.isValid()
+                and self._handle.object() == other._handle.object())
+
+    def __ne__(self, other):
+        """Check if another key identifies a different node."""
+        return not self == other
+
+    def isValid(self):
+        """Check if the node still exists.
+
+        Returns
+        -------
+        bool
+            True if the node has not been deleted.
+        """
+        return self._handle.isValid()
+
+    def object(self):
+        """Retrieve the node.
+
+        Returns
+        -------
+        maya.OpenMaya.MObject
+            The node, or ``None`` if it has been deleted.
+        """
+        if not self._handle.isValid():
+            return None
+
+        return self._handle.object()
+
+
+class DagPathKey(object):
+    """Key identifying a DAG path.
+
+    The instances of a same DAG node are identified by different keys, with
+    their hash value matching the one of their DAG path.
+
+    Parameters
+    ----------
+    dagPath : maya.OpenMaya.MDagPath
+        DAG path to identify. A copy of it is stored.
+    """
+
+    __slots__ = ('_handle', '_dagPath', '_hash',)
+
+    def __init__(self, dagPath):
+        """Bind the key to a DAG path."""
+        self._dagPath = OpenMaya.MDagPath(dagPath)
+        self._handle = OpenMaya.MObjectHandle(dagPath.node())
+        self._hash = hash((self._handle.hashCode(), dagPath.instanceNumber()))
+
+    def __hash__(self):
+        """Retrieve the hash value computed when creating the key."""
+        return self._hash
+
+    def __eq__(self, other):
+        """Check if another key identifies the same DAG path."""
+        if other is self:
+            return True
+
+        return (type(other) is DagPathKey
+                and self._hash == other._hash
+                and self.isValid()
+                and other.isValid()
+                and self._dagPath == other._dagPath)
+
+    def __ne__(self, other):
+        """Check if another key identifies a different DAG path."""
+        return not self == other
+
+    def isValid(self):
+        """Check if the DAG path still leads to its DAG node.
+
+        Returns
+        -------
+        bool
+            True if the DAG node has not been deleted and the DAG path has
+            not been invalidated, such as by reparenting one of its nodes.
+        """
+        return self._handle.isValid() and self._dagPath.isValid()
+
+    def dagPath(self):
+        """Retrieve the DAG path.
+
+        Returns
+        -------
+        maya.OpenMaya.MDagPath
+            A copy of the DAG path, or ``None`` if it is not valid anymore.
+        """
+        if not self.isValid():
+            return None
+
+        return OpenMaya.MDagPath(self._dagPath)
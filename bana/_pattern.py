@@ -6,7 +6,18 @@
 # prove it, right? Anyways, you've been warned. Send complaints directly to
 # whoever wrote Maya and thought of inconsistency as a form of art.
 
+import atexit
+import collections
+import io
+import itertools
+import json
+import multiprocessing
+import os
 import re
+import threading
+
+import bana
+import bana._automaton
 
 
 # Enumerator for the pattern matching contexts.
@@ -80,6 +91,320 @@ _COLLAPSE_WHEN_NULL = (
     (r'->', r'->'),
 )
 _REMOVE_ROOT_NAMESPACE_WCARD_OBJ = re.compile(r'(\^|(?:\\\|)):')
+_WCARDS_SPLIT_OBJ = re.compile(r'[*+?.]+')
+_LEADING_DELIMITER_OBJ = re.compile(r'^(?::|\||->)')
+_WCARDS_ONLY_OBJ = re.compile(r'^[*+?.]+$')
+_DEFAULT_CACHE_MAX_SIZE = 256
+# Maximum number of capturing groups supported by Python's `re` module.
+_MAX_GROUPS = 99
+# Number of chunks handed to each worker process when filtering in parallel.
+_CHUNKS_PER_WORKER = 4
+# Maximum complexity of the patterns that are matched with regular
+# expressions when no engine is explicitly requested.
+_MAX_COMPLEXITY = 2
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', (
+        'hits',
+        'misses',
+        'evictions',
+        'size',
+        'maxSize',
+    )
+)
+
+
+class _LRUCache(object):
+    """Bounded and thread-safe least recently used cache."""
+
+    def __init__(self, maxSize):
+        self._lock = threading.Lock()
+        self._items = collections.OrderedDict()
+        self._maxSize = maxSize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is None:
+                self._misses += 1
+                return None
+
+            # Reinsert the item to mark it as being the most recently used.
+            self._items[key] = value
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if self._maxSize == 0:
+                return
+
+            self._items.pop(key, None)
+            self._items[key] = value
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def resize(self, maxSize):
+        with self._lock:
+            self._maxSize = maxSize
+            self._evict()
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses,
+                             evictions=self._evictions,
+                             size=len(self._items), maxSize=self._maxSize)
+
+    def _evict(self):
+        while len(self._items) > self._maxSize:
+            self._items.popitem(last=False)
+            self._evictions += 1
+
+
+class _ExpressionCache(object):
+    """Thread-safe store of expressions that can be persisted to a file."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fileName = None
+        self._items = {}
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def fileName(self):
+        return self._fileName
+
+    def setFileName(self, fileName):
+        with self._lock:
+            self._fileName = fileName
+            self._items = {}
+            self._loaded = False
+            self._dirty = False
+
+    def get(self, key, function):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            value = self._items.get(key)
+            if value is None:
+                value = self._items[key] = function(*key)
+                self._dirty = True
+
+            return value
+
+    def save(self):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            if not self._dirty:
+                return
+
+            data = {
+                'version': bana.__version__,
+                'expressions': [key + (value,)
+                                for key, value in self._items.items()],
+            }
+
+            # Write to a temporary file first so that other sessions never
+            # read an incomplete file.
+            tempFileName = '%s.%d.tmp' % (self._fileName, os.getpid())
+            try:
+                with io.open(tempFileName, 'wb') as f:
+                    f.write(json.dumps(data).encode('utf-8'))
+
+                try:
+                    os.rename(tempFileName, self._fileName)
+                except OSError:
+                    # Renaming onto an existing file is not allowed on
+                    # Windows.
+                    os.remove(self._fileName)
+                    os.rename(tempFileName, self._fileName)
+            except Exception:
+                if os.path.exists(tempFileName):
+                    os.remove(tempFileName)
+
+                raise
+
+            self._dirty = False
+
+    def _load(self):
+        # The expressions from a missing, unreadable, or outdated file are
+        # simply built again.
+        self._loaded = True
+        try:
+            with io.open(self._fileName, 'rb') as f:
+                data = json.loads(f.read().decode('utf-8'))
+        except (EnvironmentError, ValueError):
+            return
+
+        if (not isinstance(data, dict)
+                or data.get('version') != bana.__version__):
+            return
+
+        # A malformed file is ignored as a whole rather than partially loaded.
+        items = {}
+        try:
+            for pattern, context, matchRelative, value in data['expressions']:
+                items[(pattern, context, matchRelative)] = value
+        except (KeyError, TypeError, ValueError):
+            return
+
+        items.update(self._items)
+        self._items = items
+
+
+class _WorkerPool(object):
+    """Thread-safe pool of worker processes reused across calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._size = 0
+
+    def map(self, function, items, size):
+        with self._lock:
+            if self._pool is None or self._size != size:
+                self._close()
+                self._pool = multiprocessing.Pool(size)
+                self._size = size
+
+            return self._pool.map(function, items)
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._size = 0
+
+
+_cache = _LRUCache(_DEFAULT_CACHE_MAX_SIZE)
+_levelsCache = _LRUCache(_DEFAULT_CACHE_MAX_SIZE)
+_expressionCache = _ExpressionCache()
+_workerPool = _WorkerPool()
+atexit.register(_workerPool.close)
+
+
+def getCacheInfo():
+    """Retrieve the statistics of the match functions cache.
+
+    Returns
+    -------
+    bana._pattern.CacheInfo
+        The number of hits, misses, and evictions that occurred since the
+        cache was last cleared, as well as its current and maximum sizes.
+    """
+    return _cache.info()
+
+
+def setCacheMaxSize(maxSize):
+    """Set the maximum number of match functions to keep in the cache.
+
+    The least recently used match functions are evicted if the cache
+    currently holds more items than allowed.
+
+    Parameters
+    ----------
+    maxSize : int
+        Maximum number of match functions to cache. A value of 0 disables the
+        cache.
+
+    Raises
+    ------
+    ValueError
+        The maximum size is negative.
+    """
+    if maxSize < 0:
+        raise ValueError("The cache size '%s' is not valid." % (maxSize,))
+
+    _cache.resize(maxSize)
+
+
+def clearCache():
+    """Empty the match functions cache and reset its statistics."""
+    _cache.clear()
+    _levelsCache.clear()
+
+
+def setWorkerExecutable(fileName):
+    """Set the Python interpreter that the worker processes are to run.
+
+    The worker processes filtering strings in parallel are started from the
+    current process. On Windows, they run the same executable as the current
+    process by default, which is ``maya.exe`` within Maya's interface, so they
+    need to be pointed to a plain Python interpreter such as ``mayapy.exe``.
+    On other platforms, they are forked from the current process, including
+    all of Maya's state, and this setting has no effect.
+
+    The pool currently running, if any, is closed so that the new executable
+    is used from the next call onwards.
+
+    Parameters
+    ----------
+    fileName : str
+        Path of the Python interpreter.
+    """
+    _workerPool.close()
+    multiprocessing.set_executable(fileName)
+
+
+def closeWorkerPool():
+    """Terminate the worker processes filtering strings in parallel.
+
+    The pool is otherwise kept alive until the interpreter exits, and it is
+    started again the next time that strings are filtered in parallel.
+    """
+    _workerPool.close()
+
+
+def setExpressionCacheFile(fileName):
+    """Set the file persisting the expressions translated from patterns.
+
+    The expressions previously saved into the file are loaded the next time
+    that a pattern is translated, which is then skipped for the patterns
+    found. The file is discarded if it was saved by another version of this
+    library.
+
+    Parameters
+    ----------
+    fileName : str
+        Path of the file. None to stop persisting the expressions.
+    """
+    _expressionCache.setFileName(fileName)
+
+
+def saveExpressionCache():
+    """Save the expressions translated so far into the cache file.
+
+    Nothing is written if no new expression was translated since the file was
+    loaded or last saved.
+
+    Raises
+    ------
+    RuntimeError
+        No cache file is set.
+    """
+    if _expressionCache.fileName is None:
+        raise RuntimeError("No expression cache file is set.")
+
+    _expressionCache.save()
 
 
 def hasWildcards(pattern):
@@ -98,11 +423,125 @@ def hasWildcards(pattern):
     return bool(_WCARD_OBJ.search(pattern))
 
 
-def makeMatchFunction(pattern, context, matchRelative=False):
+def normalize(pattern, context):
+    """Rewrite a pattern into its canonical form.
+
+    The pattern needs to be strictly well-formed.
+
+    Only the number of occurrences that a group of wildcards allows matters,
+    not the wildcards making it, so each group is rewritten with a minimal
+    number of wildcards. Groups allowing an unbounded number of occurrences
+    are rewritten as any ``.`` wildcards followed by either a ``*`` or a ``+``
+    wildcard, and the other groups as any ``.`` wildcards followed by any
+    ``?`` wildcards.
+
+    The delimiters are left untouched since they define the context of the
+    wildcards surrounding them. For example, the patterns ``|:*`` and ``|*``
+    respectively match namespaces and levels of hierarchy.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to normalize.
+    context : int
+        Global context in which the pattern is used. The canonical form does
+        not depend on it, it is only accepted for symmetry with the other
+        functions taking a pattern.
+
+    Returns
+    -------
+    str
+        The canonical form of the pattern.
+    """
+    del context
+    if not hasWildcards(pattern):
+        return pattern
+
+    def replace(match):
+        ms, ns = zip(*[_WCARD_OCCURRENCE_RANGES[wildcard]
+                       for wildcard in match.group()])
+        m = sum(ms)
+        if None in ns:
+            return '.' * (m - 1) + '+' if m else '*'
+
+        return '.' * m + '?' * (sum(ns) - m)
+
+    return _WCARDS_SPLIT_OBJ.sub(replace, pattern)
+
+
+def measureComplexity(pattern, context):
+    """Measure how costly matching a pattern with a regular expression can be.
+
+    The pattern needs to be strictly well-formed.
+
+    Each group of wildcards allowing an unbounded number of namespaces,
+    hierarchy levels, or underworlds translates into a nested repetition.
+    When a string fails to match, the regular expression can backtrack
+    through every way of splitting it among these repetitions, in a time
+    growing polynomially with the length of the string, the degree being
+    their number.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to measure.
+    context : int
+        Global context in which the pattern is used.
+
+    Returns
+    -------
+    int
+        The number of groups of wildcards matching an unbounded number of
+        namespaces, hierarchy levels, or underworlds.
+    """
+    out = 0
+    pattern = r'^%s$' % (pattern.replace('|', r'\|'),)
+    for match in _WCARD_ITER_OBJ.finditer(pattern):
+        before, wildcards, after = match.groups()
+        if '*' not in wildcards and '+' not in wildcards:
+            continue
+
+        groupContext = context
+        if before != r'^' or after != r'$':
+            groupContext = min(_WCARD_CONTEXTS.get(before, CONTEXT_NAME),
+                               _WCARD_CONTEXTS.get(after, CONTEXT_NAME))
+
+        if groupContext != CONTEXT_NAME:
+            out += 1
+
+    return out
+
+
+def isComplex(pattern, context):
+    """Check if a pattern is too complex for a regular expression.
+
+    The pattern needs to be strictly well-formed.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to check.
+    context : int
+        Global context in which the pattern is used.
+
+    Returns
+    -------
+    bool
+        True if the pattern is to be matched with a deterministic finite
+        automaton when no engine is explicitly requested.
+    """
+    return measureComplexity(pattern, context) > _MAX_COMPLEXITY
+
+
+def makeMatchFunction(pattern, context, matchRelative=False,
+                      deterministic=None, budget=None):
     """Create a match function from a pattern.
 
     The pattern needs to be strictly well-formed.
 
+    Match functions are cached, meaning that building the same pattern again
+    within a same context returns the function previously created.
+
     Parameters
     ----------
     pattern : str
@@ -113,20 +552,451 @@ def makeMatchFunction(pattern, context, matchRelative=False):
         True to allow matching relatively to a parent namespace or path. That
         is, full names starting with the delimiter ``:`` and full paths
         starting with the delimiter ``->`` are allowed.
+    deterministic : bool
+        True to match with a deterministic finite automaton, which runs in a
+        time linear to the length of the strings, rather than with a regular
+        expression, which might backtrack. None to only use the automaton if
+        the pattern is complex, as defined by :func:`isComplex`.
+    budget : float
+        Maximum time, in seconds, that matching a string is allowed to take,
+        or None for no limit. Regular expressions cannot be interrupted, so
+        setting a budget implies using the automaton.
 
     Returns
     -------
     function
         The matching function, evaluating to True or False in a boolean
-        operation.
+        operation. If a budget is set, it raises a ``RuntimeError`` when a
+        match exceeds it.
     """
+    if budget is not None:
+        deterministic = True
+
+    key = (pattern, context, matchRelative, deterministic, budget)
+    function = _cache.get(key)
+    if function is None:
+        # Equivalent patterns share the same match function. The pattern is
+        # only normalized on a miss, and the function is then stored under
+        # both the pattern given and its canonical form.
+        normalized = normalize(pattern, context)
+        if normalized == pattern:
+            function = _buildMatchFunction(*key)
+        else:
+            normalizedKey = (normalized,) + key[1:]
+            function = _cache.get(normalizedKey)
+            if function is None:
+                function = _buildMatchFunction(*normalizedKey)
+                _cache.set(normalizedKey, function)
+
+        _cache.set(key, function)
+
+    return function
+
+
+def _buildMatchFunction(pattern, context, matchRelative, deterministic,
+                        budget):
     if not hasWildcards(pattern):
-        # Conversion to unicode is required because Maya's MString are
-        # stored as unicode and Python ASCII strings can only compare to ASCII,
-        # not to unicode, whereas a unicode string can compare to both ASCII
-        # and unicode.
+        # Conversion to unicode is required because Maya's MString are stored
+        # as unicode and Python ASCII strings can only compare to ASCII, not
+        # to unicode, whereas a unicode string can compare to both ASCII and
+        # unicode.
         return unicode(pattern).__eq__
 
+    expression = makeExpression(pattern, context, matchRelative=matchRelative)
+    prefix, suffix, substrings = extractLiterals(pattern)
+    if deterministic is None:
+        deterministic = isComplex(pattern, context)
+
+    if deterministic:
+        automaton = bana._automaton.Automaton(expression)
+        if budget is None:
+            function = automaton.match
+        else:
+            def function(string):
+                return automaton.match(string, budget=budget)
+
+        # Searching for the substrings could take longer than running the
+        # automaton, only the ends are checked.
+        return _prefilter(function, prefix, suffix, ())
+
+    return _prefilter(re.compile(expression).match, prefix, suffix,
+                      substrings)
+
+
+def extractLiterals(pattern):
+    """Extract the literal parts that any string matching a pattern contains.
+
+    The pattern needs to be strictly well-formed.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to extract the literals from.
+
+    Returns
+    -------
+    tuple (str, str, tuple of str)
+        The prefix that the matching strings start with, the suffix that they
+        end with, and the substrings that they contain in between. Each of
+        these can be empty.
+    """
+    # The delimiter found right after a group of wildcards is dropped when
+    # the wildcards match no occurrence, and so is the `:` delimiter leading
+    # a namespace made of wildcards, or marking a relative full name. Leaving
+    # these delimiters out keeps the literals safe to test against.
+    segments = _WCARDS_SPLIT_OBJ.split(pattern)
+    if len(segments) == 1:
+        return (pattern, pattern, ())
+
+    substrings = []
+    prefix = segments[0]
+    if prefix.endswith(':'):
+        prefix = prefix[:-1]
+
+    if prefix.startswith(':'):
+        # The prefix might or might not be preceded by the relative marker.
+        if len(prefix) > 1:
+            substrings.append(prefix[1:])
+
+        prefix = ''
+
+    suffix = _LEADING_DELIMITER_OBJ.sub(r'', segments[-1])
+
+    for segment in segments[1:-1]:
+        segment = _LEADING_DELIMITER_OBJ.sub(r'', segment)
+        if segment.endswith(':'):
+            segment = segment[:-1]
+
+        if segment:
+            substrings.append(segment)
+
+    return (prefix, suffix, tuple(substrings))
+
+
+def extractRoot(pattern):
+    """Extract the literal path that any path matching a pattern descends from.
+
+    The pattern needs to be strictly well-formed and to describe either
+    *paths* or *full paths*, non relative.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to extract the root from.
+
+    Returns
+    -------
+    str
+        The *path* made of the leading elements of the pattern that do not
+        contain any wildcard, which the matching paths either descend from or
+        are equal to. An empty string is returned if the pattern starts with
+        wildcards.
+    """
+    if not hasWildcards(pattern):
+        return pattern.split('->', 1)[0]
+
+    prefix = extractLiterals(pattern)[0]
+    if '->' in prefix:
+        return prefix.split('->', 1)[0]
+
+    return prefix[:prefix.rfind('|')] if prefix.startswith('|') else r''
+
+
+def extractLeaf(pattern):
+    """Extract the pattern matched by the name of any path matching a pattern.
+
+    The pattern needs to be strictly well-formed and to describe either
+    *paths* or *full paths*, relative or not.
+
+    Only the last element of the pattern is inspected, that is the part found
+    after the last ``|`` delimiter. If it is not solely made of wildcards, its
+    wildcards cannot span over several levels of hierarchy and it then
+    describes the *full name* of the last node of the matching paths.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to extract the leaf from.
+
+    Returns
+    -------
+    str
+        The *full name* pattern that the last node of the paths matching the
+        pattern matches. An empty string is returned if the last element can
+        match any node, or if it is an underworld.
+    """
+    leaf = pattern[pattern.rfind('|') + 1:]
+    if not leaf or '->' in leaf or _WCARDS_ONLY_OBJ.match(leaf):
+        return r''
+
+    return leaf
+
+
+def _prefilter(function, prefix, suffix, substrings):
+    # Wrap a match function to reject early the strings not containing the
+    # literals of the pattern, using string methods that are much cheaper
+    # than running the regular expression.
+    if len(substrings) > 1:
+        def match(string):
+            return (string.startswith(prefix)
+                    and string.endswith(suffix)
+                    and all(substring in string for substring in substrings)
+                    and function(string))
+    elif substrings:
+        substring = substrings[0]
+
+        def match(string):
+            return (substring in string
+                    and string.startswith(prefix)
+                    and string.endswith(suffix)
+                    and function(string))
+    elif prefix and suffix:
+        def match(string):
+            return (string.startswith(prefix)
+                    and string.endswith(suffix)
+                    and function(string))
+    elif prefix:
+        def match(string):
+            return string.startswith(prefix) and function(string)
+    elif suffix:
+        def match(string):
+            return string.endswith(suffix) and function(string)
+    else:
+        match = function
+
+    return match
+
+
+def splitLevels(pattern, context=CONTEXT_PATH):
+    """Split the leading elements of a pattern matching a single level each.
+
+    The pattern needs to be strictly well-formed and to describe either
+    *full names*, when the context is ``CONTEXT_FULL_NAME``, or *paths* or
+    *full paths*, when the context is ``CONTEXT_PATH``, non relative.
+
+    A level is a namespace for the *full names*, and a hierarchy level for the
+    *paths*. The leading elements of the pattern that always match exactly one
+    level, that is the ones not solely made of wildcards or the ones made of a
+    single ``.`` wildcard, are returned in order. The elements of a *full
+    path* that are located after the first underworld delimiter are never
+    considered.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to split.
+    context : int
+        Either ``CONTEXT_FULL_NAME`` or ``CONTEXT_PATH``.
+
+    Returns
+    -------
+    list of tuple (str, function)
+        The segment and the match function for each level. The segment is the
+        literal text of the element, delimiter included, or None if it contains
+        wildcards. The function matches the strings made of all the levels up
+        to the current one included.
+    """
+    # The levels are cached separately from the match functions built for
+    # the users, which would otherwise get evicted by the functions of each
+    # prefix.
+    key = (pattern, context)
+    levels = _levelsCache.get(key)
+    if levels is not None:
+        return levels
+
+    if context == CONTEXT_FULL_NAME:
+        tokens = pattern.split(':')
+        delimiter = r':'
+    else:
+        tokens = pattern.split('->', 1)[0].split('|')
+        delimiter = r'|'
+
+    if tokens[0]:
+        # Leading element that is not preceded by a delimiter.
+        delimiters = itertools.chain((r'',), itertools.repeat(delimiter))
+    elif context == CONTEXT_FULL_NAME:
+        # Namespace construct.
+        return []
+    else:
+        tokens = tokens[1:]
+        delimiters = itertools.repeat(delimiter)
+
+    levels = []
+    prefix = r''
+    for token, delimiter in zip(tokens, delimiters):
+        if _WCARDS_ONLY_OBJ.match(token) and token != '.':
+            # The wildcards can span any number of levels.
+            break
+
+        segment = delimiter + token
+        prefix += segment
+        levels.append((None if hasWildcards(segment) else segment,
+                       _buildMatchFunction(normalize(prefix, context),
+                                           context, False, None, None)))
+
+    _levelsCache.set(key, levels)
+    return levels
+
+
+def makePrefixMatchFunction(pattern):
+    """Create a function matching the ancestors of the paths to match.
+
+    The pattern needs to be strictly well-formed and to describe either
+    *paths* or *full paths*, non relative.
+
+    The levels returned by :func:`splitLevels` each come with a function
+    matching the paths of their depth. Any path not matching the function
+    corresponding to its depth cannot have any of its descendants matching
+    the pattern, neither can it match itself.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to build.
+
+    Returns
+    -------
+    tuple (int, function)
+        The number of levels of hierarchy covered, and the function. This
+        function expects a single parameter, that is the path to check, and
+        returns False only if neither the path nor its descendants can match
+        the pattern. The number of levels is 0 and the function is None if no
+        such check can be done.
+    """
+    functions = [function for _, function in splitLevels(pattern)]
+    if not functions:
+        return (0, None)
+
+    count = len(functions)
+
+    def match(path):
+        depth = path.count('|')
+        if depth > count or depth == 0 or '->' in path:
+            return True
+
+        return functions[depth - 1](path)
+
+    return (count, match)
+
+
+def makeMultiMatchFunction(patterns, context, matchRelative=False):
+    """Create a function matching a string against many patterns at once.
+
+    The patterns need to be strictly well-formed.
+
+    The expressions of all the patterns are merged into a single regular
+    expression where each pattern is tested through a lookahead assertion
+    capturing into its own named group, so that a string is scanned once
+    rather than once per pattern. Complex patterns, as defined by
+    :func:`isComplex`, are instead left out of the merged expression and
+    matched with their own deterministic finite automaton.
+
+    Parameters
+    ----------
+    patterns : sequence of str
+        Patterns to match against.
+    context : int
+        Global context in which the patterns are used.
+    matchRelative : bool
+        True to allow matching relatively to a parent namespace or path.
+
+    Returns
+    -------
+    function
+        The matching function, returning the list of patterns that match the
+        string given, in the order in which they were defined. The list being
+        empty when no pattern matches, it also evaluates to True or False in a
+        boolean operation.
+    """
+    patterns = tuple(patterns)
+
+    # Equivalent patterns are only tested once, with the complex ones being
+    # tested after the others.
+    normalized = [normalize(pattern, context) for pattern in patterns]
+    simples = []
+    complexes = []
+    for pattern in collections.OrderedDict.fromkeys(normalized):
+        if isComplex(pattern, context):
+            complexes.append(pattern)
+        else:
+            simples.append(pattern)
+
+    uniques = simples + complexes
+    uniqueIndices = {pattern: i for i, pattern in enumerate(uniques)}
+    positions = [uniqueIndices[pattern] for pattern in normalized]
+
+    functions = []
+    for start in range(0, len(simples), _MAX_GROUPS):
+        expression = r''.join(
+            r'(?:(?=(?P<p%d>%s)))?' % (
+                i, makeExpression(pattern, context,
+                                  matchRelative=matchRelative))
+            for i, pattern in enumerate(simples[start:start + _MAX_GROUPS],
+                                        start))
+        functions.append(re.compile(expression).match)
+
+    automata = [makeMatchFunction(pattern, context,
+                                  matchRelative=matchRelative,
+                                  deterministic=True)
+                for pattern in complexes]
+    if len(functions) == 1 and not automata:
+        # Specific optimization for the most common case.
+        function = functions[0]
+
+        def getGroups(string):
+            return function(string).groups()
+    else:
+        def getGroups(string):
+            groups = ()
+            for function in functions:
+                groups += function(string).groups()
+
+            return groups + tuple(bool(automaton(string))
+                                  for automaton in automata)
+
+    # The groups capture whole strings that, being strictly well-formed, are
+    # never empty. Their truth value thus tells if their pattern matched.
+    if positions == list(range(len(patterns))):
+        def match(string):
+            return list(itertools.compress(patterns, getGroups(string)))
+    else:
+        def match(string):
+            groups = getGroups(string)
+            return [pattern for pattern, position in zip(patterns, positions)
+                    if groups[position]]
+
+    return match
+
+
+def makeExpression(pattern, context, matchRelative=False):
+    """Translate a pattern into a regular expression.
+
+    The pattern needs to be strictly well-formed.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to translate.
+    context : int
+        Global context in which the pattern is used.
+    matchRelative : bool
+        True to allow matching relatively to a parent namespace or path.
+
+    Returns
+    -------
+    str
+        The regular expression, anchored at both ends with ``^`` and ``$``.
+    """
+    if not hasWildcards(pattern):
+        return r'^%s$' % (re.escape(pattern),)
+
+    if _expressionCache.fileName is None:
+        return _translate(pattern, context, matchRelative)
+
+    return _expressionCache.get((pattern, context, matchRelative), _translate)
+
+
+def _translate(pattern, context, matchRelative):
     pattern = r'^%s$' % (pattern.replace('|', r'\|'),)
 
     # NOTE: although a regular expression `r'ab{0,0}'` yields the exact same
@@ -225,4 +1095,129 @@ def makeMatchFunction(pattern, context, matchRelative=False):
     else:
         pattern = _REMOVE_ROOT_NAMESPACE_WCARD_OBJ.sub(r'\1', pattern)
 
-    return re.compile(pattern).match
+    return pattern
+
+
+def _filter(obj, items, indices):
+    buffer = u'\n'.join(items)
+    if not buffer:
+        return []
+
+    if not indices:
+        # The expressions generated do not contain any capturing group,
+        # the whole matches are returned.
+        return obj.findall(buffer)
+
+    out = []
+    index = 0
+    pos = 0
+    count = buffer.count
+    for match in obj.finditer(buffer):
+        start = match.start()
+        index += count(u'\n', pos, start)
+        pos = start
+        out.append(index)
+
+    return out
+
+
+def _filterDeterministic(automaton, items, indices):
+    match = automaton.match
+    if indices:
+        return [i for i, item in enumerate(items) if match(item)]
+
+    return [item for item in items if match(item)]
+
+
+def _filterChunk(args):
+    # Entry point of the worker processes. Only the source of the expression
+    # is sent over, the workers compile it on their side.
+    expression, deterministic, items, indices, offset = args
+    if deterministic:
+        out = _filterDeterministic(bana._automaton.Automaton(expression),
+                                   items, indices)
+    else:
+        out = _filter(re.compile(expression, re.MULTILINE), items, indices)
+
+    if indices and offset:
+        out = [index + offset for index in out]
+
+    return out
+
+
+def makeFilterFunction(pattern, context, matchRelative=False):
+    """Create a function filtering a sequence of strings with a pattern.
+
+    The pattern needs to be strictly well-formed.
+
+    The strings to filter are joined into a single newline-delimited buffer
+    that is then scanned in one pass, which is faster than calling a match
+    function for each string. Complex patterns, as defined by
+    :func:`isComplex`, are instead matched against each string with a
+    deterministic finite automaton.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern to match against.
+    context : int
+        Global context in which the pattern is used.
+    matchRelative : bool
+        True to allow matching relatively to a parent namespace or path.
+
+    Returns
+    -------
+    function
+        The filtering function, expecting a sequence of strictly well-formed
+        strings, an optional boolean ``indices``, and an optional number of
+        ``workers``. It returns a list with either the matching strings, or
+        their indices if ``indices`` is True. If ``workers`` is greater than
+        1, the strings are split into chunks that are filtered in parallel by
+        a pool of as many processes. It raises a ``ValueError`` if
+        ``workers`` is lower than 1.
+
+    Note
+    ----
+    The pool of worker processes is started on the first parallel call and
+    kept alive for the next ones, being restarted only if the number of
+    workers requested changes. Within Maya, the workers are forked from the
+    Maya process itself, or run Maya's executable on Windows unless
+    :func:`setWorkerExecutable` is called. See :func:`closeWorkerPool` to
+    release them.
+    """
+    expression = makeExpression(pattern, context, matchRelative=matchRelative)
+    deterministic = isComplex(pattern, context)
+    if deterministic:
+        # Scanning a buffer with a regular expression prone to backtracking
+        # is replaced with running an automaton over each string.
+        automaton = bana._automaton.Automaton(expression)
+
+        def filterItems(items, indices):
+            return _filterDeterministic(automaton, items, indices)
+    else:
+        # The expressions generated never match any newline character, so
+        # each match is guaranteed to span exactly one line of the buffer.
+        obj = re.compile(expression, re.MULTILINE)
+
+        def filterItems(items, indices):
+            return _filter(obj, items, indices)
+
+    def filter(items, indices=False, workers=None):
+        if workers is None:
+            return filterItems(items, indices)
+
+        if workers < 1:
+            raise ValueError("The number of workers '%s' is not valid."
+                             % (workers,))
+
+        items = list(items)
+        size = -(-len(items) // (workers * _CHUNKS_PER_WORKER))
+        if workers == 1 or size == 0 or size == len(items):
+            return filterItems(items, indices)
+
+        chunks = [(expression, deterministic, items[i:i + size], indices, i)
+                  for i in range(0, len(items), size)]
+        results = _workerPool.map(_filterChunk, chunks, workers)
+        return list(itertools.chain.from_iterable(results))
+
+    return filter
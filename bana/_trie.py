@@ -0,0 +1,148 @@
+"""Prefix tree of strings split into segments."""
+
+
+class _Node(object):
+
+    __slots__ = ('key', 'children', 'isKey',)
+
+    def __init__(self, key):
+        self.key = key
+        self.children = {}
+        self.isKey = False
+
+
+class Trie(object):
+    """Set of strings stored as a tree of segments.
+
+    Each node of the tree represents the string made of all the segments
+    leading to it, such as the namespaces of a full name or the ancestors of
+    a path, and is flagged if that string is part of the set.
+
+    Parameters
+    ----------
+    split : function
+        Function splitting a string into its segments. The concatenation of
+        the segments needs to give back the string.
+    """
+
+    def __init__(self, split):
+        """Create an empty set."""
+        self._split = split
+        self._root = _Node('')
+        self._size = 0
+
+    def __contains__(self, key):
+        """Check if a string is part of the set."""
+        node = self._root
+        for segment in self._split(key):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+
+        return node.isKey
+
+    def __len__(self):
+        """Count the strings of the set."""
+        return self._size
+
+    def add(self, key):
+        """Add a string.
+
+        Parameters
+        ----------
+        key : str
+            String to add.
+        """
+        node = self._root
+        for segment in self._split(key):
+            child = node.children.get(segment)
+            if child is None:
+                child = _Node(node.key + segment)
+                node.children[segment] = child
+
+            node = child
+
+        if not node.isKey:
+            node.isKey = True
+            self._size += 1
+
+    def remove(self, key):
+        """Remove a string.
+
+        Parameters
+        ----------
+        key : str
+            String to remove.
+
+        Raises
+        ------
+        KeyError
+            The string is not part of the set.
+        """
+        nodes = [self._root]
+        segments = self._split(key)
+        for segment in segments:
+            node = nodes[-1].children.get(segment)
+            if node is None:
+                raise KeyError(key)
+
+            nodes.append(node)
+
+        node = nodes[-1]
+        if not node.isKey:
+            raise KeyError(key)
+
+        node.isKey = False
+        self._size -= 1
+
+        # Drop the nodes that are not leading to any string anymore.
+        for segment in reversed(segments):
+            node = nodes.pop()
+            if node.isKey or node.children:
+                break
+
+            del nodes[-1].children[segment]
+
+    def clear(self):
+        """Remove all the strings."""
+        self._root = _Node('')
+        self._size = 0
+
+    def walk(self, levels=()):
+        """Iterate over the strings, descending only into the matching levels.
+
+        Parameters
+        ----------
+        levels : sequence of tuple (str, function)
+            Constraints for each of the leading levels of the tree, as
+            returned by :func:`bana._pattern.splitLevels`. The children of a
+            level having a segment defined are directly looked up, otherwise
+            the function is called with the string of each child and only the
+            ones for which it returns True are descended into. The strings
+            having less segments than the number of levels are skipped.
+
+        Yields
+        ------
+        str
+            The strings found.
+        """
+        nodes = [self._root]
+        for segment, match in levels:
+            if segment is None:
+                nodes = [child for node in nodes
+                         for child in node.children.values()
+                         if match(child.key)]
+            else:
+                nodes = [node.children[segment] for node in nodes
+                         if segment in node.children]
+
+            if not nodes:
+                return
+
+        nodes.reverse()
+        while nodes:
+            node = nodes.pop()
+            if node.isKey:
+                yield node.key
+
+            nodes.extend(node.children.values())
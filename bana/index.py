@@ -0,0 +1,544 @@
+"""Persistent index of the scene nodes.
+
+Retrieving nodes through the ``bnFind`` methods requires walking the scene,
+or a branch of it, each time. When the same scene is queried many times, the
+index defined here can be enabled for these methods to be answered from a set
+of lookup tables instead.
+
+The index is kept up-to-date through Maya's message callbacks. These only
+record the nodes that changed and the tables are updated on the next query, so
+that bulk edits of the scene don't pay for intermediate states.
+"""
+
+import collections
+import re
+
+from maya import OpenMaya
+
+import bana._key
+import bana._pattern
+import bana._trie
+
+
+_FULL_NAME_SPLIT_OBJ = re.compile(r':?[^:]+')
+_FULL_PATH_SPLIT_OBJ = re.compile(r'(?:->)?\|.*?(?=->|\||$)|->$')
+
+
+_index = None
+
+
+class _Index(object):
+    """Lookup tables of the scene nodes.
+
+    Nodes are identified by their key, compared through their handle since
+    different nodes can share a same hash code. A single key object is kept
+    per node so that the entries of a deleted node, whose key is then only
+    equal to itself, can still be found. The tables map the full names to the
+    nodes, and the full paths of the DAG nodes to their DAG path.
+
+    The full names and full paths are also stored in prefix trees split
+    respectively at each namespace and at each level of hierarchy, allowing
+    the patterns starting with some fixed levels to only look at the matching
+    branches.
+
+    Nodes are also bucketed by function set type. A bucket is only built the
+    first time that its type is queried, after which it is kept up-to-date
+    alongside the other tables.
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._names = collections.OrderedDict()
+        self._nodeNames = {}
+        self._paths = collections.OrderedDict()
+        self._nodePaths = {}
+        self._nameTrie = bana._trie.Trie(_FULL_NAME_SPLIT_OBJ.findall)
+        self._pathTrie = bana._trie.Trie(_FULL_PATH_SPLIT_OBJ.findall)
+        self._types = {}
+        self._dirty = collections.OrderedDict()
+        self._removed = set()
+        self._stale = True
+        self._callbackIds = []
+
+    def install(self):
+        """Register the message callbacks."""
+        ids = self._callbackIds
+        ids.append(OpenMaya.MDGMessage.addNodeAddedCallback(
+            self._onNodeAdded, 'dependNode'))
+        ids.append(OpenMaya.MDGMessage.addNodeRemovedCallback(
+            self._onNodeRemoved, 'dependNode'))
+        ids.append(OpenMaya.MNodeMessage.addNameChangedCallback(
+            OpenMaya.MObject(), self._onNameChanged))
+        ids.append(OpenMaya.MDagMessage.addParentAddedCallback(
+            self._onParentChanged))
+        ids.append(OpenMaya.MDagMessage.addParentRemovedCallback(
+            self._onParentChanged))
+        for message in (OpenMaya.MSceneMessage.kAfterNew,
+                        OpenMaya.MSceneMessage.kAfterOpen):
+            ids.append(OpenMaya.MSceneMessage.addCallback(
+                message, self._onSceneChanged))
+
+    def uninstall(self):
+        """Remove the message callbacks."""
+        for callbackId in self._callbackIds:
+            OpenMaya.MMessage.removeCallback(callbackId)
+
+        del self._callbackIds[:]
+
+    def update(self):
+        """Apply the changes recorded since the last update."""
+        if self._stale:
+            self._rebuild()
+            return
+
+        for key in self._removed:
+            self._unregister(key)
+
+        self._removed.clear()
+        while self._dirty:
+            key, _ = self._dirty.popitem(last=False)
+            if not key.isValid():
+                self._unregister(key)
+                continue
+
+            obj = key.object()
+            self._registerName(key, obj)
+            if obj.hasFn(OpenMaya.MFn.kDagNode):
+                self._refreshPaths(key, obj)
+
+    def findObjects(self, pattern=None, fnType=OpenMaya.MFn.kInvalid):
+        """Retrieve the nodes matching a full name pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Full name pattern of the nodes to match.
+        fnType : maya.OpenMaya.MFn.Type
+            Function set type to match.
+
+        Returns
+        -------
+        list of maya.OpenMaya.MObject
+            The nodes found.
+        """
+        self.update()
+        if pattern is not None:
+            # Validate the pattern.
+            OpenMaya.MGlobal.bnMakeMatchFullNameFunction(pattern)
+
+        names = self._names
+        bucket = (None if fnType == OpenMaya.MFn.kInvalid
+                  else self._getBucket(fnType))
+        hasWildcards = (pattern is not None
+                        and bana._pattern.hasWildcards(pattern))
+        levels = (bana._pattern.splitLevels(pattern,
+                                            bana._pattern.CONTEXT_FULL_NAME)
+                  if hasWildcards else [])
+        if pattern is not None and not hasWildcards:
+            # Literal names are looked up directly.
+            candidates = (pattern,) if pattern in names else ()
+        elif levels:
+            candidates = OpenMaya.MGlobal.bnFilterFullNames(
+                pattern, list(self._nameTrie.walk(levels)))
+        elif bucket is None:
+            candidates = (names if pattern is None
+                          else OpenMaya.MGlobal.bnFilterFullNames(
+                              pattern, list(names)))
+        else:
+            # Only the names of the nodes from the bucket need to be checked.
+            keys = list(bucket)
+            if pattern is not None:
+                nodeNames = self._nodeNames
+                indices = OpenMaya.MGlobal.bnFilterFullNames(
+                    pattern, [nodeNames[key] for key in keys], indices=True)
+                keys = [keys[i] for i in indices]
+
+            return [key.object() for key in keys]
+
+        keys = [key for name in candidates for key in names[name]]
+        if bucket is not None:
+            keys = [key for key in keys if key in bucket]
+
+        return [key.object() for key in keys]
+
+    def findDagPaths(self, pattern=None, fnType=OpenMaya.MFn.kInvalid,
+                     recursive=True, traverseUnderWorld=True, maxDepth=None,
+                     order=OpenMaya.MItDag.kDepthFirst):
+        """Retrieve the DAG paths matching a path or full path pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Path or full path pattern of the DAG paths to match.
+        fnType : maya.OpenMaya.MFn.Type
+            Function set type to match.
+        recursive : bool
+            ``False`` to only match the DAG paths directly under the world.
+        traverseUnderWorld : bool
+            ``True`` to match the DAG paths within the underworld.
+        maxDepth : int
+            Maximum depth of the DAG paths to match, or ``None`` for no limit.
+        order : maya.OpenMaya.MItDag.TraversalType
+            ``maya.OpenMaya.MItDag.kBreadthFirst`` to sort the DAG paths by
+            depth.
+
+        Returns
+        -------
+        list of maya.OpenMaya.MDagPath
+            The DAG paths found. They are owned by the index and must not be
+            modified.
+        """
+        self.update()
+        if pattern is not None:
+            # Validate the pattern.
+            if traverseUnderWorld:
+                OpenMaya.MGlobal.bnMakeMatchFullPathFunction(pattern)
+            else:
+                OpenMaya.MGlobal.bnMakeMatchPathFunction(pattern)
+
+        paths = self._paths
+        hasWildcards = (pattern is not None
+                        and bana._pattern.hasWildcards(pattern))
+        levels = bana._pattern.splitLevels(pattern) if hasWildcards else []
+        checkType = fnType != OpenMaya.MFn.kInvalid
+        if pattern is not None and not hasWildcards:
+            # Literal paths are looked up directly.
+            candidates = (pattern,) if pattern in paths else ()
+        elif levels:
+            candidates = self._pathTrie.walk(levels)
+        elif checkType:
+            nodePaths = self._nodePaths
+            candidates = [path for key in self._getBucket(fnType)
+                          for path in nodePaths.get(key, ())]
+            checkType = False
+        else:
+            candidates = paths
+
+        if not recursive:
+            candidates = [path for path in candidates
+                          if path.count('|') == 1 and '->' not in path]
+        elif not traverseUnderWorld:
+            candidates = [path for path in candidates if '->' not in path]
+
+        if maxDepth is not None:
+            candidates = [path for path in candidates
+                          if path.count('|') <= maxDepth]
+
+        if hasWildcards:
+            if traverseUnderWorld:
+                candidates = OpenMaya.MGlobal.bnFilterFullPaths(
+                    pattern, list(candidates))
+            else:
+                candidates = OpenMaya.MGlobal.bnFilterPaths(
+                    pattern, list(candidates))
+
+        if order == OpenMaya.MItDag.kBreadthFirst:
+            candidates = sorted(candidates, key=lambda path: path.count('|'))
+
+        dagPaths = [paths[path] for path in candidates]
+        if checkType:
+            dagPaths = [dagPath for dagPath in dagPaths
+                        if dagPath.hasFn(fnType)]
+
+        return dagPaths
+
+    def _rebuild(self):
+        self._keys.clear()
+        self._names.clear()
+        self._nodeNames.clear()
+        self._paths.clear()
+        self._nodePaths.clear()
+        self._nameTrie.clear()
+        self._pathTrie.clear()
+        self._types.clear()
+        self._dirty.clear()
+        self._removed.clear()
+
+        iterator = OpenMaya.MItDependencyNodes()
+        while not iterator.isDone():
+            obj = iterator.thisNode()
+            self._registerName(bana._key.NodeKey(obj), obj)
+            iterator.next()
+
+        iterator = OpenMaya.MItDag()
+        iterator.traverseUnderWorld(True)
+        iterator.next()
+        while not iterator.isDone():
+            dagPath = OpenMaya.MDagPath()
+            iterator.getPath(dagPath)
+            self._registerPath(dagPath)
+            iterator.next()
+
+        self._stale = False
+
+    def _getBucket(self, fnType):
+        bucket = self._types.get(fnType)
+        if bucket is None:
+            bucket = collections.OrderedDict(
+                (key, None) for key in self._keys
+                if key.object().hasFn(fnType))
+            self._types[fnType] = bucket
+
+        return bucket
+
+    def _getKey(self, obj):
+        # Return the key registered for the node if any, or a new one.
+        key = bana._key.NodeKey(obj)
+        return self._keys.get(key, key)
+
+    def _registerName(self, key, obj):
+        name = OpenMaya.MFnDependencyNode(obj).name()
+        previousName = self._nodeNames.get(key)
+        if previousName == name:
+            return
+
+        if previousName is None:
+            for fnType, bucket in self._types.items():
+                if obj.hasFn(fnType):
+                    bucket[key] = None
+        else:
+            self._removeName(key, previousName)
+
+        keys = self._names.get(name)
+        if keys is None:
+            keys = self._names[name] = []
+            self._nameTrie.add(name)
+
+        keys.append(key)
+        self._keys[key] = key
+        self._nodeNames[key] = name
+
+    def _removeName(self, key, name):
+        keys = self._names[name]
+        keys.remove(key)
+        if not keys:
+            del self._names[name]
+            self._nameTrie.remove(name)
+
+    def _registerPath(self, dagPath):
+        path = dagPath.fullPathName()
+        key = self._getKey(dagPath.node())
+        self._paths[path] = dagPath
+        self._pathTrie.add(path)
+        self._nodePaths.setdefault(key, []).append(path)
+
+    def _removePath(self, key, path):
+        paths = self._nodePaths[key]
+        paths.remove(path)
+        if not paths:
+            del self._nodePaths[key]
+
+        del self._paths[path]
+        self._pathTrie.remove(path)
+
+    def _refreshPaths(self, key, obj):
+        # The paths of the node and of its descendants all need to be
+        # recomputed, but only the paths of the descendants going through the
+        # node are affected since these could also be instanced elsewhere.
+        prefixes = tuple(path + delimiter
+                         for path in self._nodePaths.get(key, ())
+                         for delimiter in ('|', '->'))
+        for path in list(self._nodePaths.get(key, ())):
+            self._removePath(key, path)
+
+        roots = OpenMaya.MDagPathArray()
+        try:
+            OpenMaya.MDagPath.getAllPathsTo(obj, roots)
+        except RuntimeError:
+            return
+
+        dagPaths = []
+        for i in range(roots.length()):
+            iterator = OpenMaya.MItDag()
+            iterator.reset(roots[i], OpenMaya.MItDag.kDepthFirst,
+                           OpenMaya.MFn.kInvalid)
+            iterator.traverseUnderWorld(True)
+            while not iterator.isDone():
+                dagPath = OpenMaya.MDagPath()
+                iterator.getPath(dagPath)
+                dagPaths.append(dagPath)
+                iterator.next()
+
+        for dagPath in dagPaths:
+            descendant = self._getKey(dagPath.node())
+            if descendant == key:
+                continue
+
+            for path in list(self._nodePaths.get(descendant, ())):
+                if path.startswith(prefixes):
+                    self._removePath(descendant, path)
+
+        for dagPath in dagPaths:
+            if dagPath.fullPathName() not in self._paths:
+                self._registerPath(dagPath)
+
+    def _unregister(self, key):
+        name = self._nodeNames.pop(key, None)
+        if name is not None:
+            self._removeName(key, name)
+
+        for path in list(self._nodePaths.get(key, ())):
+            self._removePath(key, path)
+
+        for bucket in self._types.values():
+            bucket.pop(key, None)
+
+        self._keys.pop(key, None)
+
+    def _markDirty(self, obj):
+        self._dirty[self._getKey(obj)] = None
+
+    def _onNodeAdded(self, node, clientData):
+        self._markDirty(node)
+
+    def _onNodeRemoved(self, node, clientData):
+        # The node still exists at this point, which allows retrieving its
+        # registered key before it becomes only equal to itself.
+        key = self._getKey(node)
+        self._dirty.pop(key, None)
+        if key in self._keys:
+            self._removed.add(key)
+
+    def _onNameChanged(self, node, previousName, clientData):
+        self._markDirty(node)
+
+    def _onParentChanged(self, child, parent, clientData):
+        self._markDirty(child.node())
+
+    def _onSceneChanged(self, clientData):
+        self._stale = True
+
+
+def enable():
+    """Build the index and keep it up-to-date with the scene.
+
+    Once enabled, the ``bnFind`` and ``bnGet`` methods of the classes
+    :class:`~OpenMaya.MObject`, :class:`~OpenMaya.MDagPath`,
+    :class:`~OpenMaya.MFnDependencyNode`, and :class:`~OpenMaya.MFnDagNode`
+    are answered from the index rather than by iterating over the scene. The
+    nodes are then returned in an unspecified order.
+
+    Calling this function while the index is already enabled has no effect.
+    """
+    global _index
+    if _index is not None:
+        return
+
+    index = _Index()
+    index.install()
+    _index = index
+
+
+def disable():
+    """Stop maintaining the index and release its data.
+
+    Calling this function while the index is not enabled has no effect.
+    """
+    global _index
+    if _index is None:
+        return
+
+    _index.uninstall()
+    _index = None
+
+
+def isEnabled():
+    """Check if the index is enabled.
+
+    Returns
+    -------
+    bool
+        ``True`` if the index is enabled.
+    """
+    return _index is not None
+
+
+def update():
+    """Apply the scene changes that the index has recorded so far.
+
+    This is done automatically before each query but it can also be called
+    explicitly to control when the cost is paid.
+
+    Raises
+    ------
+    RuntimeError
+        The index is not enabled.
+    """
+    if _index is None:
+        raise RuntimeError("The index is not enabled.")
+
+    _index.update()
+
+
+def findObjects(pattern=None, fnType=OpenMaya.MFn.kInvalid):
+    """Retrieve the DG nodes matching a full name pattern from the index.
+
+    Parameters
+    ----------
+    pattern : str
+        *Full name* pattern of the DG nodes to match. Wildcards are allowed.
+    fnType : maya.OpenMaya.MFn.Type
+        Function set type to match.
+
+    Returns
+    -------
+    list of maya.OpenMaya.MObject
+        The DG nodes found.
+
+    Raises
+    ------
+    RuntimeError
+        The index is not enabled.
+    """
+    if _index is None:
+        raise RuntimeError("The index is not enabled.")
+
+    return _index.findObjects(pattern=pattern, fnType=fnType)
+
+
+def findDagPaths(pattern=None, fnType=OpenMaya.MFn.kInvalid, recursive=True,
+                 traverseUnderWorld=True, maxDepth=None,
+                 order=OpenMaya.MItDag.kDepthFirst):
+    """Retrieve the DAG paths matching a pattern from the index.
+
+    Parameters
+    ----------
+    pattern : str
+        Path or full path pattern of the DAG paths to match. Wildcards are
+        allowed.
+    fnType : maya.OpenMaya.MFn.Type
+        Function set type to match.
+    recursive : bool
+        ``True`` to search recursively.
+    traverseUnderWorld : bool
+        ``True`` to search within the underworld.
+    maxDepth : int
+        Maximum depth of the DAG paths to match, or ``None`` for no limit.
+    order : maya.OpenMaya.MItDag.TraversalType
+        ``maya.OpenMaya.MItDag.kBreadthFirst`` to return the DAG paths sorted
+        by depth.
+
+    Returns
+    -------
+    list of maya.OpenMaya.MDagPath
+        Copies of the DAG paths found.
+
+    Raises
+    ------
+    RuntimeError
+        The index is not enabled.
+
+    Note
+    ----
+    The pattern matching's global context is set to *full path* if the
+    parameter ``traverseUnderWorld`` is ``True``, and to *path* otherwise.
+    See :ref:`pm_matching_rules`.
+    """
+    if _index is None:
+        raise RuntimeError("The index is not enabled.")
+
+    dagPaths = _index.findDagPaths(pattern=pattern, fnType=fnType,
+                                   recursive=recursive,
+                                   traverseUnderWorld=traverseUnderWorld,
+                                   maxDepth=maxDepth, order=order)
+    return [OpenMaya.MDagPath(dagPath) for dagPath in dagPaths]
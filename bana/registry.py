@@ -0,0 +1,246 @@
+"""Registry of the scene nodes identified by integer IDs.
+
+``MObject`` and ``MDagPath`` objects cannot safely be stored for later use
+since they are invalidated when their node is deleted, which is why they are
+often passed around by name instead, at the cost of looking the name up again
+each time. The registry defined here instead assigns a compact integer ID to
+each node registered, that can be resolved back to the node in constant time
+for the rest of the session.
+
+The IDs are never reused. Once a node is deleted, its ID remains known to the
+registry but it resolves to ``None``, even if a new node gets created at the
+same memory address. The IDs of the nodes registered from a DAG path identify
+that DAG path rather than the node, and also resolve to ``None`` once the DAG
+path is not valid anymore, such as after one of its nodes got reparented.
+"""
+
+from maya import OpenMaya
+
+import bana._key
+
+
+class _Registry(object):
+    """Keys of the registered nodes.
+
+    The ID of a node is the position of its key in a list, shifted by the
+    number of keys cleared so far. A dictionary maps the keys back to their ID
+    to return the same ID when a node is registered again.
+    """
+
+    def __init__(self):
+        self._keys = []
+        self._ids = {}
+        self._offset = 0
+
+    def register(self, key):
+        nodeId = self._ids.get(key)
+        if nodeId is None:
+            nodeId = self._ids[key] = self._offset + len(self._keys)
+            self._keys.append(key)
+
+        return nodeId
+
+    def getKey(self, nodeId):
+        index = nodeId - self._offset
+        if index < 0 or index >= len(self._keys):
+            raise ValueError("The node ID '%s' is not valid." % (nodeId,))
+
+        return self._keys[index]
+
+    def clear(self):
+        self._offset += len(self._keys)
+        del self._keys[:]
+        self._ids.clear()
+
+
+_registry = _Registry()
+
+
+def _makeKey(node):
+    if isinstance(node, OpenMaya.MDagPath):
+        return bana._key.DagPathKey(node)
+
+    if isinstance(node, OpenMaya.MFnDependencyNode):
+        node = node.object()
+
+    return bana._key.NodeKey(node)
+
+
+def _getObject(key):
+    if isinstance(key, bana._key.DagPathKey):
+        dagPath = key.dagPath()
+        return None if dagPath is None else dagPath.node()
+
+    return key.object()
+
+
+def _getDagPath(key):
+    if isinstance(key, bana._key.DagPathKey):
+        return key.dagPath()
+
+    obj = key.object()
+    if obj is None or not obj.hasFn(OpenMaya.MFn.kDagNode):
+        return None
+
+    dagPath = OpenMaya.MDagPath()
+    OpenMaya.MDagPath.getAPathTo(obj, dagPath)
+    return dagPath
+
+
+def register(node):
+    """Assign an ID to a node.
+
+    Registering the same node again returns the same ID. A DAG path is
+    registered separately from the other instances of its DAG node, which
+    allows the exact instance to be retrieved back.
+
+    Parameters
+    ----------
+    node : maya.OpenMaya.MObject or maya.OpenMaya.MDagPath
+        Node to register. Function sets are also accepted.
+
+    Returns
+    -------
+    int
+        The ID of the node.
+    """
+    return _registry.register(_makeKey(node))
+
+
+def registerMany(nodes):
+    """Assign an ID to each node of a sequence.
+
+    Parameters
+    ----------
+    nodes : iterable of maya.OpenMaya.MObject or maya.OpenMaya.MDagPath
+        Nodes to register. Function sets are also accepted.
+
+    Returns
+    -------
+    list of int
+        The IDs of the nodes, in the same order.
+    """
+    registry = _registry
+    return [registry.register(_makeKey(node)) for node in nodes]
+
+
+def isValid(nodeId):
+    """Check if the node identified by an ID still exists.
+
+    Parameters
+    ----------
+    nodeId : int
+        ID of the node.
+
+    Returns
+    -------
+    bool
+        ``True`` if the node has not been deleted, or if the DAG path that it
+        was registered from is still valid.
+
+    Raises
+    ------
+    ValueError
+        The ID was not assigned by the registry.
+    """
+    return _registry.getKey(nodeId).isValid()
+
+
+def getObject(nodeId):
+    """Retrieve the node identified by an ID.
+
+    Parameters
+    ----------
+    nodeId : int
+        ID of the node.
+
+    Returns
+    -------
+    maya.OpenMaya.MObject
+        The node, or ``None`` if it is not valid anymore.
+
+    Raises
+    ------
+    ValueError
+        The ID was not assigned by the registry.
+    """
+    return _getObject(_registry.getKey(nodeId))
+
+
+def getDagPath(nodeId):
+    """Retrieve the DAG path of the node identified by an ID.
+
+    If the node was registered from a DAG path, that exact DAG path is
+    returned. Otherwise, any of the DAG paths leading to the node is returned.
+
+    Parameters
+    ----------
+    nodeId : int
+        ID of the node.
+
+    Returns
+    -------
+    maya.OpenMaya.MDagPath
+        The DAG path, or ``None`` if the node is not valid anymore or is not
+        a DAG node.
+
+    Raises
+    ------
+    ValueError
+        The ID was not assigned by the registry.
+    """
+    return _getDagPath(_registry.getKey(nodeId))
+
+
+def resolveObjects(nodeIds):
+    """Retrieve the nodes identified by a sequence of IDs.
+
+    Parameters
+    ----------
+    nodeIds : iterable of int
+        IDs of the nodes.
+
+    Returns
+    -------
+    list of maya.OpenMaya.MObject
+        The nodes, in the same order. The nodes that are not valid anymore
+        are set to ``None``.
+
+    Raises
+    ------
+    ValueError
+        An ID was not assigned by the registry.
+    """
+    getKey = _registry.getKey
+    return [_getObject(getKey(nodeId)) for nodeId in nodeIds]
+
+
+def resolveDagPaths(nodeIds):
+    """Retrieve the DAG paths of the nodes identified by a sequence of IDs.
+
+    Parameters
+    ----------
+    nodeIds : iterable of int
+        IDs of the nodes.
+
+    Returns
+    -------
+    list of maya.OpenMaya.MDagPath
+        The DAG paths, in the same order. The nodes that are not valid
+        anymore or that are not DAG nodes are set to ``None``.
+
+    Raises
+    ------
+    ValueError
+        An ID was not assigned by the registry.
+    """
+    getKey = _registry.getKey
+    return [_getDagPath(getKey(nodeId)) for nodeId in nodeIds]
+
+
+def clear():
+    """Forget all the nodes registered.
+
+    The IDs assigned so far become invalid. They are not assigned again.
+    """
+    _registry.clear()
@@ -0,0 +1,489 @@
+"""Offline snapshots of the scene nodes.
+
+A snapshot records the *full names* and types of the DG nodes, as well as the
+*full paths* of the DAG nodes along with their parent links, into a file that
+can later be queried with the same pattern matching rules as the ``bnFind``
+methods, without requiring a Maya session.
+
+The file starts with a JSON header holding the node types and the size of
+each section, followed by the *full names* then the *full paths*, one per
+line, and then by fixed-width binary tables holding the type of each record,
+the offset of each line, the parent of each path, and the order of the paths
+once sorted. The file is memory-mapped when loaded and both the patterns
+and the lookups run directly against the content of these sections, which thus
+never need to be read entirely into memory.
+"""
+
+import bisect
+import io
+import json
+import mmap
+import re
+import struct
+
+import bana
+import bana._pattern
+
+
+_FORMAT = 'bana-snapshot'
+_VERSION = 2
+_ENCODING = 'utf-8'
+
+# Format of the values stored in each binary table, and whether it holds a
+# value per name or per path, in their order of appearance in the file.
+_TABLES = (
+    ('nodeTypes', 'i', False),
+    ('nameOffsets', 'q', False),
+    ('pathTypes', 'i', True),
+    ('pathParents', 'i', True),
+    ('pathOffsets', 'q', True),
+    ('pathOrder', 'i', True),
+)
+
+
+def _checkPattern(pattern, obj, wildcardObj, description):
+    if bana._pattern.hasWildcards(pattern):
+        obj = wildcardObj
+
+    if not obj.match(pattern):
+        raise ValueError("The %s pattern '%s' is not valid."
+                         % (description, pattern))
+
+
+def _makeSection(strings):
+    # Return the encoded lines along with the offset of each of them.
+    lines = [string.encode(_ENCODING) + b'\n' for string in strings]
+    offsets = []
+    offset = 0
+    for line in lines:
+        offsets.append(offset)
+        offset += len(line)
+
+    return b''.join(lines), offsets
+
+
+def _makeTable(values, code):
+    return struct.pack('<%d%s' % (len(values), code), *values)
+
+
+class _Table(object):
+    """Read-only sequence of integers stored in a binary table."""
+
+    def __init__(self, buffer, offset, count, code):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._format = '<' + code
+        self._size = struct.calcsize(self._format)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0 or index >= self._count:
+            raise IndexError("The index '%s' is out of range." % (index,))
+
+        return struct.unpack_from(self._format, self._buffer,
+                                  self._offset + index * self._size)[0]
+
+
+class Snapshot(object):
+    """Snapshot loaded from a file.
+
+    Snapshots are created through the :func:`load` function and need to be
+    closed once done with, which the ``with`` statement can take care of.
+    """
+
+    def __init__(self, file, buffer, header, offset):
+        """Locate the sections of a memory-mapped file."""
+        self._file = file
+        self._buffer = buffer
+        self._types = [(typeName, frozenset(inherited))
+                       for typeName, inherited in header['types']]
+        namesSize, pathsSize = header['sizes']
+        namesCount, pathsCount = header['counts']
+        self._names = (offset, offset + namesSize)
+        self._paths = (offset + namesSize, offset + namesSize + pathsSize)
+        offset += namesSize + pathsSize
+        for name, code, perPath in _TABLES:
+            count = pathsCount if perPath else namesCount
+            setattr(self, '_' + name, _Table(buffer, offset, count, code))
+            offset += count * struct.calcsize('<' + code)
+
+        self._end = offset
+
+    def __enter__(self):
+        """Enter the ``with`` statement."""
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        """Close the snapshot when exiting the ``with`` statement."""
+        self.close()
+
+    def close(self):
+        """Release the file."""
+        if self._buffer is not None:
+            self._buffer.close()
+            self._file.close()
+            self._buffer = None
+            self._file = None
+
+    def findNames(self, pattern=None, nodeType=None):
+        """Retrieve the *full names* of the DG nodes matching a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            *Full name* pattern of the DG nodes to match. Wildcards are
+            allowed.
+        nodeType : str
+            Node type to match, including any type inherited from.
+
+        Returns
+        -------
+        list of str
+            The *full names* found, in the order in which they were recorded.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed.
+        """
+        if pattern is not None:
+            _checkPattern(pattern, bana._pattern.FULL_NAME_OBJ,
+                          bana._pattern.FULL_NAME_WCARD_OBJ, 'full name')
+
+        items = self._find(pattern, bana._pattern.CONTEXT_FULL_NAME,
+                           self._names, self._nameOffsets)
+        if nodeType is not None:
+            nodeTypes = self._nodeTypes
+            items = [(i, name) for i, name in items
+                     if self._hasType(nodeTypes[i], nodeType)]
+
+        return [name for _, name in items]
+
+    def findPaths(self, pattern=None, nodeType=None, recursive=True,
+                  traverseUnderWorld=True, maxDepth=None):
+        """Retrieve the *full paths* of the DAG nodes matching a pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Path or full path pattern of the DAG nodes to match. Wildcards are
+            allowed.
+        nodeType : str
+            Node type to match, including any type inherited from.
+        recursive : bool
+            ``True`` to search recursively.
+        traverseUnderWorld : bool
+            ``True`` to search within the underworld.
+        maxDepth : int
+            Maximum depth of the DAG nodes to match, relative to the world.
+            ``None`` for no limit.
+
+        Returns
+        -------
+        list of str
+            The *full paths* found, in depth first order.
+
+        Raises
+        ------
+        ValueError
+            The pattern is not well-formed.
+
+        Note
+        ----
+        The pattern matching's global context is set to *full path* if the
+        parameter ``traverseUnderWorld`` is ``True``, and to *path* otherwise.
+        See :ref:`pm_matching_rules`.
+        """
+        if traverseUnderWorld:
+            context = bana._pattern.CONTEXT_FULL_PATH
+            if pattern is not None:
+                _checkPattern(pattern, bana._pattern.FULL_PATH_OBJ,
+                              bana._pattern.FULL_PATH_WCARD_OBJ, 'full path')
+        else:
+            context = bana._pattern.CONTEXT_PATH
+            if pattern is not None:
+                _checkPattern(pattern, bana._pattern.PATH_OBJ,
+                              bana._pattern.PATH_WCARD_OBJ, 'path')
+
+        items = self._find(pattern, context, self._paths, self._pathOffsets)
+        if not recursive:
+            # The parent links are only missing for the children of the world.
+            parents = self._pathParents
+            items = [(i, path) for i, path in items if parents[i] < 0]
+        elif not traverseUnderWorld:
+            items = [(i, path) for i, path in items if '->' not in path]
+
+        if maxDepth is not None:
+            items = [(i, path) for i, path in items
+                     if path.count('|') <= maxDepth]
+
+        if nodeType is not None:
+            pathTypes = self._pathTypes
+            items = [(i, path) for i, path in items
+                     if self._hasType(pathTypes[i], nodeType)]
+
+        return [path for _, path in items]
+
+    def getParent(self, path):
+        """Retrieve the *full path* of the parent of a DAG node.
+
+        Parameters
+        ----------
+        path : str
+            *Full path* of the DAG node.
+
+        Returns
+        -------
+        str
+            The *full path* of the parent, or ``None`` if the DAG node is
+            directly parented under the world or is not part of the snapshot.
+
+        Raises
+        ------
+        ValueError
+            The *full path* is not well-formed.
+        """
+        if not bana._pattern.FULL_PATH_OBJ.match(path):
+            raise ValueError("The full path '%s' is not valid." % (path,))
+
+        if self._buffer is None:
+            raise ValueError("The snapshot is closed.")
+
+        # Binary search of the path within the sorted order of the paths.
+        key = path.encode(_ENCODING)
+        order = self._pathOrder
+        low = 0
+        high = len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._getPath(order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == len(order) or self._getPath(order[low]) != key:
+            return None
+
+        parent = self._pathParents[order[low]]
+        if parent < 0:
+            return None
+
+        return self._getPath(parent).decode(_ENCODING)
+
+    def _getPath(self, index):
+        # Return the encoded path stored at an index, without its newline.
+        start, end = self._paths
+        offsets = self._pathOffsets
+        if index + 1 < len(offsets):
+            end = start + offsets[index + 1]
+
+        return self._buffer[start + offsets[index]:end - 1]
+
+    def _find(self, pattern, context, section, offsets):
+        # Return the index and the string of each line of the section that
+        # matches the pattern.
+        if self._buffer is None:
+            raise ValueError("The snapshot is closed.")
+
+        if pattern is None:
+            return [(i, string.decode(_ENCODING))
+                    for i, string in self._iterLines(section)]
+
+        if bana._pattern.isComplex(pattern, context):
+            # Scanning the section with a regular expression prone to
+            # backtracking is replaced with running an automaton over each
+            # line.
+            match = bana._pattern.makeMatchFunction(pattern, context,
+                                                    deterministic=True)
+            out = []
+            for i, string in self._iterLines(section):
+                string = string.decode(_ENCODING)
+                if match(string):
+                    out.append((i, string))
+
+            return out
+
+        start, end = section
+        if start == end:
+            return []
+
+        # Leave out the newline character ending the section, otherwise the
+        # patterns allowing empty matches would match the position after it.
+        end -= 1
+        obj = re.compile(
+            bana._pattern.makeExpression(pattern, context).encode(_ENCODING),
+            re.MULTILINE)
+        # The index of the line of each match is looked up within the offsets
+        # of the lines rather than by counting the newline characters.
+        return [(bisect.bisect_right(offsets, match.start() - start) - 1,
+                 match.group().decode(_ENCODING))
+                for match in obj.finditer(self._buffer, start, end)]
+
+    def _iterLines(self, section):
+        # Yield the index and the encoded string of each line of the section,
+        # one at a time.
+        start, end = section
+        buffer = self._buffer
+        find = buffer.find
+        index = 0
+        while start < end:
+            stop = find(b'\n', start, end)
+            yield (index, buffer[start:stop])
+            start = stop + 1
+            index += 1
+
+    def _hasType(self, typeIndex, nodeType):
+        return nodeType in self._types[typeIndex][1]
+
+
+def save(fileName):
+    """Record the nodes of the current scene into a snapshot file.
+
+    This requires a Maya session.
+
+    Parameters
+    ----------
+    fileName : str
+        Path of the file to write.
+    """
+    from maya import OpenMaya, cmds
+
+    types = []
+    typeIndices = {}
+
+    def getTypeIndex(node):
+        typeName = node.typeName()
+        typeIndex = typeIndices.get(typeName)
+        if typeIndex is None:
+            inherited = cmds.nodeType(typeName, isTypeName=True,
+                                      inherited=True) or []
+            if typeName not in inherited:
+                inherited.append(typeName)
+
+            typeIndex = typeIndices[typeName] = len(types)
+            types.append((typeName, inherited))
+
+        return typeIndex
+
+    nodeTypes = []
+    names = []
+    iterator = OpenMaya.MItDependencyNodes()
+    while not iterator.isDone():
+        node = OpenMaya.MFnDependencyNode(iterator.thisNode())
+        nodeTypes.append(getTypeIndex(node))
+        names.append(node.name())
+        iterator.next()
+
+    pathTypes = []
+    pathParents = []
+    paths = []
+    # Index of the last path visited at each depth. The world, at the depth 0,
+    # is not recorded.
+    ancestors = [-1]
+    dagPath = OpenMaya.MDagPath()
+    iterator = OpenMaya.MItDag()
+    iterator.traverseUnderWorld(True)
+    iterator.next()
+    while not iterator.isDone():
+        depth = iterator.depth()
+        iterator.getPath(dagPath)
+        del ancestors[depth:]
+        pathParents.append(ancestors[-1])
+        ancestors.append(len(paths))
+        pathTypes.append(
+            getTypeIndex(OpenMaya.MFnDependencyNode(dagPath.node())))
+        paths.append(dagPath.fullPathName())
+        iterator.next()
+
+    _write(fileName, types, nodeTypes, names, pathTypes, pathParents, paths)
+
+
+def _write(fileName, types, nodeTypes, names, pathTypes, pathParents, paths):
+    # Write the records into a snapshot file.
+    namesSection, nameOffsets = _makeSection(names)
+    pathsSection, pathOffsets = _makeSection(paths)
+    encodedPaths = [path.encode(_ENCODING) for path in paths]
+    pathOrder = sorted(range(len(paths)), key=encodedPaths.__getitem__)
+    tables = {
+        'nodeTypes': nodeTypes,
+        'nameOffsets': nameOffsets,
+        'pathTypes': pathTypes,
+        'pathParents': pathParents,
+        'pathOffsets': pathOffsets,
+        'pathOrder': pathOrder,
+    }
+    header = {
+        'format': _FORMAT,
+        'version': _VERSION,
+        'bana': bana.__version__,
+        'types': types,
+        'counts': [len(names), len(paths)],
+        'sizes': [len(namesSection), len(pathsSection)],
+    }
+    with io.open(fileName, 'wb') as f:
+        f.write(json.dumps(header, separators=(',', ':')).encode(_ENCODING))
+        f.write(b'\n')
+        f.write(namesSection)
+        f.write(pathsSection)
+        for name, code, _ in _TABLES:
+            f.write(_makeTable(tables[name], code))
+
+
+def load(fileName):
+    """Load a snapshot file.
+
+    Maya is not required.
+
+    Parameters
+    ----------
+    fileName : str
+        Path of the file to read.
+
+    Returns
+    -------
+    bana.snapshot.Snapshot
+        The snapshot.
+
+    Raises
+    ------
+    ValueError
+        The file is not a snapshot or its version is not supported.
+    """
+    f = io.open(fileName, 'rb')
+    try:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, EnvironmentError):
+        f.close()
+        raise ValueError("The file '%s' is not a snapshot." % (fileName,))
+
+    try:
+        try:
+            header = json.loads(buffer.readline().decode(_ENCODING))
+        except ValueError:
+            header = None
+
+        if not isinstance(header, dict) or header.get('format') != _FORMAT:
+            raise ValueError("The file '%s' is not a snapshot."
+                             % (fileName,))
+
+        if header.get('version') != _VERSION:
+            raise ValueError("The snapshot version '%s' is not supported."
+                             % (header.get('version'),))
+
+        try:
+            snapshot = Snapshot(f, buffer, header, buffer.tell())
+        except (KeyError, TypeError, ValueError):
+            snapshot = None
+
+        if snapshot is None or snapshot._end > len(buffer):
+            raise ValueError("The file '%s' is not a snapshot."
+                             % (fileName,))
+
+        return snapshot
+    except Exception:
+        buffer.close()
+        f.close()
+        raise
@@ -101,6 +101,65 @@ class MDagPathDeepSceneBench(unittest.TestCase):
                                           copy=False):
             pass
 
+    def benchBnFind13(self):
+        dagPath = _retrieveDeepestDagPath()
+        dagPath.pop(dagPath.length() - 1)
+        pattern = '%s|*' % (dagPath.fullPathName(),)
+        for _ in OpenMaya.MDagPath.bnFind(pattern=pattern):
+            pass
+
+    def benchBnFind14(self):
+        for _ in OpenMaya.MDagPath.bnFind(maxDepth=3, copy=False):
+            pass
+
+    def benchBnFind15(self):
+        for _ in OpenMaya.MDagPath.bnFind(pattern='*', maxDepth=3,
+                                          copy=False):
+            pass
+
+    def benchBnFind16(self):
+        for _ in OpenMaya.MDagPath.bnFind(
+                order=OpenMaya.MItDag.kBreadthFirst, copy=False):
+            pass
+
+    def benchBnFind17(self):
+        dagPath = _retrieveDeepestDagPath()
+        pattern = '*|%s' % (dagPath.fullPathName().split('|')[-1],)
+        for _ in OpenMaya.MDagPath.bnFind(pattern=pattern, copy=False):
+            pass
+
+    def benchBnFindBatched1(self):
+        for _ in OpenMaya.MDagPath.bnFindBatched():
+            pass
+
+    def benchBnFindBatched2(self):
+        for _ in OpenMaya.MDagPath.bnFindBatched(pattern='*'):
+            pass
+
+    def benchHash(self):
+        dagPaths = list(OpenMaya.MDagPath.bnFind())
+        uniques = set(dagPaths)
+        for dagPath in dagPaths:
+            dagPath in uniques
+
+    def benchBnKey(self):
+        keys = [dagPath.bnKey()
+                for dagPath in OpenMaya.MDagPath.bnFind(copy=False)]
+        uniques = set(keys)
+        for key in keys:
+            key in uniques
+
+    def benchInclusiveMatrix(self):
+        dagPaths = list(
+            OpenMaya.MDagPath.bnFind(fnType=OpenMaya.MFn.kTransform))
+        for dagPath in dagPaths:
+            dagPath.inclusiveMatrix().bnGet()
+
+    def benchBnGetWorldMatrices(self):
+        dagPaths = list(
+            OpenMaya.MDagPath.bnFind(fnType=OpenMaya.MFn.kTransform))
+        OpenMaya.MDagPath.bnGetWorldMatrices(dagPaths)
+
 
 class MDagPathFlatSceneBench(unittest.TestCase):
 
@@ -142,6 +201,14 @@ class MDagPathFlatSceneBench(unittest.TestCase):
                                           copy=False):
             pass
 
+    def benchBnFindBatched1(self):
+        for _ in OpenMaya.MDagPath.bnFindBatched():
+            pass
+
+    def benchBnFindBatched2(self):
+        for _ in OpenMaya.MDagPath.bnFindBatched(pattern='*'):
+            pass
+
 
 if __name__ == '__main__':
     from benchmarks.run import run
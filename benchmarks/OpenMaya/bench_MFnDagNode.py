@@ -0,0 +1,88 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+import revl
+from maya import OpenMaya
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
+
+import bana
+
+import benchmarks._preset
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class MFnDagNodeDeepSceneBench(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        OpenMaya.MFileIO.newFile(True)
+        revl.run(benchmarks._preset.DEEP, 10000, seed=1.23)
+
+    def benchBnFind1(self):
+        for _ in OpenMaya.MFnDagNode.bnFind():
+            pass
+
+    def benchBnFind2(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(reuse=True):
+            pass
+
+    def benchBnFind3(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(pattern='*'):
+            pass
+
+    def benchBnFind4(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(pattern='*', reuse=True):
+            pass
+
+    def benchBnFind5(self):
+        for _ in OpenMaya.MFnTransform.bnFind():
+            pass
+
+    def benchBnFind6(self):
+        for _ in OpenMaya.MFnTransform.bnFind(reuse=True):
+            pass
+
+
+class MFnDagNodeFlatSceneBench(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        OpenMaya.MFileIO.newFile(True)
+        revl.run(benchmarks._preset.FLAT, 10000, seed=1.23)
+
+    def benchBnFind1(self):
+        for _ in OpenMaya.MFnDagNode.bnFind():
+            pass
+
+    def benchBnFind2(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(reuse=True):
+            pass
+
+    def benchBnFind3(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(pattern='*'):
+            pass
+
+    def benchBnFind4(self):
+        for _ in OpenMaya.MFnDagNode.bnFind(pattern='*', reuse=True):
+            pass
+
+    def benchBnFind5(self):
+        for _ in OpenMaya.MFnTransform.bnFind():
+            pass
+
+    def benchBnFind6(self):
+        for _ in OpenMaya.MFnTransform.bnFind(reuse=True):
+            pass
+
+
+if __name__ == '__main__':
+    from benchmarks.run import run
+    run('__main__')
@@ -1,6 +1,7 @@
 #!/usr/bin/env mayapy
 
 import os
+import re
 import sys
 import unittest
 
@@ -12,6 +13,7 @@ _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
 import bana
+import bana._pattern
 
 import benchmarks._preset
 
@@ -19,6 +21,13 @@ bana.initialize()
 maya.standalone.initialize()
 
 
+_PATTERNS = [
+    '*|*%s' % (suffix,)
+    for suffix in ('Shape', 'Shape1', 'Constraint', 'Constraint1', 'Curve',
+                   'Curve1', 'Surface', 'Surface1', 'Mesh', 'Mesh1')
+]
+
+
 class MGlobalBench(unittest.TestCase):
 
     @classmethod
@@ -53,6 +62,62 @@ class MGlobalBench(unittest.TestCase):
         for path in self.paths:
             match(path)
 
+    def benchBnMatchFullPathDeterministic(self):
+        match = OpenMaya.MGlobal.bnMakeMatchFullPathFunction(
+            '*|*Shape*', deterministic=True)
+        for path in self.paths:
+            match(path)
+
+    def benchRegexFullPathPrefix(self):
+        pattern = '%s|*' % (self.paths[0],)
+        match = re.compile(bana._pattern.makeExpression(
+            pattern, bana._pattern.CONTEXT_FULL_PATH)).match
+        for path in self.paths:
+            match(path)
+
+    def benchBnMatchFullPathPrefix(self):
+        pattern = '%s|*' % (self.paths[0],)
+        match = OpenMaya.MGlobal.bnMakeMatchFullPathFunction(pattern)
+        for path in self.paths:
+            match(path)
+
+    def benchRegexFullPathSuffix(self):
+        match = re.compile(bana._pattern.makeExpression(
+            '*|*Shape', bana._pattern.CONTEXT_FULL_PATH)).match
+        for path in self.paths:
+            match(path)
+
+    def benchBnMatchFullPathSuffix(self):
+        match = OpenMaya.MGlobal.bnMakeMatchFullPathFunction('*|*Shape')
+        for path in self.paths:
+            match(path)
+
+    def benchMatchFullPathPatterns(self):
+        functions = [OpenMaya.MGlobal.bnMakeMatchFullPathFunction(pattern)
+                     for pattern in _PATTERNS]
+        for path in self.paths:
+            [function(path) for function in functions]
+
+    def benchMultiMatchFullPathPatterns(self):
+        match = bana._pattern.makeMultiMatchFunction(
+            _PATTERNS, bana._pattern.CONTEXT_FULL_PATH)
+        for path in self.paths:
+            match(path)
+
+    def benchBnFilterFullNames(self):
+        OpenMaya.MGlobal.bnFilterFullNames('*Shape*', self.names)
+
+    def benchBnFilterFullPaths(self):
+        OpenMaya.MGlobal.bnFilterFullPaths('*|*Shape*', self.paths)
+
+    def benchBnFilterFullPathsIndices(self):
+        OpenMaya.MGlobal.bnFilterFullPaths('*|*Shape*', self.paths,
+                                           indices=True)
+
+    def benchBnFilterFullPathsWorkers(self):
+        OpenMaya.MGlobal.bnFilterFullPaths('*|*Shape*', self.paths,
+                                           workers=4)
+
 
 if __name__ == '__main__':
     from benchmarks.run import run
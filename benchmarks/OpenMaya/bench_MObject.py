@@ -0,0 +1,44 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+import revl
+from maya import OpenMaya
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
+
+import bana
+
+import benchmarks._preset
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class MObjectBench(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        OpenMaya.MFileIO.newFile(True)
+        revl.run(benchmarks._preset.DEEP, 10000, seed=1.23)
+
+    def benchHash(self):
+        objs = list(OpenMaya.MObject.bnFind())
+        uniques = set(objs)
+        for obj in objs:
+            obj in uniques
+
+    def benchBnKey(self):
+        keys = [obj.bnKey() for obj in OpenMaya.MObject.bnFind()]
+        uniques = set(keys)
+        for key in keys:
+            key in uniques
+
+
+if __name__ == '__main__':
+    from benchmarks.run import run
+    run('__main__')
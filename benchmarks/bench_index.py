@@ -0,0 +1,90 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+import revl
+from maya import OpenMaya
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana
+import bana.index
+
+import benchmarks._preset
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+def _retrieveDeepestDagPath():
+    dagPath = OpenMaya.MDagPath()
+    iterator = OpenMaya.MItDag()
+    iterator.traverseUnderWorld(True)
+    while not iterator.isDone():
+        if iterator.depth() > dagPath.pathCount():
+            iterator.getPath(dagPath)
+
+        iterator.next()
+
+    return dagPath
+
+
+class IndexDeepSceneBench(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        OpenMaya.MFileIO.newFile(True)
+        revl.run(benchmarks._preset.DEEP, 10000, seed=1.23)
+        dagPath = _retrieveDeepestDagPath()
+        dagPath.pop(dagPath.length() - 1)
+        cls._root = dagPath.fullPathName()
+        bana.index.enable()
+        bana.index.update()
+
+    @classmethod
+    def tearDownClass(cls):
+        bana.index.disable()
+
+    def benchMObjectBnFind1(self):
+        for _ in OpenMaya.MObject.bnFind(pattern='*'):
+            pass
+
+    def benchMObjectBnFind2(self):
+        for _ in OpenMaya.MObject.bnFind(fnType=OpenMaya.MFn.kMesh):
+            pass
+
+    def benchMObjectBnFind3(self):
+        for _ in OpenMaya.MObject.bnFind(pattern='time1'):
+            pass
+
+    def benchMDagPathBnFind1(self):
+        for _ in OpenMaya.MDagPath.bnFind(pattern='*'):
+            pass
+
+    def benchMDagPathBnFind2(self):
+        for _ in OpenMaya.MDagPath.bnFind(fnType=OpenMaya.MFn.kMesh):
+            pass
+
+    def benchMDagPathBnFind3(self):
+        pattern = '%s|*' % (self._root,)
+        for _ in OpenMaya.MDagPath.bnFind(pattern=pattern):
+            pass
+
+    def benchMDagPathBnFind4(self):
+        pattern = '%s|*|*Shape' % (self._root,)
+        for _ in OpenMaya.MDagPath.bnFind(pattern=pattern,
+                                          fnType=OpenMaya.MFn.kMesh):
+            pass
+
+    def benchMDagPathBnFind5(self):
+        for _ in OpenMaya.MDagPath.bnFind(pattern=self._root):
+            pass
+
+
+if __name__ == '__main__':
+    from benchmarks.run import run
+    run('__main__')
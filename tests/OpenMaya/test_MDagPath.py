@@ -7,6 +7,11 @@ import unittest
 import maya.standalone
 from maya import OpenMaya, cmds
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
@@ -71,6 +76,14 @@ class MDagPathTest(unittest.TestCase):
         dagPath2 = OpenMaya.MDagPath.bnGet(pattern='|master|node')
         self.assertEqual(hash(dagPath1), hash(dagPath2))
 
+        cmds.parent('|master|sphere|sphereShape', '|master|circle', addObject=True, shape=True)
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='*|sphereShape'))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|circle|sphereShape', '|master|sphere|sphereShape'])
+        self.assertNotEqual(hash(dagPaths[0]), hash(dagPaths[1]))
+        self.assertEqual(len(set(dagPaths)), 2)
+        self.assertEqual(len(set(dagPath.bnKey() for dagPath in dagPaths)), 2)
+        self.assertEqual(hash(dagPaths[0].bnKey()), hash(dagPaths[0]))
+
     def test__str__(self):
         dagPath = OpenMaya.MDagPath.bnGet(pattern='|master|node')
         self.assertEqual(str(dagPath), '|master|node')
@@ -231,6 +244,82 @@ class MDagPathTest(unittest.TestCase):
         self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
         self.assertTrue(all(dagPath is dagPaths[0] for dagPath in dagPaths))
 
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_*|*'))
+        self.assertEqual(len(dagPaths), 5)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_1|child_1', '|master|root_1|child_1|node', '|master|root_2|child_2', '|master|root_2|child_2|grandchild', '|master|root_2|child_2|grandchild|node'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|.|.|node'))
+        self.assertEqual(len(dagPaths), 1)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_1|child_1|node'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|sphere|sphereShape->|*'))
+        self.assertEqual(len(dagPaths), 5)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|sphere|sphereShape->|projectionCurve1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1|projectionCurve1_Shape1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2|projectionCurve1_Shape2'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_2|child_2'))
+        self.assertEqual(len(dagPaths), 1)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_2|child_2'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|missing|*'))
+        self.assertEqual(len(dagPaths), 0)
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_2|*|node', fnType=OpenMaya.MFn.kTransform))
+        self.assertEqual(len(dagPaths), 1)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_2|child_2|grandchild|node'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_*|*', maxDepth=3))
+        self.assertEqual(len(dagPaths), 2)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_1|child_1', '|master|root_2|child_2'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_2|*', maxDepth=2))
+        self.assertEqual(len(dagPaths), 0)
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='*|node', maxDepth=2))
+        self.assertEqual(len(dagPaths), 1)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|node'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(recursive=False, maxDepth=0))
+        self.assertEqual(len(dagPaths), 0)
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='|master|root_2|*', order=OpenMaya.MItDag.kBreadthFirst))
+        self.assertEqual(len(dagPaths), 3)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual([dagPath.fullPathName() for dagPath in dagPaths], ['|master|root_2|child_2', '|master|root_2|child_2|grandchild', '|master|root_2|child_2|grandchild|node'])
+
+        dagPaths = list(OpenMaya.MDagPath.bnFind(pattern='*|node', order=OpenMaya.MItDag.kBreadthFirst))
+        self.assertEqual(len(dagPaths), 3)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual([dagPath.fullPathName() for dagPath in dagPaths], ['|master|node', '|master|root_1|child_1|node', '|master|root_2|child_2|grandchild|node'])
+
+    def testBnFindBatched(self):
+        batches = list(OpenMaya.MDagPath.bnFindBatched(recursive=False, batchSize=2))
+        self.assertEqual(len(batches), 3)
+        self.assertTrue(all(type(batch) is OpenMaya.MDagPathArray for batch in batches))
+        self.assertEqual([batch.length() for batch in batches], [2, 2, 1])
+        self.assertEqual(sorted(batch[i].fullPathName() for batch in batches for i in range(batch.length())), ['|front', '|master', '|persp', '|side', '|top'])
+
+        batches = list(OpenMaya.MDagPath.bnFindBatched(pattern='|master|root_*|*'))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(sorted(batches[0][i].fullPathName() for i in range(batches[0].length())), ['|master|root_1|child_1', '|master|root_1|child_1|node', '|master|root_2|child_2', '|master|root_2|child_2|grandchild', '|master|root_2|child_2|grandchild|node'])
+
+        batches = list(OpenMaya.MDagPath.bnFindBatched(pattern='*|node', batchSize=1, maxDepth=4))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(sorted(batch[0].fullPathName() for batch in batches), ['|master|node', '|master|root_1|child_1|node'])
+
+        batches = list(OpenMaya.MDagPath.bnFindBatched(pattern='|master|missing|*'))
+        self.assertEqual(len(batches), 0)
+
+        self.assertEqual([batch[i].fullPathName() for batch in OpenMaya.MDagPath.bnFindBatched(batchSize=3) for i in range(batch.length())], [dagPath.fullPathName() for dagPath in OpenMaya.MDagPath.bnFind()])
+
+        self.assertRaises(ValueError, OpenMaya.MDagPath.bnFindBatched, batchSize=0)
+
     def testBnGet(self):
         self.assertIsNone(OpenMaya.MDagPath.bnGet(pattern='|node'))
         self.assertIsNone(OpenMaya.MDagPath.bnGet(pattern='*|node'))
@@ -486,6 +575,32 @@ class MDagPathTest(unittest.TestCase):
         self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
         self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|sphere|sphereShape->|projectionCurve1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1|projectionCurve1_Shape1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2|projectionCurve1_Shape2'])
 
+        dpRoot = OpenMaya.MDagPath.bnGet(pattern='|master')
+
+        dagPaths = list(dpRoot.bnFindChildren(pattern='|root_*|*'))
+        self.assertEqual(len(dagPaths), 5)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_1|child_1', '|master|root_1|child_1|node', '|master|root_2|child_2', '|master|root_2|child_2|grandchild', '|master|root_2|child_2|grandchild|node'])
+
+        dagPaths = list(dpRoot.bnFindChildren(pattern='|root_*|*', maxDepth=2))
+        self.assertEqual(len(dagPaths), 2)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|root_1|child_1', '|master|root_2|child_2'])
+
+        dpRoot = OpenMaya.MDagPath.bnGet(pattern='|master|sphere|sphereShape')
+
+        dagPaths = list(dpRoot.bnFindChildren(maxDepth=2))
+        self.assertEqual(len(dagPaths), 2)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual(sorted(dagPath.fullPathName() for dagPath in dagPaths), ['|master|sphere|sphereShape->', '|master|sphere|sphereShape->|projectionCurve1'])
+
+        dpRoot = OpenMaya.MDagPath.bnGet(pattern='|master|root_2')
+
+        dagPaths = list(dpRoot.bnFindChildren(order=OpenMaya.MItDag.kBreadthFirst))
+        self.assertEqual(len(dagPaths), 3)
+        self.assertTrue(all(type(dagPath) is OpenMaya.MDagPath for dagPath in dagPaths))
+        self.assertEqual([dagPath.fullPathName() for dagPath in dagPaths], ['|master|root_2|child_2', '|master|root_2|child_2|grandchild', '|master|root_2|child_2|grandchild|node'])
+
     def testBnGetChild(self):
         dpRoot = OpenMaya.MDagPath.bnGet(pattern='|master')
 
@@ -551,6 +666,41 @@ class MDagPathTest(unittest.TestCase):
         self.assertIsNot(dpParent, dagPath)
         self.assertEqual(dpParent, OpenMaya.MDagPath.bnGet(pattern='|master'))
 
+    def testBnKey(self):
+        dagPath1 = OpenMaya.MDagPath.bnGet(pattern='|master|node')
+        dagPath2 = OpenMaya.MDagPath.bnGet(pattern='|master|node')
+        key = dagPath1.bnKey()
+        self.assertEqual(key, dagPath2.bnKey())
+        self.assertEqual(hash(key), hash(dagPath1))
+        self.assertNotEqual(key, OpenMaya.MDagPath.bnGet(pattern='|master').bnKey())
+        self.assertEqual(len(set(dagPath.bnKey() for dagPath in OpenMaya.MDagPath.bnFind(copy=False))), 37)
+
+        dagPath1.pop()
+        self.assertEqual(key, dagPath2.bnKey())
+        self.assertEqual(key.dagPath(), dagPath2)
+
+        cmds.delete('|master|node')
+        self.assertFalse(key.isValid())
+        self.assertIsNone(key.dagPath())
+        self.assertEqual(key, key)
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnGetWorldMatrices(self):
+        cmds.setAttr('|master.translate', 1.0, 2.0, 3.0)
+        cmds.setAttr('|master|node.scale', 2.0, 2.0, 2.0)
+        dagPaths = [OpenMaya.MDagPath.bnGet(pattern=pattern) for pattern in ('|master', '|master|node', '|master|sphere')]
+        matrices = OpenMaya.MDagPath.bnGetWorldMatrices(dagPaths)
+        self.assertEqual(matrices.shape, (3, 4, 4))
+        self.assertEqual(matrices.tolist(), [dagPath.inclusiveMatrix().bnGet() for dagPath in dagPaths])
+        self.assertEqual(matrices[1].tolist(), [[2.0, 0.0, 0.0, 0.0], [0.0, 2.0, 0.0, 0.0], [0.0, 0.0, 2.0, 0.0], [1.0, 2.0, 3.0, 1.0]])
+
+        out = numpy.zeros((3, 4, 4))
+        self.assertIs(OpenMaya.MDagPath.bnGetWorldMatrices(dagPaths, out=out), out)
+        self.assertEqual(out.tolist(), matrices.tolist())
+        self.assertEqual(OpenMaya.MDagPath.bnGetWorldMatrices([]).shape, (0, 4, 4))
+        self.assertRaises(ValueError, OpenMaya.MDagPath.bnGetWorldMatrices, dagPaths, out=numpy.zeros((2, 4, 4)))
+        self.assertRaises(ValueError, OpenMaya.MDagPath.bnGetWorldMatrices, dagPaths, out=numpy.zeros((3, 4, 4), dtype=numpy.float32))
+
 
 if __name__ == '__main__':
     from tests.run import run
@@ -216,6 +216,16 @@ class MDagNodeTest(unittest.TestCase):
         self.assertTrue(all(type(node) is OpenMaya.MFnDagNode for node in nodes))
         self.assertEqual(sorted(node.fullPathName() for node in nodes), ['|master|sphere|sphereShape->|projectionCurve1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1|projectionCurve1_Shape1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2|projectionCurve1_Shape2'])
 
+        nodes = list(OpenMaya.MFnDagNode.bnFind(pattern='*|child_*', reuse=True))
+        self.assertEqual(len(nodes), 2)
+        self.assertIs(nodes[0], nodes[1])
+
+        paths = [node.fullPathName() for node in OpenMaya.MFnDagNode.bnFind(pattern='*|child_*', reuse=True)]
+        self.assertEqual(sorted(paths), ['|master|root_1|child_1', '|master|root_2|child_2'])
+
+        paths = [node.fullPathName() for node in OpenMaya.MFnMesh.bnFind(reuse=True)]
+        self.assertEqual(sorted(paths), ['|master|cube|cubeShape', '|master|cube|intermediary1', '|master|cube|intermediary2', '|master|cube|template'])
+
     def testBnGet(self):
         self.assertIsNone(OpenMaya.MFnDagNode.bnGet(pattern='|node'))
         self.assertIsNone(OpenMaya.MFnDagNode.bnGet(pattern='*|node'))
@@ -466,6 +476,10 @@ class MDagNodeTest(unittest.TestCase):
         self.assertTrue(all(type(node) is OpenMaya.MFnDagNode for node in nodes))
         self.assertEqual(sorted(node.fullPathName() for node in nodes), ['|master|sphere|sphereShape->|projectionCurve1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_1|projectionCurve1_Shape1', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2', '|master|sphere|sphereShape->|projectionCurve1|projectionCurve1_2|projectionCurve1_Shape2'])
 
+        root = OpenMaya.MFnDagNode.bnGet(pattern='|master')
+        paths = [node.fullPathName() for node in root.bnFindChildren(pattern='*|node', reuse=True)]
+        self.assertEqual(sorted(paths), ['|master|node', '|master|root_1|child_1|node', '|master|root_2|child_2|grandchild|node'])
+
     def testBnGetChild(self):
         root = OpenMaya.MFnDagNode.bnGet(pattern='|master')
 
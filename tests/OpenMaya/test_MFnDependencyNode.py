@@ -136,6 +136,19 @@ class MFnDependencyNodeTest(unittest.TestCase):
         self.assertIsInstance(node, OpenMaya.MFnDependencyNode)
         self.assertEqual(node.name(), 'time1')
 
+    def testBnKey(self):
+        node1 = OpenMaya.MFnDependencyNode.bnGet(pattern='awesome:light')
+        node2 = OpenMaya.MFnDependencyNode.bnGet(pattern='awesome:light')
+        key = node1.bnKey()
+        self.assertEqual(key, node2.bnKey())
+        self.assertEqual(key, OpenMaya.MObject.bnGet(pattern='awesome:light').bnKey())
+        self.assertEqual(hash(key), hash(node1))
+        self.assertNotEqual(key, OpenMaya.MFnDependencyNode.bnGet(pattern='child_1').bnKey())
+
+        node1.setObject(OpenMaya.MObject.bnGet(pattern='child_1'))
+        self.assertEqual(key, node2.bnKey())
+        self.assertEqual(key.object(), node2.object())
+
 
 if __name__ == '__main__':
     from tests.run import run
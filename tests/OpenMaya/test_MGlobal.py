@@ -1,9 +1,12 @@
 #!/usr/bin/env mayapy
 
 import itertools
+import json
 import os
 import re
+import shutil
 import sys
+import tempfile
 import unittest
 
 import maya.standalone
@@ -13,6 +16,7 @@ _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
 import bana
+import bana._pattern
 
 bana.initialize()
 maya.standalone.initialize()
@@ -48,8 +52,11 @@ def _applyMatch(function, pattern, string, *args, **kwargs):
         (unicode(pattern), str(string)),
         (unicode(pattern), unicode(string))
     ]
-    outputs = [function(sample[0], sample[1], *args, **kwargs)
-               for sample in samples]
+    # Cross-check the regular expressions against the automata.
+    outputs = [function(sample[0], sample[1], deterministic=deterministic,
+                        *args, **kwargs)
+               for sample in samples
+               for deterministic in (False, True)]
     if outputs.count(outputs[0]) != len(outputs):
         raise RuntimeError("Not all of the combinations for '%s, %s' "
                            "return the same result." % (pattern, string))
@@ -10633,6 +10640,317 @@ class MGlobalTest(unittest.TestCase):
         self.assertRaises(ValueError, OpenMaya.MGlobal.bnMatchFullPath, '|abc', 'abc')
         self.assertRaises(ValueError, OpenMaya.MGlobal.bnMatchFullPath, '|abc', 'ns:abc')
 
+    def testBnFilterNames(self):
+        function = OpenMaya.MGlobal.bnFilterNames
+        names = ['leaf', 'lof', 'lf', 'l', 'leaf']
+
+        self.assertEqual(function('leaf', names), ['leaf', 'leaf'])
+        self.assertEqual(function('leaf', names, indices=True), [0, 4])
+        self.assertEqual(function('*', names), names)
+        self.assertEqual(function('l?f', names, indices=True), [1, 2])
+        self.assertEqual(function('.', names, indices=True), [3])
+        self.assertEqual(function('*', []), [])
+        self.assertEqual(function('*', [], indices=True), [])
+
+        self.assertRaises(ValueError, function, '|abc', names)
+
+    def testBnFilterFullNames(self):
+        function = OpenMaya.MGlobal.bnFilterFullNames
+        names = ['leaf', 'ns:leaf', 'ns:sub:leaf', ':leaf', 'root']
+
+        self.assertEqual(function('leaf', names), ['leaf'])
+        self.assertEqual(function('*:leaf', names), ['leaf', 'ns:leaf', 'ns:sub:leaf'])
+        self.assertEqual(function('*:leaf', names, indices=True), [0, 1, 2])
+        self.assertEqual(function('.:leaf', names, indices=True), [1])
+        self.assertEqual(function('*:leaf', names, matchRelative=True, indices=True), [0, 1, 2, 3])
+
+        self.assertRaises(ValueError, function, '|abc', names)
+
+    def testBnFilterPaths(self):
+        function = OpenMaya.MGlobal.bnFilterPaths
+        paths = ['|root', '|root|node', '|root|child|node', '|node', '|root|node_awesome']
+
+        self.assertEqual(function('|root|node', paths), ['|root|node'])
+        self.assertEqual(function('*|node', paths), ['|root|node', '|root|child|node', '|node'])
+        self.assertEqual(function('*|node', paths, indices=True), [1, 2, 3])
+        self.assertEqual(function('|root|*', paths, indices=True), [1, 2, 4])
+        self.assertEqual(function('|root|.', paths, indices=True), [1, 4])
+        self.assertEqual(function('*|node', paths, workers=1), ['|root|node', '|root|child|node', '|node'])
+
+        self.assertRaises(ValueError, function, 'abc', paths)
+        self.assertRaises(ValueError, function, '*|node', paths, workers=0)
+
+    def testBnFilterFullPaths(self):
+        function = OpenMaya.MGlobal.bnFilterFullPaths
+        paths = ['|root', '|root|shape', '|root|shape->', '|root|shape->|curve', '|root|shape->|curve|curveShape']
+
+        self.assertEqual(function('*|*Shape', paths), [])
+        self.assertEqual(function('*->*|*Shape', paths), ['|root|shape->|curve|curveShape'])
+        self.assertEqual(function('+->*', paths, indices=True), [2, 3, 4])
+        self.assertEqual(function('+->', paths), ['|root|shape->'])
+        self.assertEqual(function('+->+', paths, indices=True), [3, 4])
+        self.assertEqual(function('->|curve', ['->|curve', '|curve'], matchRelative=True, indices=True), [0])
+
+        paths *= 100
+        for workers in (2, 3, 8):
+            self.assertEqual(function('*->*|*Shape', paths, workers=workers), function('*->*|*Shape', paths))
+            self.assertEqual(function('+->*', paths, indices=True, workers=workers), function('+->*', paths, indices=True))
+
+        pool = bana._pattern._workerPool._pool
+        self.assertIsNotNone(pool)
+        function('*->*|*Shape', paths, workers=8)
+        self.assertIs(bana._pattern._workerPool._pool, pool)
+        bana._pattern.closeWorkerPool()
+        self.assertIsNone(bana._pattern._workerPool._pool)
+        self.assertEqual(function('*->*|*Shape', paths, workers=2), function('*->*|*Shape', paths))
+
+        self.assertRaises(ValueError, function, 'abc', paths)
+
+    def testPatternMultiMatch(self):
+        patterns = ['*|node', '*|*node', '|root|*', '*|awesome:*', '|root|node']
+        match = bana._pattern.makeMultiMatchFunction(patterns, bana._pattern.CONTEXT_PATH)
+        self.assertEqual(match('|root|node'), ['*|node', '*|*node', '|root|*', '|root|node'])
+        self.assertEqual(match('|root|awesome_node'), ['*|*node', '|root|*'])
+        self.assertEqual(match('|awesome:light'), ['*|awesome:*'])
+        self.assertEqual(match('|other'), [])
+
+        patterns = ['*|node_%s' % (i,) for i in range(250)]
+        match = bana._pattern.makeMultiMatchFunction(patterns, bana._pattern.CONTEXT_PATH)
+        self.assertEqual(match('|root|node_0'), ['*|node_0'])
+        self.assertEqual(match('|root|node_123'), ['*|node_123'])
+        self.assertEqual(match('|root|node_249'), ['*|node_249'])
+
+        match = bana._pattern.makeMultiMatchFunction([], bana._pattern.CONTEXT_PATH)
+        self.assertEqual(match('|root|node'), [])
+
+        patterns = ['*|*|*|*Shape', '|root|*', '*|*|*|*Shape', '*|node']
+        match = bana._pattern.makeMultiMatchFunction(patterns, bana._pattern.CONTEXT_PATH)
+        self.assertEqual(match('|root|a|b|nodeShape'), ['*|*|*|*Shape', '|root|*', '*|*|*|*Shape'])
+        self.assertEqual(match('|a|nodeShape'), ['*|*|*|*Shape', '*|*|*|*Shape'])
+        self.assertEqual(match('|root|node'), ['|root|*', '*|node'])
+        self.assertEqual(match('|a|b|c|d|node'), ['*|node'])
+
+    def testPatternExtractLiterals(self):
+        function = bana._pattern.extractLiterals
+
+        self.assertEqual(function('|rig|node'), ('|rig|node', '|rig|node', ()))
+        self.assertEqual(function('|rig|*|*Shape'), ('|rig|', 'Shape', ()))
+        self.assertEqual(function('char_*:*_GEO'), ('char_', '_GEO', ()))
+        self.assertEqual(function('*|grp_*|*'), ('', '', ('grp_',)))
+        self.assertEqual(function('*|*:leaf'), ('', 'leaf', ()))
+        self.assertEqual(function('*->|leaf'), ('', '|leaf', ()))
+        self.assertEqual(function('|root:*'), ('|root', '', ()))
+        self.assertEqual(function('|:*|leaf'), ('|', 'leaf', ()))
+        self.assertEqual(function(':ns:*'), ('', '', ('ns',)))
+        self.assertEqual(function('*|a*b*c'), ('', 'c', ('a', 'b')))
+
+    def testPatternExtractRoot(self):
+        function = bana._pattern.extractRoot
+
+        self.assertEqual(function('|grp_main|geo|*'), '|grp_main|geo')
+        self.assertEqual(function('|grp_main|geo'), '|grp_main|geo')
+        self.assertEqual(function('|grp_main|geo*'), '|grp_main')
+        self.assertEqual(function('|grp_main|ns:*'), '|grp_main')
+        self.assertEqual(function('|grp_main|:*|geo'), '|grp_main')
+        self.assertEqual(function('|grp_main|geo->|*'), '|grp_main|geo')
+        self.assertEqual(function('|grp_main|geo->|curve'), '|grp_main|geo')
+        self.assertEqual(function('|grp_*|geo'), '')
+        self.assertEqual(function('*|geo'), '')
+        self.assertEqual(function('.|geo'), '')
+
+    def testPatternExtractLeaf(self):
+        function = bana._pattern.extractLeaf
+
+        self.assertEqual(function('|grp_main|geo'), 'geo')
+        self.assertEqual(function('|grp_main|geo*'), 'geo*')
+        self.assertEqual(function('*|ns:*Shape'), 'ns:*Shape')
+        self.assertEqual(function('|grp_main|:*'), ':*')
+        self.assertEqual(function('|grp_main|geo->|curve'), 'curve')
+        self.assertEqual(function('->|curve'), 'curve')
+        self.assertEqual(function('|grp_main|*'), '')
+        self.assertEqual(function('|grp_main|.'), '')
+        self.assertEqual(function('|grp_main|geo->'), '')
+        self.assertEqual(function('|grp_main|geo->*'), '')
+        self.assertEqual(function('*'), '')
+        self.assertEqual(function('->'), '')
+
+    def testPatternPrefixMatch(self):
+        function = bana._pattern.makePrefixMatchFunction
+
+        self.assertEqual(function('*|node'), (0, None))
+        self.assertEqual(function('|*|node'), (0, None))
+        self.assertEqual(function('->|node'), (0, None))
+
+        depth, match = function('|world|charA|*')
+        self.assertEqual(depth, 2)
+        self.assertTrue(match('|world'))
+        self.assertTrue(match('|world|charA'))
+        self.assertTrue(match('|world|charA|node'))
+        self.assertFalse(match('|other'))
+        self.assertFalse(match('|world|charB'))
+        self.assertTrue(match('|world|charB->|node'))
+
+        depth, match = function('.|char*|ns:*|+|*Shape')
+        self.assertEqual(depth, 3)
+        self.assertTrue(match('|world'))
+        self.assertTrue(match('|world|charA'))
+        self.assertFalse(match('|world|prop'))
+        self.assertTrue(match('|world|charA|ns:geo'))
+        self.assertFalse(match('|world|charA|geo'))
+
+        depth, match = function('|world|charA->|*')
+        self.assertEqual(depth, 2)
+        self.assertTrue(match('|world|charA'))
+        self.assertFalse(match('|world|charB'))
+
+    def testPatternSplitLevels(self):
+        function = bana._pattern.splitLevels
+
+        self.assertEqual(function('*|node'), [])
+        self.assertEqual(function('*:node', bana._pattern.CONTEXT_FULL_NAME), [])
+        self.assertEqual(function(':.:node', bana._pattern.CONTEXT_FULL_NAME), [])
+
+        levels = function('|world|char*|.|+|node->|*')
+        self.assertEqual([segment for segment, _ in levels], ['|world', None, None])
+        self.assertTrue(levels[0][1]('|world'))
+        self.assertTrue(levels[1][1]('|world|charA'))
+        self.assertFalse(levels[1][1]('|world|prop'))
+        self.assertTrue(levels[2][1]('|world|charA|ns:geo'))
+        self.assertFalse(levels[2][1]('|world|charA->|geo'))
+        self.assertIs(function('|world|char*|.|+|node->|*'), levels)
+
+        levels = function('rig:ns*:*_CTRL', bana._pattern.CONTEXT_FULL_NAME)
+        self.assertEqual([segment for segment, _ in levels], ['rig', None, None])
+        self.assertTrue(levels[1][1]('rig:ns1'))
+        self.assertFalse(levels[1][1]('rig:other'))
+        self.assertTrue(levels[2][1]('rig:ns1:arm_CTRL'))
+        self.assertFalse(levels[2][1]('rig:ns1:arm_JNT'))
+
+    def testPatternNormalize(self):
+        for pattern, expected in (('leaf', 'leaf'), ('*', '*'), ('**', '*'), ('*?', '*'), ('+*', '+'), ('?.', '.?'), ('..??+', '..+'), ('?*.', '+'), ('??', '??')):
+            self.assertEqual(bana._pattern.normalize(pattern, bana._pattern.CONTEXT_NAME), expected)
+
+        self.assertEqual(bana._pattern.normalize('|:*?:leaf|**->*+', bana._pattern.CONTEXT_FULL_PATH), '|:*:leaf|*->+')
+
+        bana._pattern.clearCache()
+        match = OpenMaya.MGlobal.bnMakeMatchPathFunction('*|node')
+        self.assertIs(OpenMaya.MGlobal.bnMakeMatchPathFunction('**|node'), match)
+        self.assertIs(OpenMaya.MGlobal.bnMakeMatchPathFunction('?*|node'), match)
+        self.assertIsNot(OpenMaya.MGlobal.bnMakeMatchPathFunction('+|node'), match)
+
+        patterns = ['*|node', '**|node', '|root|*', '*?|node']
+        match = bana._pattern.makeMultiMatchFunction(patterns, bana._pattern.CONTEXT_PATH)
+        self.assertEqual(match('|root|node'), patterns)
+        self.assertEqual(match('|other|node'), ['*|node', '**|node', '*?|node'])
+        self.assertEqual(match('|root|leaf'), ['|root|*'])
+        self.assertEqual(match('|other'), [])
+
+    def testPatternComplexity(self):
+        self.assertEqual(bana._pattern.measureComplexity('|root|node', bana._pattern.CONTEXT_PATH), 0)
+        self.assertEqual(bana._pattern.measureComplexity('*|*Shape*', bana._pattern.CONTEXT_PATH), 1)
+        self.assertEqual(bana._pattern.measureComplexity('*|*|*|*Shape', bana._pattern.CONTEXT_PATH), 3)
+        self.assertEqual(bana._pattern.measureComplexity('*->*|*->*|*Shape', bana._pattern.CONTEXT_FULL_PATH), 4)
+        self.assertEqual(bana._pattern.measureComplexity('*', bana._pattern.CONTEXT_NAME), 0)
+        self.assertEqual(bana._pattern.measureComplexity('*', bana._pattern.CONTEXT_FULL_NAME), 1)
+        self.assertEqual(bana._pattern.measureComplexity('|root|?|.', bana._pattern.CONTEXT_PATH), 0)
+        self.assertFalse(bana._pattern.isComplex('*->*|*Shape', bana._pattern.CONTEXT_FULL_PATH))
+        self.assertTrue(bana._pattern.isComplex('*|*|*|*Shape', bana._pattern.CONTEXT_PATH))
+
+        path = '|%s|ns:Shape' % ('|'.join(['node'] * 100),)
+        for deterministic in (None, False, True):
+            match = OpenMaya.MGlobal.bnMakeMatchPathFunction('*|*|*|*Shape', deterministic=deterministic)
+            self.assertFalse(match(path))
+            self.assertTrue(match('|root|node|leaf|nodeShape'))
+
+        bana._pattern.clearCache()
+        match = bana._pattern.makeMatchFunction('*|*|*|*Shape', bana._pattern.CONTEXT_PATH, budget=0.0)
+        self.assertRaises(RuntimeError, match, path)
+        match = bana._pattern.makeMatchFunction('*|*|*|*Shape', bana._pattern.CONTEXT_PATH, budget=60.0)
+        self.assertFalse(match(path))
+        self.assertTrue(match('|root|node|leaf|nodeShape'))
+
+    def testPatternExpressionCache(self):
+        directory = tempfile.mkdtemp()
+        fileName = os.path.join(directory, 'expressions.json')
+        try:
+            self.assertRaises(RuntimeError, bana._pattern.saveExpressionCache)
+
+            expression = bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH)
+            bana._pattern.setExpressionCacheFile(fileName)
+            self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH), expression)
+            self.assertEqual(bana._pattern.makeExpression('|root|node', bana._pattern.CONTEXT_PATH), r'^\|root\|node$')
+            bana._pattern.saveExpressionCache()
+            self.assertTrue(os.path.isfile(fileName))
+
+            with open(fileName, 'w') as f:
+                json.dump({'version': bana.__version__, 'expressions': [['*|node', bana._pattern.CONTEXT_PATH, False, 'cached']]}, f)
+
+            bana._pattern.setExpressionCacheFile(fileName)
+            self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH), 'cached')
+            self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH, matchRelative=True), bana._pattern._translate('*|node', bana._pattern.CONTEXT_PATH, True))
+
+            with open(fileName, 'w') as f:
+                json.dump({'version': '0.0.0', 'expressions': [['*|node', bana._pattern.CONTEXT_PATH, False, 'cached']]}, f)
+
+            bana._pattern.setExpressionCacheFile(fileName)
+            self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH), expression)
+
+            for data in ({'version': bana.__version__},
+                         {'version': bana.__version__, 'expressions': [['*|node', bana._pattern.CONTEXT_PATH, False, 'cached'], ['*|leaf']]},
+                         {'version': bana.__version__, 'expressions': [['*|node', bana._pattern.CONTEXT_PATH, False, 'cached'], [['*|leaf'], 0, False, 'cached']]}):
+                with open(fileName, 'w') as f:
+                    json.dump(data, f)
+
+                bana._pattern.setExpressionCacheFile(fileName)
+                self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH), expression)
+
+            with open(fileName, 'w') as f:
+                f.write('corrupted')
+
+            bana._pattern.setExpressionCacheFile(fileName)
+            self.assertEqual(bana._pattern.makeExpression('*|node', bana._pattern.CONTEXT_PATH), expression)
+        finally:
+            bana._pattern.setExpressionCacheFile(None)
+            shutil.rmtree(directory)
+
+    def testPatternCache(self):
+        bana._pattern.clearCache()
+        self.assertEqual(bana._pattern.getCacheInfo(), (0, 0, 0, 0, 256))
+
+        match1 = OpenMaya.MGlobal.bnMakeMatchFullPathFunction('*|node')
+        match2 = OpenMaya.MGlobal.bnMakeMatchFullPathFunction('*|node')
+        match3 = OpenMaya.MGlobal.bnMakeMatchFullPathFunction('*|node', matchRelative=True)
+        match4 = OpenMaya.MGlobal.bnMakeMatchPathFunction('*|node')
+        self.assertIs(match1, match2)
+        self.assertIsNot(match1, match3)
+        self.assertIsNot(match1, match4)
+        self.assertEqual(bana._pattern.getCacheInfo(), (1, 3, 0, 3, 256))
+
+        bana._pattern.setCacheMaxSize(2)
+        self.assertEqual(bana._pattern.getCacheInfo(), (1, 3, 1, 2, 2))
+        self.assertIsNot(OpenMaya.MGlobal.bnMakeMatchFullPathFunction('*|node'), match1)
+        self.assertEqual(bana._pattern.getCacheInfo(), (1, 4, 2, 2, 2))
+
+        bana._pattern.setCacheMaxSize(0)
+        self.assertEqual(bana._pattern.getCacheInfo(), (1, 4, 4, 0, 0))
+        OpenMaya.MGlobal.bnMakeMatchNameFunction('node*')
+        self.assertEqual(bana._pattern.getCacheInfo(), (1, 5, 4, 0, 0))
+
+        self.assertRaises(ValueError, bana._pattern.setCacheMaxSize, -1)
+
+        bana._pattern.setCacheMaxSize(256)
+        bana._pattern.clearCache()
+        self.assertEqual(bana._pattern.getCacheInfo(), (0, 0, 0, 0, 256))
+
+        match = OpenMaya.MGlobal.bnMakeMatchPathFunction('**|node')
+        self.assertIs(OpenMaya.MGlobal.bnMakeMatchPathFunction('**|node'), match)
+        self.assertIs(OpenMaya.MGlobal.bnMakeMatchPathFunction('*|node'), match)
+        self.assertEqual(bana._pattern.getCacheInfo(), (2, 2, 0, 2, 256))
+
+        bana._pattern.splitLevels('|world|char*|node')
+        self.assertEqual(bana._pattern.getCacheInfo(), (2, 2, 0, 2, 256))
+        bana._pattern.clearCache()
+
 
 if __name__ == '__main__':
     from tests.run import run
@@ -7,6 +7,11 @@ import unittest
 import maya.standalone
 from maya import OpenMaya
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
@@ -25,6 +30,23 @@ class MMatrixTest(unittest.TestCase):
         matrix = OpenMaya.MMatrix()
         self.assertEqual(matrix.bnGet(), [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
 
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        matrix = OpenMaya.MTransformationMatrix()
+        matrix.setTranslation(OpenMaya.MVector(1.0, 2.0, 3.0), OpenMaya.MSpace.kTransform)
+        matrix = matrix.asMatrix()
+        array = matrix.bnAsArray()
+        self.assertEqual(array.shape, (4, 4))
+        self.assertEqual(array.tolist(), matrix.bnGet())
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        array = numpy.arange(16.0).reshape(4, 4)
+        matrix = OpenMaya.MMatrix.bnFromArray(array)
+        self.assertEqual(matrix.bnGet(), array.tolist())
+        self.assertEqual(OpenMaya.MMatrix.bnFromArray(array.T).bnGet(), array.T.tolist())
+        self.assertRaises(ValueError, OpenMaya.MMatrix.bnFromArray, numpy.zeros(16))
+
 
 if __name__ == '__main__':
     from tests.run import run
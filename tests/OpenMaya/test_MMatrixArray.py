@@ -0,0 +1,47 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
+
+import bana
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class MMatrixArrayTest(unittest.TestCase):
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        matrices = OpenMaya.MMatrixArray()
+        matrices.append(OpenMaya.MMatrix())
+        matrices.append(OpenMaya.MMatrix.bnFromArray(numpy.arange(16.0).reshape(4, 4)))
+        self.assertEqual(matrices.bnAsArray().tolist(), [numpy.eye(4).tolist(), numpy.arange(16.0).reshape(4, 4).tolist()])
+        self.assertEqual(OpenMaya.MMatrixArray().bnAsArray().shape, (0, 4, 4))
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        array = numpy.arange(160.0).reshape(10, 4, 4)
+        matrices = OpenMaya.MMatrixArray.bnFromArray(array)
+        self.assertEqual(matrices.length(), 10)
+        self.assertEqual([matrices[i].bnGet() for i in range(matrices.length())], array.tolist())
+        self.assertEqual(OpenMaya.MMatrixArray.bnFromArray(array[:1]).bnAsArray().tolist(), array[:1].tolist())
+        self.assertEqual(OpenMaya.MMatrixArray.bnFromArray(numpy.zeros((0, 4, 4))).length(), 0)
+        self.assertRaises(ValueError, OpenMaya.MMatrixArray.bnFromArray, numpy.zeros((10, 16)))
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
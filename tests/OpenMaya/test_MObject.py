@@ -124,6 +124,24 @@ class MObjectTest(unittest.TestCase):
         self.assertIsInstance(obj, OpenMaya.MObject)
         self.assertEqual(OpenMaya.MFnDependencyNode(obj).name(), 'time1')
 
+    def testBnKey(self):
+        obj1 = OpenMaya.MObject.bnGet(pattern='awesome:light')
+        obj2 = OpenMaya.MObject.bnGet(pattern='awesome:light')
+        key = obj1.bnKey()
+        self.assertEqual(key, obj2.bnKey())
+        self.assertEqual(hash(key), hash(obj1))
+        self.assertNotEqual(key, OpenMaya.MObject.bnGet(pattern='child_1').bnKey())
+        self.assertEqual(len(set(obj.bnKey() for obj in OpenMaya.MObject.bnFind(pattern='*node'))), 4)
+        self.assertTrue(key.isValid())
+        self.assertEqual(key.object(), obj1)
+
+        other = obj2.bnKey()
+        cmds.delete('awesome:light')
+        self.assertFalse(key.isValid())
+        self.assertIsNone(key.object())
+        self.assertEqual(key, key)
+        self.assertNotEqual(key, other)
+
 
 if __name__ == '__main__':
     from tests.run import run
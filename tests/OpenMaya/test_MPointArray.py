@@ -0,0 +1,46 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
+
+import bana
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class MPointArrayTest(unittest.TestCase):
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        points = OpenMaya.MPointArray()
+        points.append(OpenMaya.MPoint(1.0, 2.0, 3.0))
+        points.append(OpenMaya.MPoint(4.0, 5.0, 6.0, 2.0))
+        self.assertEqual(points.bnAsArray().tolist(), [[1.0, 2.0, 3.0, 1.0], [4.0, 5.0, 6.0, 2.0]])
+        self.assertEqual(OpenMaya.MPointArray().bnAsArray().shape, (0, 4))
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        array = numpy.arange(40.0).reshape(10, 4)
+        points = OpenMaya.MPointArray.bnFromArray(array)
+        self.assertEqual(points.length(), 10)
+        self.assertEqual([points[i].bnGet() for i in range(points.length())], array.tolist())
+        self.assertEqual(OpenMaya.MPointArray.bnFromArray(numpy.zeros((0, 4))).length(), 0)
+        self.assertRaises(ValueError, OpenMaya.MPointArray.bnFromArray, numpy.zeros((10, 3)))
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
@@ -7,6 +7,11 @@ import unittest
 import maya.standalone
 from maya import OpenMaya
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
@@ -25,6 +30,17 @@ class MQuaternionTest(unittest.TestCase):
         quaternion = OpenMaya.MQuaternion(1.0, 2.0, 3.0, 4.0)
         self.assertEqual(quaternion.bnGet(), [1.0, 2.0, 3.0, 4.0])
 
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        quaternion = OpenMaya.MQuaternion(1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(quaternion.bnAsArray().tolist(), [1.0, 2.0, 3.0, 4.0])
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        quaternion = OpenMaya.MQuaternion.bnFromArray(numpy.array([1.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(quaternion.bnGet(), [1.0, 2.0, 3.0, 4.0])
+        self.assertRaises(ValueError, OpenMaya.MQuaternion.bnFromArray, numpy.zeros(5))
+
 
 if __name__ == '__main__':
     from tests.run import run
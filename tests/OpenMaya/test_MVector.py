@@ -7,6 +7,11 @@ import unittest
 import maya.standalone
 from maya import OpenMaya
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 _HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
 
@@ -34,6 +39,17 @@ class MVectorTest(unittest.TestCase):
         ])
         self.assertEqual([round(x, 6) for x in vector.bnGet()], [0.0, 0.0, 1.0])
 
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        vector = OpenMaya.MVector(1.0, 2.0, 3.0)
+        self.assertEqual(vector.bnAsArray().tolist(), [1.0, 2.0, 3.0])
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        vector = OpenMaya.MVector.bnFromArray(numpy.array([1.0, 2.0, 3.0]))
+        self.assertEqual(vector.bnGet(), [1.0, 2.0, 3.0])
+        self.assertRaises(ValueError, OpenMaya.MVector.bnFromArray, numpy.zeros(4))
+
 
 if __name__ == '__main__':
     from tests.run import run
@@ -0,0 +1,46 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, *((os.pardir,) * 2))))
+
+import bana
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class MVectorArrayTest(unittest.TestCase):
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnAsArray(self):
+        vectors = OpenMaya.MVectorArray()
+        vectors.append(OpenMaya.MVector(1.0, 2.0, 3.0))
+        vectors.append(OpenMaya.MVector(4.0, 5.0, 6.0))
+        self.assertEqual(vectors.bnAsArray().tolist(), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assertEqual(OpenMaya.MVectorArray().bnAsArray().shape, (0, 3))
+
+    @unittest.skipIf(numpy is None, "NumPy is not available.")
+    def testBnFromArray(self):
+        array = numpy.arange(30.0).reshape(10, 3)
+        vectors = OpenMaya.MVectorArray.bnFromArray(array)
+        self.assertEqual(vectors.length(), 10)
+        self.assertEqual([vectors[i].bnGet() for i in range(vectors.length())], array.tolist())
+        self.assertEqual(OpenMaya.MVectorArray.bnFromArray(numpy.zeros((0, 3))).length(), 0)
+        self.assertRaises(ValueError, OpenMaya.MVectorArray.bnFromArray, numpy.zeros((10, 4)))
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
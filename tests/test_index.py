@@ -0,0 +1,169 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya, cmds
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana
+import bana.index
+
+import tests._util
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+def _findPaths(*args, **kwargs):
+    return sorted(dagPath.fullPathName()
+                  for dagPath in OpenMaya.MDagPath.bnFind(*args, **kwargs))
+
+
+def _findNames(*args, **kwargs):
+    return sorted(OpenMaya.MFnDependencyNode(obj).name()
+                  for obj in OpenMaya.MObject.bnFind(*args, **kwargs))
+
+
+class IndexTest(unittest.TestCase):
+
+    def setUp(self):
+        OpenMaya.MFileIO.newFile(True)
+        context = tests._util.Context()
+
+        master = tests._util.createTransform(context, name='master')
+
+        tests._util.createTransform(context, name='node', parent=master)
+        tests._util.createTransform(context, name='n0de', parent=master)
+
+        root1 = tests._util.createTransform(context, name='root_1', parent=master)
+        child1 = tests._util.createTransform(context, name='child_1', parent=root1)
+        tests._util.createTransform(context, name='node', parent=child1)
+
+        root2 = tests._util.createTransform(context, name='root_2', parent=master)
+        child2 = tests._util.createTransform(context, name='child_2', parent=root2)
+        tests._util.createTransform(context, name='node', parent=child2)
+
+        tests._util.createPolyCube(context, name='cube', parent=master)
+        sphere, sphereShape = tests._util.createNurbsSphere(context, name='sphere', parent=master)
+        circle, circleShape = tests._util.createNurbsCircle(context, name='circle', parent=master)
+
+        context.dag.doIt()
+        context.dg.doIt()
+
+        cmds.projectCurve(circleShape.fullPathName(), sphereShape.fullPathName())
+
+        bana.index.enable()
+
+    def tearDown(self):
+        bana.index.disable()
+
+    def assertConsistent(self, pattern=None):
+        objs = _findNames(pattern=pattern)
+        paths = _findPaths(pattern=pattern)
+        shapes = _findPaths(pattern=pattern, fnType=OpenMaya.MFn.kShape,
+                            traverseUnderWorld=False)
+        bana.index.disable()
+        try:
+            self.assertEqual(objs, _findNames(pattern=pattern))
+            self.assertEqual(paths, _findPaths(pattern=pattern))
+            self.assertEqual(shapes, _findPaths(
+                pattern=pattern, fnType=OpenMaya.MFn.kShape,
+                traverseUnderWorld=False))
+        finally:
+            bana.index.enable()
+
+    def testEnable(self):
+        self.assertTrue(bana.index.isEnabled())
+        bana.index.enable()
+        self.assertTrue(bana.index.isEnabled())
+        bana.index.disable()
+        self.assertFalse(bana.index.isEnabled())
+        bana.index.disable()
+        self.assertFalse(bana.index.isEnabled())
+        self.assertRaises(RuntimeError, bana.index.update)
+        self.assertRaises(RuntimeError, bana.index.findObjects)
+        self.assertRaises(RuntimeError, bana.index.findDagPaths)
+
+    def testFindObjects(self):
+        self.assertEqual(_findNames(pattern='node'), ['node', 'node', 'node'])
+        self.assertEqual(_findNames(pattern='child_*'), ['child_1', 'child_2'])
+        self.assertEqual(_findNames(pattern='missing'), [])
+        self.assertEqual(_findNames(pattern='*', fnType=OpenMaya.MFn.kMesh), ['cubeShape'])
+        self.assertRaises(ValueError, _findNames, pattern='|node')
+        for pattern in (None, 'node', '*node', 'default*Set', 'time1'):
+            self.assertConsistent(pattern=pattern)
+
+    def testFindDagPaths(self):
+        self.assertEqual(_findPaths(pattern='|master|root_1|child_1|node'), ['|master|root_1|child_1|node'])
+        self.assertEqual(_findPaths(pattern='|master|root_*|*'), ['|master|root_1|child_1', '|master|root_1|child_1|node', '|master|root_2|child_2', '|master|root_2|child_2|node'])
+        self.assertEqual(_findPaths(pattern='|master|root_3'), [])
+        self.assertEqual(_findPaths(recursive=False), ['|front', '|master', '|persp', '|side', '|top'])
+        self.assertRaises(ValueError, _findPaths, pattern='*->*', traverseUnderWorld=False)
+        self.assertEqual(_findPaths(pattern='|master|*', maxDepth=2), ['|master|circle', '|master|cube', '|master|n0de', '|master|node', '|master|root_1', '|master|root_2', '|master|sphere'])
+        self.assertEqual([dagPath.fullPathName() for dagPath in OpenMaya.MDagPath.bnFind(pattern='*|node', order=OpenMaya.MItDag.kBreadthFirst)], ['|master|node', '|master|root_1|child_1|node', '|master|root_2|child_2|node'])
+        for pattern in (None, '*', '*|*node', '|master|*', '*|node', '*->*'):
+            self.assertConsistent(pattern=pattern)
+
+        dagPath = OpenMaya.MDagPath.bnGet(pattern='|master|n0de')
+        dagPath.pop()
+        self.assertEqual(_findPaths(pattern='|master|n0de'), ['|master|n0de'])
+
+    def testFindByType(self):
+        self.assertEqual(_findNames(fnType=OpenMaya.MFn.kMesh), ['cubeShape'])
+        self.assertEqual(_findNames(pattern='*Shape', fnType=OpenMaya.MFn.kShape), ['circleShape', 'cubeShape', 'sphereShape'])
+        self.assertEqual(_findNames(pattern='sphere', fnType=OpenMaya.MFn.kShape), [])
+        self.assertEqual(_findPaths(pattern='|master|*', fnType=OpenMaya.MFn.kTransform, traverseUnderWorld=False), ['|master|circle', '|master|cube', '|master|n0de', '|master|node', '|master|root_1', '|master|root_2', '|master|sphere'])
+        self.assertEqual(_findPaths(pattern='|master|cube|cubeShape', fnType=OpenMaya.MFn.kTransform), [])
+
+        cmds.polyCube(name='cube2')
+        cmds.delete('|master|cube')
+        self.assertEqual(_findNames(fnType=OpenMaya.MFn.kMesh), ['cube2Shape'])
+        self.assertEqual(_findPaths(fnType=OpenMaya.MFn.kMesh), ['|cube2|cube2Shape'])
+        for fnType in (OpenMaya.MFn.kDagNode, OpenMaya.MFn.kTransform, OpenMaya.MFn.kShape, OpenMaya.MFn.kMesh):
+            objs = sorted(OpenMaya.MObjectHandle(obj).hashCode() for obj in OpenMaya.MObject.bnFind(fnType=fnType))
+            bana.index.disable()
+            self.assertEqual(objs, sorted(OpenMaya.MObjectHandle(obj).hashCode() for obj in OpenMaya.MObject.bnFind(fnType=fnType)))
+            bana.index.enable()
+
+    def testRename(self):
+        cmds.rename('|master|root_1', 'root_3')
+        self.assertEqual(_findPaths(pattern='|master|root_1|*'), [])
+        self.assertEqual(_findPaths(pattern='|master|root_3|*'), ['|master|root_3|child_1'])
+        self.assertEqual(_findNames(pattern='root_*'), ['root_2', 'root_3'])
+        self.assertConsistent()
+
+    def testReparent(self):
+        cmds.parent('|master|root_1|child_1', '|master|root_2')
+        self.assertEqual(_findPaths(pattern='|master|root_1|*'), [])
+        self.assertEqual(_findPaths(pattern='|master|root_2|*|node'), ['|master|root_2|child_1|node', '|master|root_2|child_2|node'])
+        self.assertConsistent()
+
+        cmds.parent('|master|root_2|child_1', world=True)
+        self.assertEqual(_findPaths(pattern='|child_1|node'), ['|child_1|node'])
+        self.assertConsistent()
+
+    def testInstance(self):
+        cmds.instance('|master|root_1|child_1', name='instance')
+        self.assertEqual(_findPaths(pattern='*|node'), ['|instance|node', '|master|node', '|master|root_1|child_1|node', '|master|root_2|child_2|node'])
+        self.assertConsistent()
+
+    def testDelete(self):
+        cmds.delete('|master|root_2')
+        self.assertEqual(_findPaths(pattern='|master|root_*'), ['|master|root_1'])
+        self.assertEqual(_findNames(pattern='child_*'), ['child_1'])
+        self.assertConsistent()
+
+    def testNewFile(self):
+        OpenMaya.MFileIO.newFile(True)
+        self.assertEqual(_findPaths(pattern='|master'), [])
+        self.assertConsistent()
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
@@ -0,0 +1,82 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya, cmds
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana
+import bana._iterator
+
+import tests._util
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class IteratorTest(unittest.TestCase):
+
+    def setUp(self):
+        OpenMaya.MFileIO.newFile(True)
+        context = tests._util.Context()
+
+        master = tests._util.createTransform(context, name='master')
+
+        root1 = tests._util.createTransform(context, name='root_1', parent=master)
+        child1 = tests._util.createTransform(context, name='child_1', parent=root1)
+        tests._util.createTransform(context, name='node', parent=child1)
+
+        root2 = tests._util.createTransform(context, name='root_2', parent=master)
+        tests._util.createTransform(context, name='child_2', parent=root2)
+
+        sphere, sphereShape = tests._util.createNurbsSphere(context, name='sphere', parent=master)
+        circle, circleShape = tests._util.createNurbsCircle(context, name='circle', parent=master)
+
+        context.dag.doIt()
+        context.dg.doIt()
+
+        cmds.projectCurve(circleShape.fullPathName(), sphereShape.fullPathName())
+        cmds.instance('|master|root_1|child_1', name='instance')
+        cmds.parent('|instance', '|master|root_2|child_2')
+
+    def assertFullPathNames(self, **kwargs):
+        count = 0
+        for dagPath, fullPathName in bana._iterator.dag(fullPathNames=True, **kwargs):
+            self.assertEqual(fullPathName, dagPath.fullPathName())
+            count += 1
+
+        self.assertEqual(count, len(list(bana._iterator.dag(**kwargs))))
+
+    def testDagFullPathNames(self):
+        root = OpenMaya.MDagPath.bnGet(pattern='|master')
+        for kwargs in ({}, {'root': root}, {'root': root, 'skipRoot': True}):
+            for traverseUnderWorld in (True, False):
+                for order in (OpenMaya.MItDag.kDepthFirst, OpenMaya.MItDag.kBreadthFirst):
+                    self.assertFullPathNames(traverseUnderWorld=traverseUnderWorld, order=order, **kwargs)
+                    self.assertFullPathNames(traverseUnderWorld=traverseUnderWorld, order=order, maxDepth=2, **kwargs)
+                    self.assertFullPathNames(fnType=OpenMaya.MFn.kTransform, traverseUnderWorld=traverseUnderWorld, order=order, **kwargs)
+
+    def testDagFullPathNamesPrune(self):
+        fullPathNames = []
+
+        def prune(fullPathName):
+            fullPathNames.append(fullPathName)
+            return fullPathName.startswith('|master|root_1')
+
+        iterator = bana._iterator.dag(traverseUnderWorld=True, prune=prune, pruneDepth=2, fullPathNames=True)
+        paths = [fullPathName for _, fullPathName in iterator]
+        self.assertIn('|master|root_2|child_2|instance|node', paths)
+        self.assertNotIn('|master|root_1', paths)
+        self.assertNotIn('|master|root_1|child_1', paths)
+        self.assertIn('|master|root_1', fullPathNames)
+        self.assertTrue(all(path.count('|') <= 2 for path in fullPathNames))
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
@@ -0,0 +1,96 @@
+#!/usr/bin/env mayapy
+
+import os
+import sys
+import unittest
+
+import maya.standalone
+from maya import OpenMaya, cmds
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana
+import bana.registry
+
+import tests._util
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+class RegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        OpenMaya.MFileIO.newFile(True)
+        context = tests._util.Context()
+
+        master = tests._util.createTransform(context, name='master')
+        tests._util.createTransform(context, name='node', parent=master)
+        sphere, sphereShape = tests._util.createNurbsSphere(context, name='sphere', parent=master)
+        tests._util.createTransform(context, name='other', parent=master)
+
+        context.dag.doIt()
+        context.dg.doIt()
+
+        cmds.parent('|master|sphere|sphereShape', '|master|other', addObject=True, shape=True)
+
+    def tearDown(self):
+        bana.registry.clear()
+
+    def testRegister(self):
+        obj = OpenMaya.MObject.bnGet(pattern='node')
+        nodeId = bana.registry.register(obj)
+        self.assertEqual(bana.registry.register(OpenMaya.MObject.bnGet(pattern='node')), nodeId)
+        self.assertEqual(bana.registry.register(OpenMaya.MFnDependencyNode(obj)), nodeId)
+        self.assertNotEqual(bana.registry.register(OpenMaya.MObject.bnGet(pattern='master')), nodeId)
+        self.assertTrue(bana.registry.isValid(nodeId))
+        self.assertEqual(bana.registry.getObject(nodeId), obj)
+        self.assertEqual(bana.registry.getDagPath(nodeId).fullPathName(), '|master|node')
+
+        dagPaths = sorted(OpenMaya.MDagPath.bnFind(pattern='*|sphereShape'), key=str)
+        nodeIds = bana.registry.registerMany(dagPaths)
+        self.assertEqual(len(set(nodeIds)), 2)
+        self.assertNotIn(nodeId, nodeIds)
+        self.assertEqual([str(dagPath) for dagPath in bana.registry.resolveDagPaths(nodeIds)], ['|master|other|sphereShape', '|master|sphere|sphereShape'])
+        self.assertEqual(bana.registry.resolveObjects(nodeIds), [dagPaths[0].node()] * 2)
+
+        nodeId = bana.registry.register(OpenMaya.MObject.bnGet(pattern='makeNurbSphere*'))
+        self.assertIsNone(bana.registry.getDagPath(nodeId))
+
+    def testDelete(self):
+        nodeIds = bana.registry.registerMany(OpenMaya.MObject.bnGet(pattern=name) for name in ('master', 'node'))
+        cmds.delete('|master|node')
+        self.assertEqual([bana.registry.isValid(nodeId) for nodeId in nodeIds], [True, False])
+        self.assertIsNone(bana.registry.getObject(nodeIds[1]))
+        self.assertIsNone(bana.registry.getDagPath(nodeIds[1]))
+        self.assertEqual(bana.registry.resolveObjects(nodeIds), [OpenMaya.MObject.bnGet(pattern='master'), None])
+
+        cmds.createNode('transform', name='node')
+        nodeId = bana.registry.register(OpenMaya.MObject.bnGet(pattern='node'))
+        self.assertNotIn(nodeId, nodeIds)
+
+    def testReparent(self):
+        dagPath = OpenMaya.MDagPath.bnGet(pattern='|master|node')
+        nodeIds = bana.registry.registerMany([dagPath, dagPath.node()])
+        cmds.parent('|master|node', '|master|other')
+        self.assertEqual([bana.registry.isValid(nodeId) for nodeId in nodeIds], [False, True])
+        self.assertIsNone(bana.registry.getObject(nodeIds[0]))
+        self.assertIsNone(bana.registry.getDagPath(nodeIds[0]))
+        self.assertEqual(bana.registry.getDagPath(nodeIds[1]).fullPathName(), '|master|other|node')
+
+        nodeId = bana.registry.register(OpenMaya.MDagPath.bnGet(pattern='|master|other|node'))
+        self.assertNotIn(nodeId, nodeIds)
+        self.assertEqual(bana.registry.getDagPath(nodeId).fullPathName(), '|master|other|node')
+
+    def testClear(self):
+        nodeId = bana.registry.register(OpenMaya.MObject.bnGet(pattern='node'))
+        bana.registry.clear()
+        self.assertRaises(ValueError, bana.registry.isValid, nodeId)
+        self.assertRaises(ValueError, bana.registry.getObject, -1)
+        self.assertNotEqual(bana.registry.register(OpenMaya.MObject.bnGet(pattern='node')), nodeId)
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
@@ -0,0 +1,112 @@
+#!/usr/bin/env mayapy
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import maya.standalone
+from maya import OpenMaya, cmds
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana
+import bana.snapshot
+
+import tests._util
+
+bana.initialize()
+maya.standalone.initialize()
+
+
+def _findPaths(*args, **kwargs):
+    return sorted(dagPath.fullPathName()
+                  for dagPath in OpenMaya.MDagPath.bnFind(*args, **kwargs))
+
+
+def _findNames(*args, **kwargs):
+    return sorted(OpenMaya.MFnDependencyNode(obj).name()
+                  for obj in OpenMaya.MObject.bnFind(*args, **kwargs))
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        OpenMaya.MFileIO.newFile(True)
+        context = tests._util.Context()
+
+        master = tests._util.createTransform(context, name='master')
+
+        tests._util.createTransform(context, name='node', parent=master)
+
+        root1 = tests._util.createTransform(context, name='root_1', parent=master)
+        child1 = tests._util.createTransform(context, name='child_1', parent=root1)
+        tests._util.createTransform(context, name='node', parent=child1)
+
+        tests._util.createPolyCube(context, name='cube', parent=master)
+        sphere, sphereShape = tests._util.createNurbsSphere(context, name='sphere', parent=master)
+        circle, circleShape = tests._util.createNurbsCircle(context, name='circle', parent=master)
+
+        context.dag.doIt()
+        context.dg.doIt()
+
+        cmds.projectCurve(circleShape.fullPathName(), sphereShape.fullPathName())
+
+        self.directory = tempfile.mkdtemp()
+        self.fileName = os.path.join(self.directory, 'scene.snapshot')
+        bana.snapshot.save(self.fileName)
+        self.snapshot = bana.snapshot.load(self.fileName)
+
+    def tearDown(self):
+        self.snapshot.close()
+        shutil.rmtree(self.directory)
+
+    def testFindNames(self):
+        snapshot = self.snapshot
+        self.assertEqual(sorted(snapshot.findNames(pattern='node')), ['node', 'node'])
+        self.assertEqual(sorted(snapshot.findNames(pattern='*Shape', nodeType='shape')), ['circleShape', 'cubeShape', 'sphereShape'])
+        self.assertEqual(snapshot.findNames(nodeType='mesh'), ['cubeShape'])
+        self.assertRaises(ValueError, snapshot.findNames, pattern='|node')
+        for pattern in (None, 'node', '*node', 'default*Set', 'time1'):
+            self.assertEqual(sorted(snapshot.findNames(pattern=pattern)), _findNames(pattern=pattern))
+
+    def testFindPaths(self):
+        snapshot = self.snapshot
+        self.assertEqual(snapshot.findPaths(pattern='*|node'), ['|master|node', '|master|root_1|child_1|node'])
+        self.assertEqual(sorted(snapshot.findPaths(recursive=False)), ['|front', '|master', '|persp', '|side', '|top'])
+        self.assertEqual(snapshot.findPaths(pattern='|master|*', maxDepth=2, nodeType='transform'), ['|master|node', '|master|root_1', '|master|cube', '|master|sphere', '|master|circle'])
+        self.assertRaises(ValueError, snapshot.findPaths, pattern='*->*', traverseUnderWorld=False)
+        for pattern in (None, '*', '*|*node', '|master|*', '*|node', '*->*', '*|*|*|*node'):
+            self.assertEqual(sorted(snapshot.findPaths(pattern=pattern)), _findPaths(pattern=pattern))
+            self.assertEqual(sorted(snapshot.findPaths(pattern=pattern, nodeType='shape')), _findPaths(pattern=pattern, fnType=OpenMaya.MFn.kShape))
+
+        for pattern in (None, '*', '|master|*'):
+            self.assertEqual(sorted(snapshot.findPaths(pattern=pattern, traverseUnderWorld=False)), _findPaths(pattern=pattern, traverseUnderWorld=False))
+
+    def testGetParent(self):
+        snapshot = self.snapshot
+        self.assertEqual(snapshot.getParent('|master|root_1|child_1'), '|master|root_1')
+        self.assertIsNone(snapshot.getParent('|master'))
+        self.assertIsNone(snapshot.getParent('|missing'))
+        self.assertRaises(ValueError, snapshot.getParent, 'master')
+        for path in snapshot.findPaths(pattern='*->*'):
+            self.assertTrue(path.startswith(snapshot.getParent(path)))
+
+    def testLoad(self):
+        fileName = os.path.join(self.directory, 'invalid')
+        with open(fileName, 'w') as f:
+            f.write('|master\n')
+
+        self.assertRaises(ValueError, bana.snapshot.load, fileName)
+
+        self.snapshot.close()
+        self.assertRaises(ValueError, self.snapshot.findNames)
+        with bana.snapshot.load(self.fileName) as snapshot:
+            self.assertEqual(snapshot.findPaths(pattern='|master'), ['|master'])
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')
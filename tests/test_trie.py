@@ -0,0 +1,75 @@
+#!/usr/bin/env mayapy
+
+import os
+import re
+import sys
+import unittest
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_HERE, os.pardir)))
+
+import bana._pattern
+import bana._trie
+
+
+_SPLIT_OBJ = re.compile(r'\|[^|]*')
+
+
+class TrieTest(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = bana._trie.Trie(_SPLIT_OBJ.findall)
+        self.paths = [
+            '|master',
+            '|master|node',
+            '|master|root_1',
+            '|master|root_1|child_1',
+            '|master|root_1|child_1|node',
+            '|master|root_2',
+            '|master|root_2|child_2',
+            '|master|root_2|child_2|node',
+            '|other',
+        ]
+        for path in self.paths:
+            self.trie.add(path)
+
+    def testAdd(self):
+        self.assertEqual(len(self.trie), 9)
+        self.assertEqual(sorted(self.trie.walk()), self.paths)
+        self.trie.add('|master')
+        self.assertEqual(len(self.trie), 9)
+        self.trie.add('|new|path')
+        self.assertEqual(len(self.trie), 10)
+        self.assertIn('|new|path', self.trie)
+        self.assertNotIn('|new', self.trie)
+        self.assertNotIn('|master|root_3', self.trie)
+
+    def testRemove(self):
+        self.trie.remove('|master|root_1')
+        self.assertNotIn('|master|root_1', self.trie)
+        self.assertIn('|master|root_1|child_1', self.trie)
+        self.trie.remove('|master|root_1|child_1|node')
+        self.trie.remove('|master|root_1|child_1')
+        self.assertEqual(len(self.trie), 6)
+        self.assertEqual(sorted(self.trie.walk()), [path for path in self.paths if '|root_1' not in path])
+        self.assertRaises(KeyError, self.trie.remove, '|master|root_1')
+        self.assertRaises(KeyError, self.trie.remove, '|missing')
+        self.trie.clear()
+        self.assertEqual(len(self.trie), 0)
+        self.assertEqual(list(self.trie.walk()), [])
+
+    def testWalk(self):
+        def walk(pattern):
+            levels = bana._pattern.splitLevels(pattern)
+            return sorted(self.trie.walk(levels))
+
+        self.assertEqual(walk('|master|*'), self.paths[:-1])
+        self.assertEqual(walk('|master|root_*|*'), ['|master|root_1', '|master|root_1|child_1', '|master|root_1|child_1|node', '|master|root_2', '|master|root_2|child_2', '|master|root_2|child_2|node'])
+        self.assertEqual(walk('|master|.|child_2|*'), ['|master|root_2|child_2', '|master|root_2|child_2|node'])
+        self.assertEqual(walk('|missing|*'), [])
+        self.assertEqual(walk('*|node'), self.paths)
+
+
+if __name__ == '__main__':
+    from tests.run import run
+    run('__main__')